@@ -1,57 +1,503 @@
 import time
 import math
+from bisect import bisect_right
+import numpy as np
 
-def naive_no_filter(X):
-    P = []
-    comparison_count = 0
+BLOCK_ELEMENTS = 1 << 22
+SORT_FILTER_BATCH = 256
+
+def as_matrix(X):
+    points = np.asarray(X, dtype=float)
+    if points.ndim != 2:
+        points = points.reshape(len(points), -1 if len(points) else 0)
+    return points
+
+def direction_signs(directions, d):
+    """
+    Wektor znaków kryteriów: 1 dla "Min", -1 dla "Max" (przyjmowane są też
+    liczby, liczy się ich znak). Brak kierunków oznacza minimalizację wszystkich.
+    """
+    if directions is None:
+        return np.ones(d)
+    signs = []
+    for x in directions:
+        if isinstance(x, str):
+            signs.append(-1.0 if x.lower() == "max" else 1.0)
+        else:
+            signs.append(-1.0 if x < 0 else 1.0)
+    signs = np.array(signs)
+    if len(signs) != d:
+        raise ValueError(f"Liczba kierunków ({len(signs)}) różni się od liczby kryteriów ({d})")
+    return signs
+
+def first_dominators(points, after_self, signs=None):
+    """
+    Dla każdego punktu i indeks pierwszego punktu j (j != i), który go słabo
+    dominuje (points[j] <= points[i] na kryteriach minimalizowanych i >= na
+    maksymalizowanych, wg signs), albo n, gdy takiego nie ma. Kierunek zmienia
+    tylko operator porównania, więc macierz punktów nie jest kopiowana.
+    Przy after_self szukane są tylko j > i.
+    Punkty j są przeglądane blokami w kolejności indeksów, a każdy blok jest
+    porównywany naraz ze wszystkimi jeszcze nierozstrzygniętymi punktami;
+    punkt ze znalezionym dominatorem wypada ze zbioru aktywnych. Rozmiar bloku
+    rośnie, gdy aktywnych ubywa, więc macierz porównań ma stały rozmiar.
+    """
+    n, d = points.shape
+    maximize = np.zeros(d, dtype=bool) if signs is None else signs < 0
+    first = np.full(n, n, dtype=np.int64)
+    active = np.arange(n)
+    start = 0
+    while start < n and len(active):
+        if after_self:
+            # j < min(active) nie dominuje żadnego aktywnego punktu
+            start = max(start, active[0])
+            earlier = np.searchsorted(active, start)
+            step = min(BLOCK_ELEMENTS // (max(earlier, 1) * max(d, 1)), math.isqrt(BLOCK_ELEMENTS // max(d, 1)))
+        else:
+            step = BLOCK_ELEMENTS // (len(active) * max(d, 1))
+        stop = min(n, start + max(1, step))
+        count = np.searchsorted(active, stop) if after_self else len(active)
+        waiting, pending = active[:count], active[count:]
+        block = points[start:stop]
+        candidates = points[waiting]
+        dominated = np.ones((len(waiting), stop - start), dtype=bool)
+        for k in range(d):
+            if maximize[k]:
+                dominated &= block[:, k] >= candidates[:, k, None]
+            else:
+                dominated &= block[:, k] <= candidates[:, k, None]
+        j = np.arange(start, stop)
+        if after_self:
+            dominated &= j > waiting[:, None]
+        else:
+            dominated &= j != waiting[:, None]
+        found = dominated.any(axis=1)
+        first[waiting[found]] = start + dominated[found].argmax(axis=1)
+        active = np.concatenate((waiting[~found], pending))
+        start = stop
+    return first
+
+def naive_no_filter(X, directions=None):
+    """
+    Punkt jest niezdominowany, gdy żaden inny punkt go słabo nie dominuje.
+    comparison_count to liczba par (i, j) sprawdzonych przez pętlę, która
+    dla każdego i przegląda j od 0 do pierwszego dominatora włącznie.
+    """
     start_time = time.time()
-    for i in range(len(X)):
-        Y = X[i]
-        dominated = False
-        for j in range(len(X)):
-            comparison_count += 1
-            if i != j and all(X[j][k] <= Y[k] for k in range(len(Y))):
-                dominated = True
-                break
-        if not dominated:
-            P.append(Y)
+    points = as_matrix(X)
+    n = len(points)
+    first = first_dominators(points, False, direction_signs(directions, points.shape[1]))
+    kept = first == n
+    P = [X[i] for i in np.flatnonzero(kept)]
+    comparison_count = int(np.where(kept, n, first + 1).sum())
     exec_time = time.time() - start_time
     return P, exec_time, comparison_count
 
-def naive_with_filter(X):
-    P = []
-    comparison_count = 0
+def naive_with_filter(X, directions=None):
+    """
+    Jak naive_no_filter, ale punkt i jest porównywany tylko z punktami j > i.
+    """
     start_time = time.time()
-    i = 0
-    while i < len(X):
-        Y = X[i]
-        dominated = False
-        j = i + 1
-        while j < len(X):
-            comparison_count += 1
-            if all(X[j][k] <= Y[k] for k in range(len(Y))):
-                dominated = True
-                break
-            elif all(Y[k] <= X[j][k] for k in range(len(Y))):
-                j += 1
+    points = as_matrix(X)
+    n = len(points)
+    first = first_dominators(points, True, direction_signs(directions, points.shape[1]))
+    kept = first == n
+    index = np.arange(n)
+    P = [X[i] for i in np.flatnonzero(kept)]
+    comparison_count = int(np.where(kept, n - 1 - index, first - index).sum())
+    exec_time = time.time() - start_time
+    return P, exec_time, comparison_count
+
+
+def lexicographic_order(points, signs):
+    """
+    Kolejność leksykograficzna wierszy po współrzędnych pomnożonych przez signs,
+    jako kolejne stabilne sortowania od ostatniej kolumny - pamięć pomocnicza
+    to pojedyncze kolumny, nie kopia całej macierzy.
+    """
+    order = np.arange(len(points))
+    for k in range(points.shape[1] - 1, -1, -1):
+        order = order[np.argsort(points[order, k] * signs[k], kind="stable")]
+    return order
+
+def dominated_by(front, points, signs=None, strict=False):
+    """
+    Maska punktów points słabo zdominowanych przez któryś punkt frontu,
+    liczona blokami frontu tak, by macierz porównań miała najwyżej
+    BLOCK_ELEMENTS elementów. Przy strict punkt równy punktowi frontu
+    nie jest uznawany za zdominowany.
+    """
+    d = points.shape[1]
+    maximize = np.zeros(d, dtype=bool) if signs is None else signs < 0
+    step = max(1, BLOCK_ELEMENTS // (max(len(points), 1) * max(d, 1)))
+    dominated = np.zeros(len(points), dtype=bool)
+    for start in range(0, len(front), step):
+        block = front[start:start + step]
+        covered = np.ones((len(points), len(block)), dtype=bool)
+        better = np.zeros((len(points), len(block)), dtype=bool)
+        for k in range(d):
+            if maximize[k]:
+                covered &= block[:, k] >= points[:, k, None]
             else:
-                j += 1
-        if not dominated:
-            P.append(Y)
-        i += 1
+                covered &= block[:, k] <= points[:, k, None]
+            if strict:
+                better |= block[:, k] != points[:, k, None]
+        if strict:
+            covered &= better
+        dominated |= covered.any(axis=1)
+    return dominated
+
+def sort_and_filter(X, directions=None):
+    """
+    Sortowanie po sumie współrzędnych (z kierunkami), a przy równej sumie
+    leksykograficznie: punkt słabo dominujący inny i od niego różny ma
+    mniejszą sumę albo przy równej sumie jest mniejszy leksykograficznie,
+    więc żaden późniejszy punkt nie dominuje wcześniejszego. Wystarczy więc
+    porównać każdy punkt z dotychczasowym frontem, który nigdy nie maleje:
+    O(n log n + n |P|). Punkty idą porcjami - porcja jest porównywana naraz
+    z frontem i wewnątrz siebie (z punktami wcześniejszymi w kolejności).
+    Powtórzone punkty odpadają wszystkie, jak w naive_no_filter; wynik jest
+    w kolejności X.
+    """
+    start_time = time.time()
+    points = as_matrix(X)
+    n, d = points.shape
+    signs = direction_signs(directions, d)
+    maximize = signs < 0
+    order = lexicographic_order(points, signs)
+    total = np.zeros(n)
+    for k in range(d):
+        total += points[order, k] * signs[k]
+    order = order[np.argsort(total, kind="stable")]
+    comparison_count = 0
+    front = np.empty((0, d))
+    front_rows = []
+    for first in range(0, n, SORT_FILTER_BATCH):
+        rows = order[first:first + SORT_FILTER_BATCH]
+        batch = points[rows]
+        comparison_count += len(front) * len(rows)
+        survivors = np.flatnonzero(~dominated_by(front, batch, signs))
+        # punkt zdominowany przez odrzucony punkt porcji jest zdominowany też przez front
+        candidates = batch[survivors]
+        comparison_count += len(survivors) * (len(survivors) - 1) // 2
+        earlier = np.ones((len(survivors), len(survivors)), dtype=bool)
+        for k in range(d):
+            if maximize[k]:
+                earlier &= candidates[:, k] >= candidates[:, k, None]
+            else:
+                earlier &= candidates[:, k] <= candidates[:, k, None]
+        survivors = survivors[~np.tril(earlier, -1).any(axis=1)]
+        front = np.vstack((front, batch[survivors]))
+        front_rows.append(rows[survivors])
+    kept = np.zeros(n, dtype=bool)
+    if n:
+        kept[np.concatenate(front_rows)] = True
+        repeated = np.ones(n, dtype=bool)
+        repeated[0] = False
+        for k in range(d):
+            column = points[order, k]
+            repeated[1:] &= column[1:] == column[:-1]
+        repeated[:-1] |= repeated[1:]
+        kept[order[repeated]] = False
+    P = [X[i] for i in np.flatnonzero(kept)]
     exec_time = time.time() - start_time
     return P, exec_time, comparison_count
 
+KUNG_LEAF = 64
+STAIRCASE_BATCH = 4096
+
+def sweep_2d(points, counter):
+    """
+    Punkty różne, posortowane leksykograficznie: punkt jest zdominowany,
+    gdy najmniejsza druga współrzędna wcześniejszych punktów nie jest większa.
+    """
+    counter[0] += max(len(points) - 1, 0)
+    best_before = np.minimum.accumulate(np.r_[np.inf, points[:-1, 1]])
+    return points[:, 1] < best_before
+
+def staircase_3d(points, counter):
+    """
+    Przegląd po pierwszej współrzędnej ze "schodami" - zbiorem niezdominowanych
+    par (y, z) dotychczasowych punktów, y rosnąco i z malejąco. Schody są
+    posortowanymi listami przeszukiwanymi binarnie (zamiast drzewa
+    zrównoważonego); każdy krok wyszukiwania to jedno porównanie.
+    Punkty idą porcjami: porcja jest najpierw sprawdzona naraz
+    (np.searchsorted) ze schodami z jej początku - zdominowany przez nie punkt
+    pozostaje zdominowany - a pętla obsługuje tylko resztę.
+    """
+    ys, zs = [], []
+    keep = np.zeros(len(points), dtype=bool)
+    for first in range(0, len(points), STAIRCASE_BATCH):
+        batch_y = points[first:first + STAIRCASE_BATCH, 1]
+        batch_z = points[first:first + STAIRCASE_BATCH, 2]
+        pending = np.arange(len(batch_y))
+        if ys:
+            position = np.searchsorted(np.array(ys), batch_y, side="right")
+            counter[0] += len(batch_y) * len(ys).bit_length() + np.count_nonzero(position)
+            covered = (position > 0) & (np.array(zs)[position - 1] <= batch_z)
+            pending = pending[~covered]
+        for i, y, z in zip(pending.tolist(), batch_y[pending].tolist(), batch_z[pending].tolist()):
+            lo, hi = 0, len(ys)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                counter[0] += 1
+                if ys[mid] <= y:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo:
+                counter[0] += 1
+                if zs[lo - 1] <= z:
+                    continue
+            keep[first + i] = True
+            start = lo - 1 if lo and ys[lo - 1] == y else lo
+            stop = start
+            while stop < len(zs):
+                counter[0] += 1
+                if zs[stop] < z:
+                    break
+                stop += 1
+            ys[start:stop] = [y]
+            zs[start:stop] = [z]
+    return keep
+
+def brute_dominated(points, A, B, dims, counter):
+    """
+    Maska punktów B słabo zdominowanych przez któryś z punktów A na kryteriach dims.
+    """
+    counter[0] += len(A) * len(B)
+    dominated = np.ones((len(B), len(A)), dtype=bool)
+    for k in dims:
+        dominated &= points[A, k] <= points[B, k, None]
+    return dominated.any(axis=1)
+
+def filter_dominated(points, A, B, dims, counter):
+    """
+    Maska punktów B zdominowanych przez A, gdy na pozostałych kryteriach
+    punkty A są już nie gorsze od punktów B. Podział po medianie ostatniego
+    kryterium: A z dolnej połowy jest nie gorsze od całej górnej połowy B,
+    więc tę parę sprawdza się na jednym kryterium mniej.
+    """
+    if len(A) == 0 or len(B) == 0:
+        return np.zeros(len(B), dtype=bool)
+    if len(A) * len(B) <= KUNG_LEAF * KUNG_LEAF:
+        return brute_dominated(points, A, B, dims, counter)
+    if len(dims) == 1:
+        counter[0] += len(B)
+        return points[B, dims[0]] >= points[A, dims[0]].min()
+    if len(dims) == 2:
+        counter[0] += len(B)
+        first, second = dims
+        rows = np.concatenate((A, B))
+        is_b = np.r_[np.zeros(len(A), dtype=bool), np.ones(len(B), dtype=bool)]
+        order = np.lexsort((is_b, points[rows, first]))
+        best = np.minimum.accumulate(np.where(is_b[order], np.inf, points[rows[order], second]))
+        dominated = np.zeros(len(rows), dtype=bool)
+        dominated[order] = best <= points[rows[order], second]
+        return dominated[len(A):]
+    k = dims[-1]
+    values = np.concatenate((points[A, k], points[B, k]))
+    median = np.partition(values, len(values) // 2)[len(values) // 2]
+    low = values < median
+    if not low.any():
+        low = values <= median
+    if low.all():
+        return filter_dominated(points, A, B, dims[:-1], counter)
+    low_a, low_b = low[:len(A)], low[len(A):]
+    dominated = np.zeros(len(B), dtype=bool)
+    dominated[low_b] = filter_dominated(points, A[low_a], B[low_b], dims, counter)
+    high_b = np.flatnonzero(~low_b)
+    dominated[high_b] = filter_dominated(points, A[~low_a], B[high_b], dims, counter)
+    rest = high_b[~dominated[high_b]]
+    dominated[rest] = filter_dominated(points, A[low_a], B[rest], dims[:-1], counter)
+    return dominated
+
+def kung_front(points, rows, counter):
+    """
+    Zbiór niezdominowany punktów rows (różnych, posortowanych leksykograficznie):
+    front pierwszej połowy plus te punkty frontu drugiej połowy, których nie
+    dominuje front pierwszej (na kryteriach od drugiego, bo na pierwszym
+    pierwsza połowa jest nie gorsza).
+    """
+    if len(rows) <= KUNG_LEAF:
+        counter[0] += len(rows) * (len(rows) - 1)
+        dominated = np.ones((len(rows), len(rows)), dtype=bool)
+        for k in range(points.shape[1]):
+            dominated &= points[rows, k] <= points[rows, k, None]
+        np.fill_diagonal(dominated, False)
+        return rows[~dominated.any(axis=1)]
+    half = len(rows) // 2
+    top = kung_front(points, rows[:half], counter)
+    bottom = kung_front(points, rows[half:], counter)
+    dims = list(range(1, points.shape[1]))
+    return np.concatenate((top, bottom[~filter_dominated(points, top, bottom, dims, counter)]))
+
+def kung_mask(points, directions, counter):
+    """
+    Maska punktów, których nie dominuje żaden punkt różny od nich (równe
+    punkty zostają wszystkie), oraz maska punktów powtórzonych - wspólna
+    część kung i liczenia frontu porcjami.
+    """
+    n, d = points.shape
+    front_rows = np.ones(n, dtype=bool)
+    repeated_rows = np.full(n, n > 1)
+    if d and n:
+        signs = direction_signs(directions, d)
+        order = lexicographic_order(points, signs)
+        ordered = points[order]
+        ordered *= signs
+        same_as_previous = np.r_[False, (ordered[1:] == ordered[:-1]).all(axis=1)]
+        counter[0] += n - 1
+        group = np.cumsum(~same_as_previous) - 1
+        repeated = np.bincount(group) > 1
+        unique = np.flatnonzero(~same_as_previous)
+        distinct = ordered[unique]
+        if d == 1:
+            front = np.zeros(len(unique), dtype=bool)
+            front[0] = True
+        elif d == 2:
+            front = sweep_2d(distinct, counter)
+        elif d == 3:
+            front = staircase_3d(distinct, counter)
+        else:
+            front = np.zeros(len(unique), dtype=bool)
+            front[kung_front(distinct, np.arange(len(unique)), counter)] = True
+        front_rows[order] = front[group]
+        repeated_rows[order] = repeated[group]
+    return front_rows, repeated_rows
+
+def kung(X, directions=None):
+    """
+    Algorytm Kunga, Luccia i Preparaty: sortowanie leksykograficzne, potem
+    przegląd O(n log n) dla 2 kryteriów, przegląd ze schodami dla 3 i
+    dziel i zwyciężaj dla 4 i więcej kryteriów. Wynik jak w naive_no_filter
+    (punkt odpada, gdy słabo dominuje go inny punkt, więc powtórzone punkty
+    odpadają wszystkie), kolejność punktów jak w X. comparison_count to
+    liczba porównań punkt-punkt wykonanych przez algorytm. Kryteria "Max"
+    są odwracane w posortowanej kopii punktów, którą algorytm i tak tworzy.
+    """
+    start_time = time.time()
+    points = as_matrix(X)
+    counter = [0]
+    front, repeated = kung_mask(points, directions, counter)
+    P = [X[i] for i in np.flatnonzero(front & ~repeated)]
+    exec_time = time.time() - start_time
+    return P, exec_time, counter[0]
+
+
+FRONTS_BATCH = 256
 
-def distance_from_ideal(point, ideal=None):
-    if ideal is None:
-        ideal = [0] * len(point)
-    return math.sqrt(sum((point[k] - ideal[k])**2 for k in range(len(point))))
+def fronts_2d(points, counter):
+    """
+    Numery frontów dla dwóch kryteriów w O(n log n). W kolejności
+    leksykograficznej drugie kryterium maleje wzdłuż każdego frontu, więc
+    front dominuje punkt wtedy i tylko wtedy, gdy dominuje go ostatni dodany
+    punkt frontu, a drugie kryteria ostatnich punktów kolejnych frontów
+    rosną - właściwy front wskazuje bisect.
+    """
+    ranks = np.empty(len(points), dtype=np.int64)
+    last = []
+    for i, y in enumerate(points[:, 1].tolist()):
+        counter[0] += len(last).bit_length()
+        rank = bisect_right(last, y)
+        if rank == len(last):
+            last.append(y)
+        else:
+            last[rank] = y
+        ranks[i] = rank
+    return ranks
 
-def sort_and_filter(X):
-    X_sorted = sorted(X, key=lambda point: distance_from_ideal(point))
-    result, exec_time, comparison_count = naive_with_filter(X_sorted)
-    return result, exec_time, comparison_count
+def fronts_ens(points, counter):
+    """
+    Efficient Non-dominated Sort z wyszukiwaniem binarnym (Zhang i in.).
+    Punkt może być zdominowany tylko przez punkty wcześniejsze w kolejności
+    leksykograficznej. Jeśli front k dominuje punkt, dominuje go też każdy
+    front przed k, więc najniższy front bez dominatora (1 + najwyższy numer
+    frontu dominatora) znajduje wyszukiwanie binarne. Punkty idą porcjami:
+    wyszukiwanie w gotowych frontach jest prowadzone dla całej porcji naraz,
+    a dominację wewnątrz porcji uwzględnia potem poprawianie numerów
+    (numer = 1 + największy numer dominatora z porcji) aż do ustalenia.
+    Porównywane są kryteria od drugiego - na pierwszym wcześniejszy punkt
+    jest nie gorszy.
+    """
+    n, d = points.shape
+    tail = points[:, 1:]
+    ranks = np.empty(n, dtype=np.int64)
+    fronts = []
+    sizes = []
+    for first in range(0, n, FRONTS_BATCH):
+        batch = tail[first:first + FRONTS_BATCH]
+        low = np.zeros(len(batch), dtype=np.int64)
+        high = np.full(len(batch), len(fronts))
+        searching = np.flatnonzero(low < high)
+        while len(searching):
+            middle = (low[searching] + high[searching]) // 2
+            for m in np.unique(middle):
+                rows = searching[middle == m]
+                counter[0] += sizes[m] * len(rows)
+                dominated = dominated_by(fronts[m][:sizes[m]], batch[rows])
+                low[rows[dominated]] = m + 1
+                high[rows[~dominated]] = m
+            searching = searching[low[searching] < high[searching]]
+        counter[0] += len(batch) * (len(batch) - 1) // 2
+        earlier = np.ones((len(batch), len(batch)), dtype=bool)
+        for k in range(d - 1):
+            earlier &= batch[:, k] <= batch[:, k, None]
+        earlier = np.tril(earlier, -1)
+        rank = low
+        while True:
+            updated = np.maximum(low, np.where(earlier, rank + 1, 0).max(axis=1))
+            if np.array_equal(updated, rank):
+                break
+            rank = updated
+        ranks[first:first + len(batch)] = rank
+        for r in np.unique(rank):
+            rows = batch[rank == r]
+            if r == len(fronts):
+                fronts.append(np.empty((len(rows), d - 1)))
+                sizes.append(0)
+            end = sizes[r] + len(rows)
+            if end > len(fronts[r]):
+                grown = np.empty((max(end, 2 * len(fronts[r])), d - 1))
+                grown[:sizes[r]] = fronts[r][:sizes[r]]
+                fronts[r] = grown
+            fronts[r][sizes[r]:end] = rows
+            sizes[r] = end
+    return ranks
+
+def non_dominated_sort(X, directions=None):
+    """
+    Sortowanie niezdominowane: numer frontu każdego punktu X (0 - zbiór
+    Pareto, 1 - zbiór Pareto po usunięciu frontu 0 itd.), w kolejności X.
+    Dominacja jest tu ostra (nie gorszy na każdym kryterium i różny), więc
+    powtórzone punkty trafiają do tego samego frontu, a nie odpadają jak
+    w naive_no_filter. Dla 1 kryterium front to grupa równych wartości, dla 2
+    przegląd O(n log n), dla więcej ENS-BS. comparison_count to liczba
+    porównań punkt-punkt.
+    """
+    start_time = time.time()
+    points = as_matrix(X)
+    n, d = points.shape
+    counter = [0]
+    ranks = np.zeros(n, dtype=np.int64)
+    if n and d:
+        signs = direction_signs(directions, d)
+        order = lexicographic_order(points, signs)
+        ordered = points[order]
+        ordered *= signs
+        same_as_previous = np.r_[False, (ordered[1:] == ordered[:-1]).all(axis=1)]
+        counter[0] += n - 1
+        group = np.cumsum(~same_as_previous) - 1
+        distinct = ordered[~same_as_previous]
+        if d == 1:
+            distinct_ranks = np.arange(len(distinct))
+        elif d == 2:
+            distinct_ranks = fronts_2d(distinct, counter)
+        else:
+            distinct_ranks = fronts_ens(distinct, counter)
+        ranks[order] = distinct_ranks[group]
+    exec_time = time.time() - start_time
+    return ranks, exec_time, counter[0]
 
 # # Przykładowe dane testowe
 # X = [
@@ -1,9 +1,28 @@
+import os
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import ttk, simpledialog, messagebox, filedialog
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import norm, expon
-from algorithms import naive_no_filter, naive_with_filter, sort_and_filter
+from algorithms import naive_no_filter, naive_with_filter, sort_and_filter, kung, non_dominated_sort
+from pareto_archive import ParetoArchive, nd_tree
+from sample_store import DISTRIBUTIONS, draw, generate_to_file, streaming_front
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from virtual_table import VirtualTable
+
+ALGORITHMS = {
+    "Naiwny": naive_no_filter,
+    "Naiwny z filtrowaniem": naive_with_filter,
+    "Sortowanie i filtrowanie": sort_and_filter,
+    "Kung": kung,
+    "Archiwum ND-tree": nd_tree,
+}
+ARCHIVE_ALGORITHM = "Archiwum ND-tree"
+STREAMING_ALGORITHM = "Kung porcjami (plik .npy)"
+LARGE_SAMPLES = 1000000
+PLOT_SAMPLE = 20000
 
 class OptimizationApp:
     def __init__(self, root):
@@ -11,6 +30,11 @@ class OptimizationApp:
         self.root.title("Aplikacja Optymalizacji Wielokryterialnej")
 
         self.criteria = []
+        self.samples = None
+        self.archive = None
+        self.archive_time = 0.0
+        self.sample_file = None
+        self.rng = np.random.default_rng()
         
         self.plot_button = tk.Button(root, text="Generuj Wykres", command=self.plot_results)
         self.plot_button.grid(row=2, column=1, padx=10, pady=10, sticky="nsew")
@@ -33,7 +57,7 @@ class OptimizationApp:
         self.distribution_var = tk.StringVar(value="Normalny")
         tk.Label(self.generation_frame, text="Rozkład:").grid(row=0, column=0, padx=5, pady=5)
         self.distribution_menu = ttk.Combobox(self.generation_frame, textvariable=self.distribution_var,
-                                              values=["Normalny", "Wykładniczy"])
+                                              values=list(DISTRIBUTIONS))
         self.distribution_menu.grid(row=0, column=1, padx=5, pady=5)
 
         tk.Label(self.generation_frame, text="Średnia:").grid(row=1, column=0, padx=5, pady=5)
@@ -48,16 +72,20 @@ class OptimizationApp:
         self.num_objects_entry = tk.Entry(self.generation_frame)
         self.num_objects_entry.grid(row=3, column=1, padx=5, pady=5)
 
+        tk.Label(self.generation_frame, text="Ziarno:").grid(row=4, column=0, padx=5, pady=5)
+        self.seed_entry = tk.Entry(self.generation_frame)
+        self.seed_entry.grid(row=4, column=1, padx=5, pady=5)
+
         self.generate_button = tk.Button(self.generation_frame, text="Generuj", command=self.generate_samples)
-        self.generate_button.grid(row=4, column=0, columnspan=2, padx=5, pady=5)
+        self.generate_button.grid(row=5, column=0, padx=5, pady=5)
+        self.add_samples_button = tk.Button(self.generation_frame, text="Dodaj punkty", command=self.add_samples)
+        self.add_samples_button.grid(row=5, column=1, padx=5, pady=5)
 
         self.data_frame = ttk.LabelFrame(root, text="Dane")
         self.data_frame.grid(row=0, column=1, rowspan=2, padx=10, pady=10, sticky="nsew")
 
-        self.data_table = ttk.Treeview(self.data_frame, columns=[f"Kryterium {i}" for i in range(1, 8)], show="headings")
-        for i in range(1, 8):
-            self.data_table.heading(f"Kryterium {i}", text=f"Kryterium {i}")
-            self.data_table.column(f"Kryterium {i}", width=100)
+        self.data_table = VirtualTable(self.data_frame, columns=[f"Kryterium {i}" for i in range(1, 8)],
+                                       width=100, formatter=lambda x: round(x, 2))
         self.data_table.grid(row=0, column=0, padx=5, pady=5)
 
         self.sort_frame = ttk.LabelFrame(root, text="Akcje")
@@ -73,10 +101,13 @@ class OptimizationApp:
         self.algorithm_var = tk.StringVar(value="Naiwny")
         tk.Label(self.sort_frame, text="Algorytm:").grid(row=1, column=0, padx=5, pady=5)
         self.algorithm_menu = ttk.Combobox(self.sort_frame, textvariable=self.algorithm_var,
-                                           values=["Naiwny", "Naiwny z filtrowaniem", "Sortowanie i filtrowanie"])
+                                           values=list(ALGORITHMS))
         self.algorithm_menu.grid(row=1, column=1, padx=5, pady=5)
         self.benchmark_button = tk.Button(self.sort_frame, text="Benchmark", command=self.run_benchmark)
         self.benchmark_button.grid(row=2, column=0, columnspan=3, padx=5, pady=5)
+        self.fronts_var = tk.BooleanVar(value=False)
+        self.fronts_check = tk.Checkbutton(self.sort_frame, text="Wszystkie fronty (kolory)", variable=self.fronts_var)
+        self.fronts_check.grid(row=3, column=0, columnspan=3, padx=5, pady=5)
 
     def plot_results(self):
         if len(self.criteria) < 2:
@@ -85,22 +116,22 @@ class OptimizationApp:
         elif len(self.criteria) > 4:
             messagebox.showwarning("Ostrzeżenie", "Wykres można wygenerować maksymalnie dla 4 kryteriów.")
             return
+        if self.fronts_var.get():
+            self.plot_fronts()
+            return
 
-        selected_algorithm = self.algorithm_var.get()
-        if selected_algorithm == "Naiwny":
-            result, exec_time, comparisons = naive_no_filter(self.samples)
-        elif selected_algorithm == "Naiwny z filtrowaniem":
-            result, exec_time, comparisons = naive_with_filter(self.samples)
-        else:
-            result, exec_time, comparisons = sort_and_filter(self.samples)
+        selected_algorithm = self.front_algorithm()
+        result, exec_time, comparisons = self.compute_front(selected_algorithm)
 
         non_dominated_points = np.array(result)
-        all_points = np.array(self.samples)
+        all_points = self.view_points()
         dominated_points = np.array([point for point in all_points if list(point) not in non_dominated_points.tolist()])
 
         fig = plt.figure(facecolor='white')
 
         algorithm_title = f"Wizualizacja wyników - Algorytm: {selected_algorithm}"
+        if len(all_points) < len(self.samples):
+            algorithm_title += f" (próbka {len(all_points)} z {len(self.samples)})"
 
         if len(self.criteria) == 2:
             if dominated_points.ndim == 1:
@@ -155,7 +186,36 @@ class OptimizationApp:
 
         plt.show()
 
-
+    def plot_fronts(self):
+        """
+        Wykres wszystkich punktów w kolorach frontów z sortowania
+        niezdominowanego (0 - zbiór Pareto); przy 4 kryteriach czwarte
+        wyznacza wielkość punktu.
+        """
+        points = self.view_points()
+        ranks, exec_time, comparisons = self.compute_fronts(points)
+        labels = [f"{name} ({direction})" for name, direction in self.criteria]
+        fig = plt.figure(facecolor='white')
+        if len(self.criteria) == 2:
+            ax = fig.add_subplot(111)
+            sc = ax.scatter(points[:, 0], points[:, 1], c=ranks, cmap='viridis', edgecolor='black', s=30)
+        else:
+            ax = fig.add_subplot(111, projection='3d')
+            sizes = 30
+            if len(self.criteria) > 3:
+                spread = np.ptp(points[:, 3]) or 1.0
+                sizes = 10 + 60 * (points[:, 3] - points[:, 3].min()) / spread
+            sc = ax.scatter(points[:, 0], points[:, 1], points[:, 2], c=ranks, cmap='viridis', edgecolor='black', s=sizes)
+            ax.set_zlabel(labels[2])
+        ax.set_xlabel(labels[0])
+        ax.set_ylabel(labels[1])
+        plt.colorbar(sc, label="Numer frontu", pad=0.15)
+        fronts = ranks.max() + 1 if len(ranks) else 0
+        title = f"Sortowanie niezdominowane - liczba frontów: {fronts}"
+        if len(points) < len(self.samples):
+            title += f" (próbka {len(points)} z {len(self.samples)})"
+        plt.title(title)
+        plt.show()
 
     def add_criteria(self):
         criteria_name = f"Kryterium {len(self.criteria) + 1}"
@@ -188,39 +248,145 @@ class OptimizationApp:
             del self.criteria[index]
             self.criteria_listbox.delete(index)
 
-    def generate_samples(self):
+    def draw_samples(self):
         dist = self.distribution_var.get()
         mean = float(self.mean_entry.get())
         std_dev = float(self.std_dev_entry.get())
         num_objects = int(self.num_objects_entry.get())
 
-        if dist == "Normalny":
-            self.samples = norm.rvs(loc=mean, scale=std_dev, size=(num_objects, len(self.criteria)))
-        elif dist == "Wykładniczy":
-            self.samples = expon.rvs(scale=mean, size=(num_objects, len(self.criteria)))
+        if dist not in DISTRIBUTIONS:
+            return None
+        return draw(self.rng, dist, mean, std_dev, (num_objects, len(self.criteria)))
 
-        for row in self.data_table.get_children():
-            self.data_table.delete(row)
-        for sample in self.samples:
-            self.data_table.insert("", "end", values=list(map(lambda x: round(x, 2), sample)))
+    def generate_samples(self):
+        seed = self.seed_entry.get().strip()
+        self.rng = np.random.default_rng(int(seed) if seed else None)
+        if int(self.num_objects_entry.get()) > LARGE_SAMPLES:
+            self.generate_large_samples()
+            return
+        samples = self.draw_samples()
+        if samples is None:
+            return
+        self.samples = samples
+        self.sample_file = None
+        self.algorithm_menu.configure(state="normal")
+        # archiwum ND-tree powstaje dopiero, gdy jest potrzebne (compute_front, add_samples)
+        self.archive = None
+        self.data_table.set_data(self.samples)
+
+    def generate_large_samples(self):
+        """
+        Duży zbiór trafia porcjami do pliku .npy otwieranego jako memmap, więc
+        nie musi mieścić się w pamięci. Front liczy się wtedy porcjami
+        (streaming_front), a wykresy pokazują losową próbkę punktów.
+        """
+        dist = self.distribution_var.get()
+        if dist not in DISTRIBUTIONS:
+            return
+        path = filedialog.asksaveasfilename(title="Plik na próbki", defaultextension=".npy",
+                                            filetypes=[("NumPy", "*.npy")])
+        if not path:
+            return
+        self.samples = generate_to_file(path, int(self.num_objects_entry.get()), len(self.criteria), dist,
+                                        float(self.mean_entry.get()), float(self.std_dev_entry.get()), self.rng)
+        self.sample_file = path
+        self.algorithm_menu.configure(state="disabled")
+        self.archive = None
+        self.data_table.set_data(self.samples)
+
+    def add_samples(self):
+        """
+        Dokłada nowe punkty do istniejących; archiwum frontu (zbudowane przy
+        pierwszym użyciu) jest tylko aktualizowane nowymi punktami, a nie
+        liczone od zera. Zbiór w pliku jest generowany od nowa.
+        """
+        if (self.samples is None or self.sample_file is not None
+                or self.samples.shape[1] != len(self.criteria)
+                or int(self.num_objects_entry.get()) > LARGE_SAMPLES):
+            self.generate_samples()
+            return
+        samples = self.draw_samples()
+        if samples is None:
+            return
+        if self.archive is None or self.archive.directions != self.directions():
+            self.reset_archive()
+        self.samples = np.vstack((self.samples, samples))
+        self.feed_archive(samples)
+        self.data_table.set_data(self.samples)
+
+    def view_points(self):
+        """
+        Punkty do wykresów i sortowania niezdominowanego: wszystkie albo,
+        gdy jest ich więcej niż PLOT_SAMPLE, stała losowa próbka.
+        """
+        if len(self.samples) <= PLOT_SAMPLE:
+            return np.asarray(self.samples)
+        rows = np.sort(np.random.default_rng(0).choice(len(self.samples), PLOT_SAMPLE, replace=False))
+        return np.asarray(self.samples[rows])
+
+    def directions(self):
+        return [direction for _, direction in self.criteria]
+
+    def reset_archive(self):
+        self.archive = ParetoArchive(self.directions())
+        self.archive_time = 0.0
+        self.feed_archive(self.samples)
+
+    def feed_archive(self, points):
+        start_time = time.time()
+        self.archive.update(points)
+        self.archive_time += time.time() - start_time
+
+    def front_algorithm(self):
+        """
+        Algorytm, którym faktycznie liczony jest front: dla zbioru w pliku
+        zawsze Kung porcjami (wybór algorytmu jest wtedy zablokowany).
+        """
+        if self.sample_file is not None:
+            return STREAMING_ALGORITHM
+        return self.algorithm_var.get()
+
+    def compute_front(self, name):
+        """
+        Zbiór niezdominowany algorytmem name z kierunkami Min/Max kryteriów;
+        dla archiwum ND-tree bierze gotowy front i łączny czas jego aktualizacji
+        (archiwum jest budowane przy pierwszym użyciu i od nowa po zmianie
+        kierunków), a Kung
+        porcjami czyta zbiór z pliku .npy (name zwraca front_algorithm).
+        """
+        directions = self.directions()
+        if name == STREAMING_ALGORITHM:
+            return streaming_front(self.samples, directions)
+        if name == ARCHIVE_ALGORITHM:
+            if self.archive is None or self.archive.directions != directions:
+                self.reset_archive()
+            return list(self.archive.front()), self.archive_time, self.archive.comparison_count
+        return ALGORITHMS.get(name, sort_and_filter)(self.samples, directions)
+
+    def compute_fronts(self, points):
+        """
+        Numer frontu każdego z punktów (w ich kolejności).
+        """
+        return non_dominated_sort(points, self.directions())
 
     def sort_data(self):
         criterion_index = self.sort_criteria_var.get() - 1
+        if self.sample_file is not None:
+            # plik jest tylko do odczytu - sortowany jest widok tabeli
+            self.data_table.sort_by(criterion_index)
+            return
         self.samples = self.samples[self.samples[:, criterion_index].argsort()]
-        
-        for row in self.data_table.get_children():
-            self.data_table.delete(row)
-        for sample in self.samples:
-            self.data_table.insert("", "end", values=list(map(lambda x: round(x, 2), sample)))
+        self.data_table.set_data(self.samples)
 
     def run_benchmark(self):
-        alg = self.algorithm_var.get()
-        if alg == "Naiwny":
-            result, exec_time, comparisons = naive_no_filter(self.samples)
-        elif alg == "Naiwny z filtrowaniem":
-            result, exec_time, comparisons = naive_with_filter(self.samples)
-        else:
-            result, exec_time, comparisons = sort_and_filter(self.samples)
+        if self.fronts_var.get():
+            ranks, exec_time, comparisons = self.compute_fronts(self.view_points())
+            fronts = ranks.max() + 1 if len(ranks) else 0
+            messagebox.showinfo("Benchmark", f"Sortowanie niezdominowane:\nFronty: {fronts}\n"
+                                             f"Czas: {exec_time}\nPorównania: {comparisons}")
+            return
+        alg = self.front_algorithm()
+        result, exec_time, comparisons = self.compute_front(alg)
 
         messagebox.showinfo("Benchmark", f"Wyniki dla algorytmu {alg}:\nCzas: {exec_time}\nPorównania: {comparisons}")
 
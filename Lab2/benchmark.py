@@ -0,0 +1,107 @@
+import argparse
+import time
+import numpy as np
+from algorithms import naive_no_filter, naive_with_filter, sort_and_filter, kung, non_dominated_sort
+from pareto_archive import nd_tree
+
+def reference_no_filter(X):
+    P = []
+    comparison_count = 0
+    for i in range(len(X)):
+        Y = X[i]
+        dominated = False
+        for j in range(len(X)):
+            comparison_count += 1
+            if i != j and all(X[j][k] <= Y[k] for k in range(len(Y))):
+                dominated = True
+                break
+        if not dominated:
+            P.append(Y)
+    return P, comparison_count
+
+def reference_with_filter(X):
+    P = []
+    comparison_count = 0
+    for i in range(len(X)):
+        Y = X[i]
+        dominated = False
+        for j in range(i + 1, len(X)):
+            comparison_count += 1
+            if all(X[j][k] <= Y[k] for k in range(len(Y))):
+                dominated = True
+                break
+        if not dominated:
+            P.append(Y)
+    return P, comparison_count
+
+def peeling_ranks(X):
+    """
+    Naiwne sortowanie niezdominowane: wyznacza zbiór niezdominowany
+    pozostałych punktów, nadaje mu kolejny numer frontu, usuwa go i powtarza.
+    """
+    points = np.asarray(X, dtype=float)
+    ranks = np.zeros(len(points), dtype=np.int64)
+    rest = np.arange(len(points))
+    comparison_count = 0
+    rank = 0
+    while len(rest):
+        remaining = points[rest]
+        comparison_count += len(rest) * (len(rest) - 1)
+        no_worse = np.ones((len(rest), len(rest)), dtype=bool)
+        better = np.zeros((len(rest), len(rest)), dtype=bool)
+        for k in range(points.shape[1]):
+            column = remaining[:, k]
+            no_worse &= column <= column[:, None]
+            better |= column < column[:, None]
+        dominated = (no_worse & better).any(axis=1)
+        ranks[rest[~dominated]] = rank
+        rest = rest[dominated]
+        rank += 1
+    return ranks, comparison_count
+
+def main():
+    parser = argparse.ArgumentParser(description="Pętle Pythona vs jądra NumPy i algorytm Kunga dla zbioru Pareto oraz sortowanie niezdominowane.")
+    parser.add_argument("--size", type=int, default=2000, help="liczba punktów do porównania z pętlami")
+    parser.add_argument("--large", type=int, default=100000, help="liczba punktów tylko dla wersji NumPy")
+    parser.add_argument("--dims", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--sort-size", type=int, default=20000, help="liczba punktów dla samego sortowania niezdominowanego")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    # (nazwa, implementacja referencyjna, funkcja, czy liczba porównań ma być identyczna)
+    methods = [("Naiwny", reference_no_filter, naive_no_filter, True),
+               ("Naiwny z filtrowaniem", reference_with_filter, naive_with_filter, True),
+               ("Sortowanie i filtrowanie", reference_no_filter, sort_and_filter, False),
+               ("Kung", reference_no_filter, kung, False),
+               ("Archiwum ND-tree", reference_no_filter, nd_tree, False)]
+    for d in args.dims:
+        X = rng.normal(size=(args.size, d))
+        for name, reference, vectorized, same_count in methods:
+            start = time.perf_counter()
+            ref_P, ref_count = reference(X)
+            ref_time = time.perf_counter() - start
+            P, exec_time, count = vectorized(X)
+            same = np.array_equal(np.array(ref_P).reshape(-1, d), np.array(P).reshape(-1, d))
+            same = same and (ref_count == count or not same_count)
+            print(f"d={d} {name:24s} n={args.size}  pętle: {ref_time:7.3f} s  NumPy: {exec_time:7.3f} s  "
+                  f"porównania: {count}  wynik identyczny: {same}")
+        X = rng.normal(size=(args.large, d))
+        for name, _, vectorized, _ in methods:
+            P, exec_time, count = vectorized(X)
+            print(f"d={d} {name:24s} n={args.large}  NumPy: {exec_time:7.3f} s  niezdominowane: {len(P)}  "
+                  f"porównania: {count}")
+        X = rng.normal(size=(args.size, d))
+        start = time.perf_counter()
+        ref_ranks, ref_count = peeling_ranks(X)
+        ref_time = time.perf_counter() - start
+        ranks, exec_time, count = non_dominated_sort(X)
+        print(f"d={d} {'Fronty (obieranie/ENS)':24s} n={args.size}  obieranie: {ref_time:7.3f} s  ENS: {exec_time:7.3f} s  "
+              f"fronty: {ranks.max() + 1}  porównania: {ref_count} / {count}  "
+              f"wynik identyczny: {np.array_equal(ref_ranks, ranks)}")
+        X = rng.normal(size=(args.sort_size, d))
+        ranks, exec_time, count = non_dominated_sort(X)
+        print(f"d={d} {'Fronty (ENS)':24s} n={args.sort_size}  ENS: {exec_time:7.3f} s  fronty: {ranks.max() + 1}  "
+              f"porównania: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+import time
+from itertools import islice
+import numpy as np
+from algorithms import direction_signs, dominated_by
+
+LEAF_SIZE = 20
+CHUNK_SIZE = 512
+BOX_DEPTH = 3
+
+def mutually_non_dominated(points):
+    """
+    Maska punktów, których nie dominuje słabo żaden inny z points;
+    z grupy równych punktów zostaje pierwszy.
+    """
+    n, d = points.shape
+    covered = np.ones((n, n), dtype=bool)
+    equal = np.ones((n, n), dtype=bool)
+    for k in range(d):
+        covered &= points[:, k] <= points[:, k, None]
+        equal &= points[:, k] == points[:, k, None]
+    later = np.arange(n) > np.arange(n)[:, None]
+    covered &= ~(equal & later)
+    np.fill_diagonal(covered, False)
+    return ~covered.any(axis=1)
+
+class NDTreeNode:
+    """
+    Węzeł ND-drzewa. Liść trzyma punkty (macierz) i ich numery, węzeł
+    wewnętrzny - dzieci. ideal i nadir to najmniejsze i największe
+    współrzędne punktów poddrzewa.
+    """
+
+    def __init__(self, points, ids):
+        self.points = points
+        self.ids = ids
+        self.children = []
+        self.refresh_bounds()
+
+    @property
+    def is_leaf(self):
+        return not self.children
+
+    @property
+    def empty(self):
+        return self.is_leaf and len(self.ids) == 0
+
+    def refresh_bounds(self):
+        if self.children:
+            self.ideal = np.min([c.ideal for c in self.children], axis=0)
+            self.nadir = np.max([c.nadir for c in self.children], axis=0)
+        elif len(self.ids):
+            self.ideal = self.points.min(axis=0)
+            self.nadir = self.points.max(axis=0)
+
+    def clear(self):
+        self.points = self.points[:0]
+        self.ids = []
+        self.children = []
+
+    def adopt(self, child):
+        """
+        Węzeł z jednym dzieckiem przejmuje jego zawartość.
+        """
+        self.points, self.ids, self.children = child.points, child.ids, child.children
+        self.refresh_bounds()
+
+    def prune(self):
+        self.children = [c for c in self.children if not c.empty]
+        if len(self.children) == 1:
+            self.adopt(self.children[0])
+        elif self.children:
+            self.refresh_bounds()
+        else:
+            self.clear()
+
+    def collect(self, points, ids):
+        if self.is_leaf:
+            points.append(self.points)
+            ids.extend(self.ids)
+        for child in self.children:
+            child.collect(points, ids)
+
+class ParetoArchive:
+    """
+    Przyrostowe archiwum punktów niezdominowanych (minimalizacja) na ND-drzewie
+    (Jaszkiewicz, Lust). Nowy punkt jest odrzucany, gdy słabo dominuje go punkt
+    z archiwum (także równy), a przyjęty usuwa punkty, które sam słabo dominuje.
+    Węzły, których prostopadłościan [ideal, nadir] nie może zawierać punktu
+    dominującego ani zdominowanego, są pomijane, więc aktualizacja zwykle
+    odwiedza tylko niewielką część drzewa. Punkty zdominowane nie są
+    przechowywane - usunięcie punktu z frontu nie przywraca punktów,
+    które wcześniej wyparł. Kryteria "Max" (directions) są przechowywane
+    z odwróconym znakiem; front() zwraca punkty w pierwotnej postaci.
+    """
+
+    def __init__(self, directions=None, leaf_size=LEAF_SIZE):
+        self.directions = None if directions is None else list(directions)
+        self.signs = None
+        self.leaf_size = leaf_size
+        self.root = None
+        self.offered = 0
+        self.comparison_count = 0
+
+    def __len__(self):
+        return len(self.front_ids())
+
+    def signs_for(self, d):
+        if self.signs is None:
+            self.signs = direction_signs(self.directions, d)
+        return self.signs
+
+    def oriented(self, y):
+        return y * self.signs_for(len(y))
+
+    def insert(self, point):
+        """
+        Dodaje punkt; zwraca True, jeśli trafił do archiwum. Numerem punktu
+        jest liczba punktów podanych wcześniej do archiwum.
+        """
+        return self.insert_oriented(self.oriented(np.asarray(point, dtype=float).ravel()))
+
+    def insert_oriented(self, y):
+        number = self.offered
+        self.offered += 1
+        if self.root is not None:
+            if not self.update_node(self.root, y):
+                return False
+            if self.root.empty:
+                self.root = None
+        if self.root is None:
+            self.root = NDTreeNode(y[None, :], [number])
+        else:
+            self.insert_node(self.root, y, number)
+        return True
+
+    def update(self, points, chunk_size=CHUNK_SIZE):
+        """
+        Wstawia punkty z dowolnego iterowalnego źródła (także generatora)
+        po kolei; zwraca liczbę przyjętych. Punkty są pobierane porcjami:
+        porcja jest najpierw porównana naraz z nadirami węzłów z górnych
+        BOX_DEPTH poziomów drzewa (punkt nie lepszy od nadiru węzła jest
+        zdominowany przez każdy jego punkt) i sama ze sobą, a punkty
+        zdominowane są odrzucane bez schodzenia w drzewo (wynik jest taki
+        sam, bo dominacja jest przechodnia). Reszta trafia do insert
+        pojedynczo, gdzie odcinanie poddrzew po ideal/nadir robi update_node.
+        """
+        iterator = iter(points)
+        accepted = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return accepted
+            chunk = np.array(chunk, dtype=float).reshape(len(chunk), -1)
+            chunk *= self.signs_for(chunk.shape[1])
+            survivors = np.arange(len(chunk))
+            if self.root is not None:
+                nadirs = self.box_nadirs()
+                self.comparison_count += len(nadirs) * len(chunk)
+                survivors = survivors[~dominated_by(nadirs, chunk)]
+            if len(survivors) > 1:
+                self.comparison_count += len(survivors) * (len(survivors) - 1)
+                survivors = survivors[mutually_non_dominated(chunk[survivors])]
+            first = self.offered
+            for i in survivors:
+                self.offered = first + i
+                accepted += self.insert_oriented(chunk[i])
+            self.offered = first + len(chunk)
+
+    def box_nadirs(self, depth=BOX_DEPTH):
+        """
+        Nadiry węzłów z górnych depth poziomów drzewa; liść na tych poziomach
+        daje zamiast nadiru swoje punkty (każdy jest nadirem samego siebie).
+        Ich liczba jest ograniczona kształtem drzewa, a nie rozmiarem frontu.
+        """
+        nadirs = []
+        level = [self.root]
+        for _ in range(depth):
+            nadirs += [node.points if node.is_leaf else node.nadir[None, :] for node in level]
+            level = [child for node in level for child in node.children]
+        nadirs += [node.nadir[None, :] for node in level]
+        return np.vstack(nadirs)
+
+    def update_node(self, node, y):
+        """
+        Odrzuca y (False), jeśli dominuje go punkt poddrzewa node, albo usuwa
+        z poddrzewa punkty zdominowane przez y. Prostopadłościany [ideal,
+        nadir] wszystkich dzieci węzła są sprawdzane naraz; schodzi się tylko
+        do dzieci, w których może leżeć punkt dominujący y lub przez y
+        zdominowany.
+        """
+        self.comparison_count += 1
+        if (node.nadir <= y).all():
+            return False
+        if (y <= node.ideal).all():
+            node.clear()
+            return True
+        if not ((y <= node.nadir).all() or (node.ideal <= y).all()):
+            return True
+        return self.update_inside(node, y)
+
+    def update_inside(self, node, y):
+        if node.is_leaf:
+            self.comparison_count += len(node.ids)
+            if (node.points <= y).all(axis=1).any():
+                return False
+            keep = ~(y <= node.points).all(axis=1)
+            if not keep.all():
+                node.points = node.points[keep]
+                node.ids = [i for i, k in zip(node.ids, keep) if k]
+                node.refresh_bounds()
+            return True
+        children = node.children
+        ideals = np.array([child.ideal for child in children])
+        nadirs = np.array([child.nadir for child in children])
+        self.comparison_count += len(children)
+        if (nadirs <= y).all(axis=1).any():
+            return False
+        covered = (y <= ideals).all(axis=1)
+        relevant = ~covered & ((y <= nadirs).all(axis=1) | (ideals <= y).all(axis=1))
+        for i in np.flatnonzero(covered):
+            children[i].clear()
+        for i in np.flatnonzero(relevant):
+            if not self.update_inside(children[i], y):
+                return False
+        if covered.any() or relevant.any():
+            node.prune()
+        return True
+
+    def insert_node(self, node, y, number):
+        while not node.is_leaf:
+            node.ideal = np.minimum(node.ideal, y)
+            node.nadir = np.maximum(node.nadir, y)
+            self.comparison_count += len(node.children)
+            distances = [np.sum((y - (c.ideal + c.nadir) / 2) ** 2) for c in node.children]
+            node = node.children[int(np.argmin(distances))]
+        node.points = np.vstack((node.points, y))
+        node.ids.append(number)
+        node.ideal = np.minimum(node.ideal, y)
+        node.nadir = np.maximum(node.nadir, y)
+        if len(node.ids) > self.leaf_size:
+            self.split(node)
+
+    def split(self, node):
+        """
+        Dzieli pełny liść na d + 1 liści: ziarna wybierane są kolejno jako
+        punkty najdalsze od już wybranych, pozostałe punkty trafiają do
+        najbliższego ziarna.
+        """
+        points = node.points
+        count = min(points.shape[1] + 1, len(points))
+        distance = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+        seeds = [int(distance.mean(axis=1).argmax())]
+        while len(seeds) < count:
+            seeds.append(int(distance[:, seeds].min(axis=1).argmax()))
+        nearest = distance[:, seeds].argmin(axis=1)
+        ids = np.array(node.ids)
+        node.children = [NDTreeNode(points[nearest == c], ids[nearest == c].tolist()) for c in range(count)]
+        node.points = points[:0]
+        node.ids = []
+
+    def delete(self, point):
+        """
+        Usuwa punkt równy podanemu; zwraca True, jeśli był w archiwum.
+        """
+        if self.root is None:
+            return False
+        found = self.delete_node(self.root, self.oriented(np.asarray(point, dtype=float).ravel()))
+        if found and self.root.empty:
+            self.root = None
+        return found
+
+    def delete_node(self, node, y):
+        if not ((node.ideal <= y).all() and (y <= node.nadir).all()):
+            return False
+        if node.is_leaf:
+            match = (node.points == y).all(axis=1)
+            if not match.any():
+                return False
+            keep = ~match
+            node.points = node.points[keep]
+            node.ids = [i for i, k in zip(node.ids, keep) if k]
+            node.refresh_bounds()
+            return True
+        for child in node.children:
+            if self.delete_node(child, y):
+                node.prune()
+                return True
+        return False
+
+    def front_ids(self):
+        if self.root is None:
+            return []
+        points, ids = [], []
+        self.root.collect(points, ids)
+        return sorted(ids)
+
+    def front(self):
+        """
+        Punkty archiwum w kolejności ich wstawienia.
+        """
+        if self.root is None:
+            return np.empty((0, 0))
+        points, ids = [], []
+        self.root.collect(points, ids)
+        return np.vstack(points)[np.argsort(ids)] * self.signs
+
+def nd_tree(X, directions=None):
+    """
+    Zbiór niezdominowany X wyznaczony przez wstawianie punktów po kolei do
+    ParetoArchive. Wynik jak w naive_no_filter, z wyjątkiem powtórzonych
+    punktów - z grupy równych zostaje pierwszy zamiast żadnego.
+    """
+    start_time = time.time()
+    archive = ParetoArchive(directions)
+    archive.update(X)
+    P = [X[i] for i in archive.front_ids()]
+    exec_time = time.time() - start_time
+    return P, exec_time, archive.comparison_count
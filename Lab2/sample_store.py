@@ -0,0 +1,67 @@
+import time
+import numpy as np
+from algorithms import direction_signs, dominated_by, kung_mask
+
+CHUNK_ROWS = 1 << 20
+SIEVE_POINTS = 16
+DISTRIBUTIONS = ("Normalny", "Wykładniczy")
+
+def draw(rng, distribution, mean, std_dev, size):
+    """
+    Próbki z rozkładu o podanej nazwie; dla wykładniczego mean to skala.
+    """
+    if distribution == "Normalny":
+        return rng.normal(mean, std_dev, size)
+    if distribution == "Wykładniczy":
+        return rng.exponential(mean, size)
+    raise ValueError(f"Nieznany rozkład: {distribution}")
+
+def generate_to_file(path, n, d, distribution, mean, std_dev, seed=None, chunk_size=CHUNK_ROWS):
+    """
+    Zapisuje n x d próbek do pliku .npy porcjami po chunk_size wierszy
+    i zwraca plik otwarty jako memmap tylko do odczytu. seed to liczba albo
+    np.random.Generator; ten sam seed daje te same dane niezależnie od
+    chunk_size, takie same jak jedno wywołanie draw dla całości.
+    """
+    rng = np.random.default_rng(seed)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n, d))
+    for start in range(0, n, chunk_size):
+        stop = min(n, start + chunk_size)
+        out[start:stop] = draw(rng, distribution, mean, std_dev, (stop - start, d))
+    out.flush()
+    del out
+    return open_samples(path)
+
+def open_samples(path):
+    return np.load(path, mmap_mode="r")
+
+def streaming_front(samples, directions=None, chunk_size=CHUNK_ROWS):
+    """
+    Zbiór niezdominowany (jak w naive_no_filter) dla danych czytanych
+    porcjami, np. z pliku .npy otwartego jako memmap. W pamięci są tylko
+    bieżąca porcja i front dotychczasowych punktów. Porcja jest najpierw
+    przesiewana przez kilka (SIEVE_POINTS) równomiernie wybranych punktów
+    frontu, co zwykle usuwa większość punktów tanim porównaniem, a front
+    reszty razem z dotychczasowym liczy algorytm Kunga.
+    Punkt zdominowany przez różny od niego punkt odpada na zawsze - jego
+    dominator albo punkt, który z kolei dominuje dominatora, zostaje we
+    froncie. Równe punkty zostają wszystkie i są usuwane dopiero na końcu,
+    bo kolejna kopia może przyjść w dalszej porcji. Wynik w kolejności
+    samples.
+    """
+    start_time = time.time()
+    counter = [0]
+    signs = direction_signs(directions, samples.shape[1])
+    front = np.empty((0, samples.shape[1]))
+    for start in range(0, len(samples), chunk_size):
+        chunk = np.asarray(samples[start:start + chunk_size], dtype=float)
+        sieve = front[::max(1, len(front) // SIEVE_POINTS)]
+        counter[0] += len(sieve) * len(chunk)
+        chunk = chunk[~dominated_by(sieve, chunk, signs, strict=True)]
+        points = np.vstack((front, chunk))
+        keep, _ = kung_mask(points, directions, counter)
+        front = points[keep]
+    _, repeated = kung_mask(front, directions, counter)
+    P = list(front[~repeated])
+    exec_time = time.time() - start_time
+    return P, exec_time, counter[0]
@@ -1,5 +1,10 @@
+import os
+import sys
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import topsis_distances
+
 def rsm(decision_matrix, weights=None):
     """
     RSM dla wariantu ciągłego z dynamicznym punktem docelowym i nadirem.
@@ -88,15 +93,8 @@ def topsis(decision_matrix, weights):
     """
     TOPSIS dla minimalizacji kryteriów.
     """
-    norm_matrix = decision_matrix / np.sqrt(np.sum(decision_matrix**2, axis=0))
-
-    weighted_matrix = norm_matrix * weights
-
-    ideal_solution = np.min(weighted_matrix, axis=0)
-    anti_ideal_solution = np.max(weighted_matrix, axis=0)
-
-    distances_to_ideal = np.sqrt(np.sum((weighted_matrix - ideal_solution)**2, axis=1))
-    distances_to_anti_ideal = np.sqrt(np.sum((weighted_matrix - anti_ideal_solution)**2, axis=1))
+    benefit = np.zeros(decision_matrix.shape[1], dtype=bool)
+    distances_to_ideal, distances_to_anti_ideal = topsis_distances(decision_matrix, weights, benefit)
 
     scores = distances_to_ideal / (distances_to_ideal + distances_to_anti_ideal)
 
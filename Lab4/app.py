@@ -1,3 +1,5 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
@@ -6,6 +8,10 @@ from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
 from algorithms import topsis, rsm, uta, fuzzy_topsis
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import top_k
+from virtual_table import VirtualTable
+
 def load_data():
     global dane_arkusz1, dane_arkusz2
 
@@ -29,10 +35,7 @@ def load_data():
         messagebox.showerror("Błąd", f"Nie udało się wczytać danych: {e}")
 
 def update_table(table, data):
-    for row in table.get_children():
-        table.delete(row)
-    for index, row in data.iterrows():
-        table.insert("", "end", values=list(row))
+    table.set_columns([data[col].to_numpy() for col in data.columns])
 
 def create_ranking():
     selected_method = metoda_combobox.get()
@@ -58,10 +61,11 @@ def create_ranking():
             fuzzy_weights = [[w, w, w] for w in wagi]
             ranking, scores = fuzzy_topsis(fuzzy_matrix, fuzzy_weights)
 
+        order = top_k(scores, len(scores), largest=False)
         ranking_data = pd.DataFrame({
-            "Punkt": [f"({', '.join(map(str, row))})" for row in macierz_decyzyjna],
-            "Score": scores
-        }).sort_values(by="Score").reset_index(drop=True)
+            "Punkt": [f"({', '.join(map(str, macierz_decyzyjna[i]))})" for i in order],
+            "Score": np.asarray(scores)[order]
+        })
 
         print("Ranking punktów:")
         print(ranking_data)
@@ -96,10 +100,7 @@ def create_3d_chart(macierz_decyzyjna, scores, metoda):
 
 
 def create_scrollable_table(frame, columns):
-    table = ttk.Treeview(frame, columns=columns, show="headings")
-    for col in columns:
-        table.heading(col, text=col)
-        table.column(col, width=25)
+    table = VirtualTable(frame, columns, width=25)
     table.pack(fill="both", expand=True)
     return table
 
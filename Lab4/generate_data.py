@@ -1,9 +1,14 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
 from scipy.stats import norm, expon
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from virtual_table import VirtualTable
+
 
 class OptimizationApp:
     def __init__(self, root):
@@ -34,10 +39,7 @@ class OptimizationApp:
         self.alt_table_frame = ttk.LabelFrame(root, text="Alternatywy")
         self.alt_table_frame.grid(row=0, column=1, rowspan=2, padx=10, pady=10, sticky="nsew")
 
-        self.alt_table = ttk.Treeview(self.alt_table_frame, columns=["Nr", "Nazwa", "Kryterium 1", "Kryterium 2", "Kryterium 3"], show="headings")
-        for col in ["Nr", "Nazwa", "Kryterium 1", "Kryterium 2", "Kryterium 3"]:
-            self.alt_table.heading(col, text=col)
-            self.alt_table.column(col, width=100)
+        self.alt_table = VirtualTable(self.alt_table_frame, ["Nr", "Nazwa", "Kryterium 1", "Kryterium 2", "Kryterium 3"], width=100)
         self.alt_table.grid(row=0, column=0, padx=5, pady=5)
 
         self.generation_frame = ttk.LabelFrame(root, text="Generacja Punktów")
@@ -78,7 +80,8 @@ class OptimizationApp:
             name = f"Alternatywa {alt_number}"
 
             self.alternatives.append((alt_number, name, crit1, crit2, crit3))
-            self.alt_table.insert("", "end", values=(alt_number, name, crit1, crit2, crit3))
+            self.alt_table.set_data(self.alternatives)
+            self.alt_table.see(len(self.alternatives) - 1)
 
             self.crit1_entry.delete(0, tk.END)
             self.crit2_entry.delete(0, tk.END)
@@ -1,507 +1,63 @@
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import math
 import openpyxl
 import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 import os
-import zipfile
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from snapshot import open_catalog
+from delta import load_delta, update_resources, apply_to_games_file
+from generate_resources import save_resources
+from recommender import RECOMMENDERS, RecommendationCancelled
+from profiling import Profiler, NULL_PROFILER
+
+SEARCH_DEBOUNCE_MS = 250
+WEIGHTS_DEBOUNCE_MS = 300
+RESULT_POLL_MS = 50
 
 def load_resources(resources_path):
     with open(resources_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def load_games(games_path):
-    with open(games_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def parse_owners(owners_value):
-    if isinstance(owners_value, int):
-        return owners_value
-    if isinstance(owners_value, float):
-        return int(owners_value)
-    if not isinstance(owners_value, str):
-        return 0
-    val = owners_value.strip()
-    if "-" in val:
-        parts = val.split("-")
-        if len(parts) == 2:
-            try:
-                low = int(parts[0].replace(",", ""))
-                high = int(parts[1].replace(",", ""))
-                return (low + high) // 2
-            except:
-                return 0
-    else:
-        try:
-            return int(val.replace(",", ""))
-        except:
-            return 0
-    return 0
-
-def parse_price(price_value):
-    if isinstance(price_value, (int, float)):
-        return float(price_value)
-    if isinstance(price_value, str):
-        try:
-            return float(price_value)
-        except:
-            return 0.0
-    return 0.0
-
-def game_matches_preferences(game_info, preferences):
-    max_price = preferences.get("max_price")
-    if max_price is not None:
-        price_val = parse_price(game_info.get("price", 999999))
-        if price_val > max_price:
-            return False
-    min_total_reviews = preferences.get("min_total_reviews", 0)
-    pos = game_info.get("positive", 0)
-    neg = game_info.get("negative", 0)
-    total_rev = pos + neg
-    if total_rev < min_total_reviews:
-        return False
-    min_pos = preferences.get("min_positive_ratio", 0.0)
-    ratio = pos / total_rev if total_rev > 0 else 0.0
-    if ratio < min_pos:
-        return False
-    mand_sub = preferences.get("mandatory_sub_lang", "")
-    if mand_sub:
-        if mand_sub not in game_info.get("supported_languages", []):
-            return False
-    req_plat = preferences.get("required_platforms", [])
-    for rp in req_plat:
-        if not game_info.get(rp.lower(), False):
-            return False
-    return True
-
-def compute_score_saw(game_info, preferences):
-    w_pos = preferences.get("weight_positive_ratio", 0.0)
-    w_price = preferences.get("weight_price", 0.0)
-    w_audio = preferences.get("weight_audio_lang", 0.0)
-    w_owners = preferences.get("weight_owners", 0.0)
-    w_med = preferences.get("weight_med_time", 0.0)
-    w_tags = preferences.get("weight_tags", 0.0)
-    pos = game_info.get("positive", 0)
-    neg = game_info.get("negative", 0)
-    tot = pos + neg
-    ratio = pos / tot if tot > 0 else 0.0
-    price = parse_price(game_info.get("price", 0))
-    w_price_adj = 0.2 * w_price
-    pref_audio = preferences.get("preferred_audio_lang", "")
-    full_audio = game_info.get("full_audio_languages", [])
-    audio_val = 1.0 if (pref_audio and pref_audio in full_audio) else 0.0
-    owners_raw = parse_owners(game_info.get("estimated_owners", "0")) * 0.2
-    owners_log = math.log(owners_raw + 1, 10) if owners_raw > 0 else 0.0
-    med_time = game_info.get("median_playtime_forever", 0)
-    max_min = 6000.0
-    med_norm = med_time / max_min if med_time < max_min else 1.0
-    game_tags = game_info.get("tags", {})
-    pref_tags = preferences.get("preferred_tags", [])
-    matched = sum(1 for t in pref_tags if t in game_tags)
-    frac_tags = matched / len(pref_tags) if pref_tags else 0.0
-    score = 0.0
-    score += w_pos * ratio
-    score += w_price_adj * price
-    score += w_audio * audio_val
-    score += w_owners * owners_log
-    score += w_med * med_norm
-    score += w_tags * frac_tags
-    return score
-
-def recommend_games_saw(games_data, preferences, top_n=10, played_game_ids=set()):
-    filtered = []
-    for gid, info in games_data.items():
-        if gid in played_game_ids:
-            continue
-        if game_matches_preferences(info, preferences):
-            filtered.append((gid, info))
-    if not filtered:
-        return []
-    scored = []
-    for (gid, info) in filtered:
-        sc = compute_score_saw(info, preferences)
-        scored.append((gid, sc))
-    scored.sort(key=lambda x: x[1], reverse=True)
-    best = scored[:top_n]
-    results = []
-    for (gid, sc) in best:
-        info = games_data[gid]
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = round(pos / tot, 2) if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        results.append({
-            "id": gid,
-            "name": info.get("name", ""),
-            "score": round(sc, 3),
-            "price": price,
-            "pos_percentage": ratio,
-            "total_reviews": tot,
-            "required_age": info.get("required_age", 0),
-            "estimated_owners": parse_owners(info.get("estimated_owners", "0")),
-            "median_playtime_forever": info.get("median_playtime_forever", 0),
-        })
-    return results
-
-def recommend_games_topsis(games_data, preferences, top_n=10, played_game_ids=set()):
-    candidate_games = []
-    for gid, info in games_data.items():
-        if gid in played_game_ids:
-            continue
-        if game_matches_preferences(info, preferences):
-            candidate_games.append((gid, info))
-    if not candidate_games:
-        return []
-    w_pos = preferences.get("weight_positive_ratio", 0.0)
-    w_price = abs(preferences.get("weight_price", 0.0))
-    w_audio = preferences.get("weight_audio_lang", 0.0)
-    w_owners = preferences.get("weight_owners", 0.0)
-    w_med = preferences.get("weight_med_time", 0.0)
-    w_tags = preferences.get("weight_tags", 0.0)
-    sum_w = w_pos + w_price + w_audio + w_owners + w_med + w_tags
-    if sum_w < 1e-9:
-        sum_w = 1.0
-    cost_benefit = [False, True, False, False, False, False]
-    data_matrix = []
-    game_ids = []
-    pref_audio = preferences.get("preferred_audio_lang", "")
-    pref_tags = preferences.get("preferred_tags", [])
-    for (gid, info) in candidate_games:
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = pos / tot if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        full_audio = info.get("full_audio_languages", [])
-        audio_val = 1.0 if (pref_audio and pref_audio in full_audio) else 0.0
-        ow_raw = parse_owners(info.get("estimated_owners", "0")) * 0.2
-        owners_log = math.log(ow_raw + 1, 10) if ow_raw > 0 else 0.0
-        med_time = info.get("median_playtime_forever", 0)
-        max_min = 6000.0
-        med_norm = med_time / max_min if med_time < max_min else 1.0
-        game_tags = info.get("tags", {})
-        matched = sum(1 for t in pref_tags if t in game_tags)
-        frac_tags = matched / len(pref_tags) if pref_tags else 0.0
-        row = [ratio, price, audio_val, owners_log, med_norm, frac_tags]
-        data_matrix.append(row)
-        game_ids.append(gid)
-    rows = len(data_matrix)
-    cols = 6
-    if rows == 0:
-        return []
-    col_sumsq = [0.0] * cols
-    for r in range(rows):
-        for c in range(cols):
-            col_sumsq[c] += data_matrix[r][c]**2
-    for r in range(rows):
-        for c in range(cols):
-            if col_sumsq[c] > 1e-12:
-                data_matrix[r][c] /= math.sqrt(col_sumsq[c])
-            else:
-                data_matrix[r][c] = 0.0
-    w_array = [
-        w_pos / sum_w,
-        w_price / sum_w,
-        w_audio / sum_w,
-        w_owners / sum_w,
-        w_med / sum_w,
-        w_tags / sum_w
-    ]
-    for r in range(rows):
-        for c in range(cols):
-            data_matrix[r][c] *= w_array[c]
-    ideal = [0.0] * cols
-    anti_ideal = [0.0] * cols
-    for c in range(cols):
-        col_vals = [data_matrix[r][c] for r in range(rows)]
-        if cost_benefit[c] == False:
-            ideal[c] = max(col_vals)
-            anti_ideal[c] = min(col_vals)
-        else:
-            ideal[c] = min(col_vals)
-            anti_ideal[c] = max(col_vals)
-    distances = []
-    for r in range(rows):
-        dist_plus = 0.0
-        dist_minus = 0.0
-        for c in range(cols):
-            dist_plus += (data_matrix[r][c] - ideal[c])**2
-            dist_minus += (data_matrix[r][c] - anti_ideal[c])**2
-        dist_plus = math.sqrt(dist_plus)
-        dist_minus = math.sqrt(dist_minus)
-        ci = dist_minus / (dist_plus + dist_minus) if (dist_plus + dist_minus) > 1e-12 else 0.0
-        distances.append(ci)
-    combined = list(zip(game_ids, distances))
-    combined.sort(key=lambda x: x[1], reverse=True)
-    best = combined[:top_n]
-    results = []
-    for (gid, sc) in best:
-        info = games_data[gid]
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = round(pos / tot, 2) if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        results.append({
-            "id": gid,
-            "name": info.get("name", ""),
-            "score": round(sc, 3),
-            "price": price,
-            "pos_percentage": ratio,
-            "total_reviews": tot,
-            "estimated_owners": parse_owners(info.get("estimated_owners", "0")),
-            "median_playtime_forever": info.get("median_playtime_forever", 0)
-        })
-    return results
-
-def recommend_games_wpm(games_data, preferences, top_n=10, played_game_ids=set()):
-    candidate_games = []
-    for gid, info in games_data.items():
-        if gid in played_game_ids:
-            continue
-        if game_matches_preferences(info, preferences):
-            candidate_games.append((gid, info))
-    if not candidate_games:
-        return []
-    w_pos = preferences.get("weight_positive_ratio", 0.0)
-    w_price = abs(preferences.get("weight_price", 0.0))
-    w_audio = preferences.get("weight_audio_lang", 0.0)
-    w_owners = preferences.get("weight_owners", 0.0)
-    w_med = preferences.get("weight_med_time", 0.0)
-    w_tags = preferences.get("weight_tags", 0.0)
-    sum_w = w_pos + w_price + w_audio + w_owners + w_med + w_tags
-    if sum_w < 1e-9:
-        sum_w = 1.0
-    cost_benefit = [False, True, False, False, False, False]
-    data_matrix = []
-    game_ids = []
-    pref_audio = preferences.get("preferred_audio_lang", "")
-    pref_tags = preferences.get("preferred_tags", [])
-    for (gid, info) in candidate_games:
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = pos / tot if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        full_audio = info.get("full_audio_languages", [])
-        audio_val = 1.0 if (pref_audio and pref_audio in full_audio) else 0.0
-        ow_raw = parse_owners(info.get("estimated_owners", "0")) * 0.2
-        owners_log = math.log(ow_raw + 1, 10) if ow_raw > 0 else 0.0
-        med_time = info.get("median_playtime_forever", 0)
-        max_min = 6000.0
-        med_norm = med_time / max_min if med_time < max_min else 1.0
-        game_tags = info.get("tags", {})
-        matched = sum(1 for t in pref_tags if t in game_tags)
-        frac_tags = matched / len(pref_tags) if pref_tags else 0.0
-        row = [ratio, price, audio_val, owners_log, med_norm, frac_tags]
-        data_matrix.append(row)
-        game_ids.append(gid)
-    rows = len(data_matrix)
-    cols = 6
-    if rows == 0:
-        return []
-    col_min = [float("inf")] * cols
-    col_max = [0.0] * cols
-    for r in range(rows):
-        for c in range(cols):
-            val = data_matrix[r][c]
-            if val < col_min[c]:
-                col_min[c] = val
-            if val > col_max[c]:
-                col_max[c] = val
-    norm_matrix = []
-    for r in range(rows):
-        row_norm = []
-        for c in range(cols):
-            val = data_matrix[r][c]
-            if cost_benefit[c] == False:
-                denom = col_max[c] if col_max[c] > 1e-12 else 1e-12
-                row_norm.append(val / denom)
-            else:
-                nom = col_min[c] if col_min[c] < float("inf") else 1e-12
-                if val > 1e-12:
-                    row_norm.append(nom / val)
-                else:
-                    row_norm.append(0.0)
-        norm_matrix.append(row_norm)
-    w_rel = [
-        w_pos / sum_w,
-        w_price / sum_w,
-        w_audio / sum_w,
-        w_owners / sum_w,
-        w_med / sum_w,
-        w_tags / sum_w
-    ]
-    scored = []
-    for r in range(rows):
-        sum_log = 0.0
-        for c in range(cols):
-            valn = norm_matrix[r][c]
-            if valn < 1e-12:
-                sum_log = -9999999.0
-                break
-            sum_log += w_rel[c] * math.log(valn)
-        score = math.exp(sum_log) if sum_log > -9999999.0 else 0.0
-        scored.append((game_ids[r], score))
-    scored.sort(key=lambda x: x[1], reverse=True)
-    best = scored[:top_n]
-    results = []
-    for (gid, sc) in best:
-        info = games_data[gid]
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = round(pos / tot, 2) if tot > 0 else 0.0
-        p = parse_price(info.get("price", 0))
-        results.append({
-            "id": gid,
-            "name": info.get("name", ""),
-            "score": round(sc, 3),
-            "price": p,
-            "pos_percentage": ratio,
-            "total_reviews": tot,
-            "estimated_owners": parse_owners(info.get("estimated_owners", "0")),
-            "median_playtime_forever": info.get("median_playtime_forever", 0)
-        })
-    return results
-
-def recommend_games_vikor(games_data, preferences, top_n=10, played_game_ids=set()):
-    candidate_games = []
-    for gid, info in games_data.items():
-        if gid in played_game_ids:
-            continue
-        if game_matches_preferences(info, preferences):
-            candidate_games.append((gid, info))
-    if not candidate_games:
-        return []
-    w_pos = preferences.get("weight_positive_ratio", 0.0)
-    w_price = abs(preferences.get("weight_price", 0.0))
-    w_audio = preferences.get("weight_audio_lang", 0.0)
-    w_owners = preferences.get("weight_owners", 0.0)
-    w_med = preferences.get("weight_med_time", 0.0)
-    w_tags = preferences.get("weight_tags", 0.0)
-    sum_w = w_pos + w_price + w_audio + w_owners + w_med + w_tags
-    if sum_w < 1e-9:
-        sum_w = 1.0
-    cost_benefit = [False, True, False, False, False, False]
-    pref_audio = preferences.get("preferred_audio_lang", "")
-    pref_tags = preferences.get("preferred_tags", [])
-    data_matrix = []
-    game_ids = []
-    for (gid, info) in candidate_games:
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = pos / tot if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        full_audio = info.get("full_audio_languages", [])
-        audio_val = 1.0 if (pref_audio and pref_audio in full_audio) else 0.0
-        ow_raw = parse_owners(info.get("estimated_owners", "0")) * 0.2
-        owners_log = math.log(ow_raw + 1, 10) if ow_raw > 0 else 0.0
-        med_time = info.get("median_playtime_forever", 0)
-        max_min = 6000.0
-        med_norm = med_time / max_min if med_time < max_min else 1.0
-        game_tags = info.get("tags", {})
-        matched = sum(1 for t in pref_tags if t in game_tags)
-        frac_tags = matched / len(pref_tags) if pref_tags else 0.0
-        row = [ratio, price, audio_val, owners_log, med_norm, frac_tags]
-        data_matrix.append(row)
-        game_ids.append(gid)
-    rows = len(data_matrix)
-    cols = 6
-    if rows == 0:
-        return []
-    f_star = [0.0] * cols
-    f_minus = [0.0] * cols
-    for c in range(cols):
-        col_vals = [data_matrix[r][c] for r in range(rows)]
-        if cost_benefit[c] == False:
-            f_star[c] = max(col_vals)
-            f_minus[c] = min(col_vals)
-        else:
-            f_star[c] = min(col_vals)
-            f_minus[c] = max(col_vals)
-    w_rel = [
-        w_pos / sum_w,
-        w_price / sum_w,
-        w_audio / sum_w,
-        w_owners / sum_w,
-        w_med / sum_w,
-        w_tags / sum_w
-    ]
-    S_list = []
-    R_list = []
-    for r in range(rows):
-        S_val = 0.0
-        R_val = 0.0
-        for c in range(cols):
-            diff_num = abs(f_star[c] - data_matrix[r][c])
-            diff_den = abs(f_star[c] - f_minus[c]) if abs(f_star[c] - f_minus[c]) > 1e-12 else 1.0
-            local_frac = diff_num / diff_den
-            local_val = w_rel[c] * local_frac
-            S_val += local_val
-            if local_val > R_val:
-                R_val = local_val
-        S_list.append(S_val)
-        R_list.append(R_val)
-    S_star, S_minus = min(S_list), max(S_list)
-    R_star, R_minus = min(R_list), max(R_list)
-    v = 0.5
-    Q_list = []
-    for i in range(rows):
-        si = S_list[i]
-        ri = R_list[i]
-        FS = (si - S_star) / (S_minus - S_star) if (S_minus - S_star) > 1e-12 else 0.0
-        FR = (ri - R_star) / (R_minus - R_star) if (R_minus - R_star) > 1e-12 else 0.0
-        Qi = v * FS + (1.0 - v) * FR
-        Q_list.append(Qi)
-    combined = list(zip(game_ids, Q_list))
-    combined.sort(key=lambda x: x[1], reverse=False)
-    best = combined[:top_n]
-    results = []
-    for (gid, Qv) in best:
-        info = games_data[gid]
-        pos = info.get("positive", 0)
-        neg = info.get("negative", 0)
-        tot = pos + neg
-        ratio = round(pos / tot, 2) if tot > 0 else 0.0
-        price = parse_price(info.get("price", 0))
-        results.append({
-            "id": gid,
-            "name": info.get("name", ""),
-            "score": round(Qv, 4),
-            "price": price,
-            "pos_percentage": ratio,
-            "total_reviews": tot,
-            "estimated_owners": parse_owners(info.get("estimated_owners", "0")),
-            "median_playtime_forever": info.get("median_playtime_forever", 0)
-        })
-    return results
-
 class GameRecommenderApp(tk.Tk):
-    def __init__(self, resources_data, games_data):
+    def __init__(self, resources_data, catalog):
         super().__init__()
         self.title("Game Recommender (Scalona aplikacja)")
         self.geometry("1300x950")
         self.all_subtitle_langs = resources_data["languages"]
         self.all_audio_langs = resources_data["audio_languages"]
         self.all_tags = resources_data["tags"]
-        self.games_data = games_data
+        self.resources_data = resources_data
+        self.catalog = catalog
         self.played_game_ids = set()
         self.selected_tags = []
         self.recommended_games_for_plot = []
+        self.search_job = None
+        self.weights_job = None
+        self.auto_recommend = False
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.worker_events = queue.Queue()
+        self.request_counter = 0
+        self.active_request = None
+        self.poll_job = None
+        self.delta_pending = False
+        self.last_profile = None
+        self.diagnostics_window = None
         self.build_gui()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def build_gui(self):
         left_frame = tk.Frame(self)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=10, pady=10)
         tk.Label(left_frame, text="Wyszukaj grę po nazwie:").pack(anchor=tk.W)
         self.search_var = tk.StringVar()
-        tk.Entry(left_frame, textvariable=self.search_var, width=30).pack(fill=tk.X, pady=5)
+        search_entry = tk.Entry(left_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(fill=tk.X, pady=5)
+        search_entry.bind("<KeyRelease>", self.schedule_search)
         tk.Button(left_frame, text="Szukaj", command=self.search_games).pack(pady=5)
         self.search_results_list = tk.Listbox(left_frame, height=15, width=50)
         self.search_results_list.pack(fill=tk.BOTH, expand=True)
@@ -511,6 +67,7 @@ class GameRecommenderApp(tk.Tk):
         self.played_games_list = tk.Listbox(left_frame, height=10, width=50)
         self.played_games_list.pack(fill=tk.BOTH, expand=True)
         tk.Button(left_frame, text="Usuń z ogranych", command=self.remove_from_played).pack(pady=5)
+        tk.Button(left_frame, text="Wczytaj zmiany w danych", command=self.load_data_changes).pack(pady=5)
         right_frame = tk.Frame(self)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
         method_frame = tk.LabelFrame(right_frame, text="Metoda wielokryterialna")
@@ -534,9 +91,9 @@ class GameRecommenderApp(tk.Tk):
         tk.Entry(prefs_frame, textvariable=self.min_pos_ratio_var, width=6).grid(row=2, column=1, sticky=tk.W)
         tk.Label(prefs_frame, text="Język napisów (obowiązkowy):").grid(row=3, column=0, sticky=tk.W)
         self.sub_lang_var = tk.StringVar(value="")
-        sub_combo = ttk.Combobox(prefs_frame, textvariable=self.sub_lang_var,
-                                 values=self.all_subtitle_langs, state="readonly", width=15)
-        sub_combo.grid(row=3, column=1, sticky=tk.W)
+        self.sub_combo = ttk.Combobox(prefs_frame, textvariable=self.sub_lang_var,
+                                      values=self.all_subtitle_langs, state="readonly", width=15)
+        self.sub_combo.grid(row=3, column=1, sticky=tk.W)
         tk.Label(prefs_frame, text="Platformy:").grid(row=4, column=0, sticky=tk.W)
         self.win_var = tk.BooleanVar(value=True)
         self.mac_var = tk.BooleanVar(value=False)
@@ -547,32 +104,38 @@ class GameRecommenderApp(tk.Tk):
         weighting_frame = tk.LabelFrame(right_frame, text="Wagi kryteriów")
         weighting_frame.pack(fill=tk.X, padx=5, pady=5)
         tk.Label(weighting_frame, text="Waga pozytywnych recenzji:").grid(row=0, column=0, sticky=tk.W)
-        self.scale_pos = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_pos = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_pos.set(5)
         self.scale_pos.grid(row=0, column=1, sticky=tk.W)
         tk.Label(weighting_frame, text="Waga ceny (ujemna):").grid(row=1, column=0, sticky=tk.W)
-        self.scale_price = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_price = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_price.set(5)
         self.scale_price.grid(row=1, column=1, sticky=tk.W)
         tk.Label(weighting_frame, text="Pref. język audio:").grid(row=0, column=2, sticky=tk.W)
         self.audio_lang_var = tk.StringVar(value="")
-        audio_combo = ttk.Combobox(weighting_frame, textvariable=self.audio_lang_var,
-                                   values=self.all_audio_langs, state="readonly", width=15)
-        audio_combo.grid(row=0, column=3, sticky=tk.W)
+        self.audio_combo = ttk.Combobox(weighting_frame, textvariable=self.audio_lang_var,
+                                        values=self.all_audio_langs, state="readonly", width=15)
+        self.audio_combo.grid(row=0, column=3, sticky=tk.W)
         tk.Label(weighting_frame, text="Waga języka audio:").grid(row=1, column=2, sticky=tk.W)
-        self.scale_audio = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_audio = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_audio.set(0)
         self.scale_audio.grid(row=1, column=3, sticky=tk.W)
         tk.Label(weighting_frame, text="Waga popularności:").grid(row=2, column=0, sticky=tk.W)
-        self.scale_owners = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_owners = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_owners.set(0)
         self.scale_owners.grid(row=2, column=1, sticky=tk.W)
         tk.Label(weighting_frame, text="Waga długości gry:").grid(row=2, column=2, sticky=tk.W)
-        self.scale_med = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_med = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_med.set(0)
         self.scale_med.grid(row=2, column=3, sticky=tk.W)
         tk.Label(weighting_frame, text="Waga tagów:").grid(row=3, column=0, sticky=tk.W)
-        self.scale_tags = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL)
+        self.scale_tags = tk.Scale(weighting_frame, from_=0, to=10, resolution=1, orient=tk.HORIZONTAL,
+                                   command=self.on_weights_changed)
         self.scale_tags.set(5)
         self.scale_tags.grid(row=3, column=1, sticky=tk.W)
         tags_frame = tk.LabelFrame(right_frame, text="Tagi (wyszukaj i dodaj)")
@@ -596,6 +159,13 @@ class GameRecommenderApp(tk.Tk):
         self.plot_button.pack(side=tk.LEFT, padx=5)
         export_button = tk.Button(button_frame, text="Eksportuj do Excela", command=self.export_to_excel)
         export_button.pack(side=tk.LEFT, padx=5)
+        self.progress_bar = ttk.Progressbar(button_frame, length=150, maximum=1.0)
+        self.progress_bar.pack(side=tk.LEFT, padx=5)
+        self.status_var = tk.StringVar(value="")
+        tk.Label(button_frame, textvariable=self.status_var, width=25, anchor=tk.W).pack(side=tk.LEFT, padx=5)
+        self.profiling_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(button_frame, text="Profilowanie", variable=self.profiling_var).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Diagnostyka", command=self.show_diagnostics).pack(side=tk.LEFT, padx=5)
         columns = ("LP", "Nazwa", "ID", "Wynik", "Cena", "Recenzje", "% Pozytywnych", "Popularność", "Długość gry")
         self.result_tree = ttk.Treeview(right_frame, columns=columns, show="headings", height=15)
         for col in columns:
@@ -603,18 +173,20 @@ class GameRecommenderApp(tk.Tk):
             self.result_tree.column(col, minwidth=50, width=100, anchor=tk.CENTER)
         self.result_tree.pack(fill=tk.BOTH, expand=True)
 
+    def schedule_search(self, event=None):
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+        self.search_job = self.after(SEARCH_DEBOUNCE_MS, self.search_games)
+
     def search_games(self, event=None):
-        query = self.search_var.get().strip().lower()
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+            self.search_job = None
+        query = self.search_var.get().strip()
         self.search_results_list.delete(0, tk.END)
         if not query:
             return
-        results = []
-        for gid, info in self.games_data.items():
-            nm = info.get("name", "").lower()
-            if query in nm:
-                results.append((gid, info.get("name", "")))
-        results = results[:100]
-        for (gid, name) in results:
+        for (gid, name) in self.catalog.search_names(query, limit=100):
             self.search_results_list.insert(tk.END, f"{gid} - {name}")
 
     def add_to_played(self):
@@ -656,7 +228,7 @@ class GameRecommenderApp(tk.Tk):
             gid = text_line.split(" - ", 1)[0].strip()
         except IndexError:
             return
-        game_info = self.games_data.get(gid, {})
+        game_info = self.catalog.details(gid)
         if not game_info:
             return
         details_window = tk.Toplevel(self)
@@ -742,17 +314,181 @@ class GameRecommenderApp(tk.Tk):
             "preferred_audio_lang": pref_audio,
             "preferred_tags": pref_tags
         }
-        played = self.played_game_ids
-        if method == "SAW":
-            recommended = recommend_games_saw(self.games_data, preferences, top_n=10, played_game_ids=played)
-        elif method == "TOPSIS":
-            recommended = recommend_games_topsis(self.games_data, preferences, top_n=10, played_game_ids=played)
-        elif method == "WPM":
-            recommended = recommend_games_wpm(self.games_data, preferences, top_n=10, played_game_ids=played)
-        elif method == "VIKOR":
-            recommended = recommend_games_vikor(self.games_data, preferences, top_n=10, played_game_ids=played)
+        self.auto_recommend = True
+        self.submit_recommendation(method, preferences)
+
+    def on_weights_changed(self, value=None):
+        if not self.auto_recommend:
+            return
+        if self.weights_job is not None:
+            self.after_cancel(self.weights_job)
+        self.weights_job = self.after(WEIGHTS_DEBOUNCE_MS, self.do_recommendation)
+
+    def submit_recommendation(self, method, preferences):
+        if self.weights_job is not None:
+            self.after_cancel(self.weights_job)
+            self.weights_job = None
+        if self.active_request is not None:
+            _, future, cancel_event = self.active_request
+            cancel_event.set()
+            future.cancel()
+        self.request_counter += 1
+        cancel_event = threading.Event()
+        played = set(self.played_game_ids)
+        profiler = Profiler() if self.profiling_var.get() else NULL_PROFILER
+        future = self.executor.submit(self.run_recommendation, self.request_counter, method,
+                                      preferences, played, cancel_event, profiler)
+        self.active_request = (self.request_counter, future, cancel_event)
+        self.progress_bar["value"] = 0.0
+        self.status_var.set("Obliczanie...")
+        if self.poll_job is None:
+            self.poll_job = self.after(RESULT_POLL_MS, self.poll_recommendation)
+
+    def run_recommendation(self, request_id, method, preferences, played, cancel_event, profiler):
+        """
+        Wykonywane w wątku roboczym - nie dotyka widżetów, tylko wysyła zdarzenia do kolejki.
+        """
+        def progress(stage, fraction):
+            if cancel_event.is_set():
+                raise RecommendationCancelled()
+            self.worker_events.put(("progress", request_id, (stage, fraction)))
+
+        recommender = RECOMMENDERS.get(method)
+        try:
+            recommended = recommender(self.catalog, preferences, top_n=10, played_game_ids=played,
+                                      progress=progress, profiler=profiler) if recommender else []
+        except RecommendationCancelled:
+            return
+        except Exception as e:
+            self.worker_events.put(("error", request_id, e))
+            return
+        if profiler.enabled:
+            self.worker_events.put(("profile", request_id, (method, profiler)))
+        self.worker_events.put(("done", request_id, recommended))
+
+    def load_data_changes(self):
+        if self.delta_pending:
+            return
+        path = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            upserts, removed = load_delta(path)
+        except Exception as e:
+            messagebox.showerror("Błąd", f"Nie udało się wczytać pliku zmian: {e}")
+            return
+        self.delta_pending = True
+        self.status_var.set("Nanoszenie zmian...")
+        self.executor.submit(self.run_delta, upserts, removed)
+        if self.poll_job is None:
+            self.poll_job = self.after(RESULT_POLL_MS, self.poll_recommendation)
+
+    def run_delta(self, upserts, removed):
+        """
+        Wykonywane w wątku roboczym, więc nie przeplata się z obliczaniem rankingu.
+        Po katalogu w pamięci zapisuje zmiany do games_fixed.json i resources.json.
+        """
+        try:
+            counts = self.catalog.apply_delta(upserts, removed)
+            resources = update_resources(self.resources_data, upserts)
+            save_resources(resources, "data/resources.json")
+            games_path = "data/games_fixed.json"
+            if os.path.exists(games_path):
+                apply_to_games_file(games_path, games_path + ".tmp", upserts, removed)
+                os.replace(games_path + ".tmp", games_path)
+        except Exception as e:
+            self.worker_events.put(("delta_error", None, e))
+            return
+        self.worker_events.put(("delta", None, (counts, resources)))
+
+    def apply_resources(self, resources):
+        self.resources_data = resources
+        self.all_subtitle_langs = resources["languages"]
+        self.all_audio_langs = resources["audio_languages"]
+        self.all_tags = resources["tags"]
+        self.sub_combo["values"] = self.all_subtitle_langs
+        self.audio_combo["values"] = self.all_audio_langs
+
+    def poll_recommendation(self):
+        self.poll_job = None
+        current_id = self.active_request[0] if self.active_request else None
+        while True:
+            try:
+                kind, request_id, payload = self.worker_events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "delta":
+                self.delta_pending = False
+                (added, changed, removed), resources = payload
+                self.apply_resources(resources)
+                self.status_var.set(f"Zmiany: +{added} ~{changed} -{removed}")
+                continue
+            if kind == "delta_error":
+                self.delta_pending = False
+                self.status_var.set("Błąd")
+                messagebox.showerror("Błąd", f"Nie udało się nanieść zmian: {payload}")
+                continue
+            if request_id != current_id:
+                continue
+            if kind == "progress":
+                stage, fraction = payload
+                self.progress_bar["value"] = fraction
+                self.status_var.set(f"Obliczanie: {stage} ({int(fraction * 100)}%)")
+            elif kind == "profile":
+                self.last_profile = payload
+                self.refresh_diagnostics()
+            elif kind == "done":
+                self.active_request = None
+                self.status_var.set("Gotowe")
+                self.show_recommendations(payload)
+            elif kind == "error":
+                self.active_request = None
+                self.status_var.set("Błąd")
+                messagebox.showerror("Błąd", f"Wystąpił problem podczas obliczeń: {payload}")
+        if self.active_request is not None or self.delta_pending:
+            self.poll_job = self.after(RESULT_POLL_MS, self.poll_recommendation)
+
+    def show_diagnostics(self):
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.lift()
+            return
+        self.diagnostics_window = tk.Toplevel(self)
+        self.diagnostics_window.title("Diagnostyka rekomendacji")
+        self.diagnostics_window.geometry("450x300")
+        self.diagnostics_text = tk.Text(self.diagnostics_window, height=12, width=55, font=("Courier", 10))
+        self.diagnostics_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        tk.Button(self.diagnostics_window, text="Zapisz ślad JSON", command=self.save_trace).pack(pady=5)
+        self.refresh_diagnostics()
+
+    def refresh_diagnostics(self):
+        if self.diagnostics_window is None or not self.diagnostics_window.winfo_exists():
+            return
+        if self.last_profile is None:
+            text = "Brak danych - włącz \"Profilowanie\" i uruchom rekomendację."
         else:
-            recommended = []
+            method, profiler = self.last_profile
+            text = f"Metoda: {method}\n\n{profiler.format()}"
+        self.diagnostics_text.config(state=tk.NORMAL)
+        self.diagnostics_text.delete("1.0", tk.END)
+        self.diagnostics_text.insert(tk.END, text)
+        self.diagnostics_text.config(state=tk.DISABLED)
+
+    def save_trace(self):
+        if self.last_profile is None:
+            messagebox.showwarning("Brak danych", "Brak profilu do zapisania.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not file_path:
+            return
+        self.last_profile[1].dump(file_path)
+
+    def on_close(self):
+        if self.active_request is not None:
+            self.active_request[2].set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def show_recommendations(self, recommended):
         for row in self.result_tree.get_children():
             self.result_tree.delete(row)
         self.recommended_games_for_plot.clear()
@@ -825,24 +561,12 @@ class GameRecommenderApp(tk.Tk):
         plt.colorbar(sc, label="Wynik (score)")
         plt.show()
 
-def extract_zip(zip_path, extract_to):
-    print(f"Rozpoczynam wypakowywanie pliku {zip_path}...")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
-    print(f"Wypakowywanie zakończone. Pliki zostały wypakowane do folderu {extract_to}.")
-
 def main():
-    zip_path = "data/games_fixed.zip"
-    json_path = "data/games_fixed.json"
-    if not os.path.exists(json_path):
-        if os.path.exists(zip_path):
-            extract_zip(zip_path, "data")
-        else:
-            print(f"Plik {zip_path} nie istnieje. Sprawdź, czy znajduje się w folderze 'data'.")
-            return
     resources_data = load_resources("data/resources.json")
-    games_data = load_games(json_path)
-    app = GameRecommenderApp(resources_data, games_data)
+    catalog = open_catalog("data")
+    if catalog is None:
+        return
+    app = GameRecommenderApp(resources_data, catalog)
     app.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+from catalog import PLATFORMS
+from snapshot import open_catalog
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import top_k
+
+BLOCK_ELEMENTS = 1 << 22
+
+class ProfileBatch:
+    """
+    Preferencje N profili ułożone w wektory: wagi SAW, progi filtrów twardych
+    oraz wektory terminów (język audio, tagi, obowiązkowy język napisów)
+    nad słownikami katalogu, zawężone do terminów użytych przez którykolwiek profil.
+    """
+
+    def __init__(self, catalog, profiles):
+        n = len(profiles)
+        preferences = [p["preferences"] for p in profiles]
+        get = lambda key, default: np.array([pref.get(key, default) for pref in preferences], dtype=float)
+        self.w_pos = get("weight_positive_ratio", 0.0)
+        self.w_price_adj = 0.2 * get("weight_price", 0.0)
+        self.w_audio = get("weight_audio_lang", 0.0)
+        self.w_owners = get("weight_owners", 0.0)
+        self.w_med = get("weight_med_time", 0.0)
+        self.w_tags = get("weight_tags", 0.0)
+        self.max_price = np.array([np.inf if pref.get("max_price") is None else pref["max_price"]
+                                   for pref in preferences], dtype=float)
+        self.min_reviews = get("min_total_reviews", 0)
+        self.min_ratio = get("min_positive_ratio", 0.0)
+        required = [{p.lower() for p in pref.get("required_platforms", [])} for pref in preferences]
+        unknown = set().union(*required) - set(PLATFORMS)
+        if unknown:
+            raise ValueError(f"Nieznane platformy: {', '.join(sorted(unknown))}")
+        self.platform_names = list(PLATFORMS)
+        self.platforms = np.array([[p in req for p in self.platform_names] for req in required],
+                                  dtype=bool).reshape(n, len(self.platform_names))
+        audio = catalog.terms["full_audio_languages"]
+        tags = catalog.terms["tags"]
+        languages = catalog.terms["supported_languages"]
+        self.audio_vectors = np.array([audio.term_vector([pref["preferred_audio_lang"]])
+                                       if pref.get("preferred_audio_lang") else np.zeros(len(audio.vocab))
+                                       for pref in preferences]).reshape(n, len(audio.vocab))
+        self.tag_vectors = np.array([tags.term_vector(pref.get("preferred_tags", []))
+                                     for pref in preferences]).reshape(n, len(tags.vocab))
+        self.tag_counts = np.array([len(pref.get("preferred_tags", [])) for pref in preferences], dtype=float)
+        self.has_tags = self.tag_counts > 0
+        self.has_mandatory = np.array([bool(pref.get("mandatory_sub_lang", "")) for pref in preferences])
+        self.language_vectors = np.array([languages.term_vector([pref["mandatory_sub_lang"]])
+                                          if pref.get("mandatory_sub_lang") else np.zeros(len(languages.vocab))
+                                          for pref in preferences]).reshape(n, len(languages.vocab))
+        self.audio_terms = np.flatnonzero(self.audio_vectors.any(axis=0))
+        self.tag_terms = np.flatnonzero(self.tag_vectors.any(axis=0))
+        self.language_terms = np.flatnonzero(self.language_vectors.any(axis=0))
+        tag_weights = np.divide(self.w_tags, self.tag_counts, out=np.zeros(n), where=self.has_tags)
+        self.weight_matrix = np.hstack((
+            np.column_stack((self.w_pos, self.w_price_adj, self.w_owners, self.w_med)),
+            self.w_audio[:, None] * self.audio_vectors[:, self.audio_terms],
+            tag_weights[:, None] * self.tag_vectors[:, self.tag_terms],
+        ))
+        self.unsatisfiable = self.has_mandatory & ~self.language_vectors.any(axis=1)
+        self.requirement_matrix = np.hstack((self.platforms, self.language_vectors[:, self.language_terms] > 0),
+                                            dtype=np.float32)
+        played = [(i, catalog.row_of[gid]) for i, p in enumerate(profiles)
+                  for gid in p.get("played_game_ids", []) if gid in catalog.row_of]
+        played = np.array(played, dtype=np.int64).reshape(-1, 2)
+        order = np.argsort(played[:, 1], kind="stable")
+        self.played_profiles = played[order, 0]
+        self.played_rows = played[order, 1]
+
+    def __len__(self):
+        return len(self.w_pos)
+
+def score_block(catalog, batch, start, stop):
+    """
+    Macierz ocen SAW (N x (stop - start)) dla wierszy katalogu start..stop-1
+    jako jeden iloczyn macierzy: wagi profili x (kolumny stałe + wskaźniki
+    terminów), oraz maska gier odrzuconych przez filtry twarde profilu.
+    Brakujące platformy i język napisów są liczone drugim iloczynem
+    (wymagania profilu x braki gry).
+    """
+    col = slice(start, stop)
+    ratio = catalog.ratio[col]
+    criteria = np.hstack((
+        np.column_stack((ratio, catalog.price[col], catalog.owners_log[col], catalog.med_norm[col])),
+        catalog.terms["full_audio_languages"].dense_block(start, stop, batch.audio_terms),
+        catalog.terms["tags"].dense_block(start, stop, batch.tag_terms),
+    ))
+    score = batch.weight_matrix @ criteria.T
+
+    drop = catalog.filter_price[col] > batch.max_price[:, None]
+    drop |= catalog.total_reviews[col] < batch.min_reviews[:, None]
+    drop |= ratio < batch.min_ratio[:, None]
+    missing = np.hstack((
+        np.column_stack([~catalog.platform_column(p)[col] for p in batch.platform_names]),
+        catalog.terms["supported_languages"].dense_block(start, stop, batch.language_terms) == 0,
+    ), dtype=np.float32)
+    drop |= batch.requirement_matrix @ missing.T > 0
+    drop[batch.unsatisfiable] = True
+    if catalog.removed_count:
+        drop |= ~catalog.alive[col]
+    lo, hi = np.searchsorted(batch.played_rows, [start, stop])
+    drop[batch.played_profiles[lo:hi], batch.played_rows[lo:hi] - start] = True
+    return score, drop
+
+def merge_top(catalog, top_n, best, profiles, rows, scores):
+    """
+    Łączy dotychczasowe najlepsze trafienia (profil, wiersz, ocena) z nowymi
+    kandydatami i zostawia po top_n na profil - jedno sortowanie leksykograficzne
+    (profil, -ocena, kolejność id) zamiast pętli po profilach.
+    """
+    profiles = np.concatenate((best[0], profiles))
+    rows = np.concatenate((best[1], rows))
+    scores = np.concatenate((best[2], scores))
+    order = np.lexsort((catalog.id_rank[rows], -scores, profiles))
+    profiles, rows, scores = profiles[order], rows[order], scores[order]
+    group_start = np.flatnonzero(np.r_[True, profiles[1:] != profiles[:-1]])
+    first_in_group = np.repeat(group_start, np.diff(np.r_[group_start, len(profiles)]))
+    keep = np.arange(len(profiles)) - first_in_group < top_n
+    return profiles[keep], rows[keep], scores[keep]
+
+def recommend_batch_saw(catalog, profiles, top_n=10, block_elements=BLOCK_ELEMENTS, progress=None):
+    """
+    Rekomendacje SAW dla wielu profili w jednym przebiegu po katalogu.
+    profiles to lista słowników {"preferences": {...}, "played_game_ids": [...]}.
+    Macierz ocen jest liczona blokami kolumn tak, by miała najwyżej
+    block_elements elementów; z każdego bloku do scalania trafiają tylko
+    gry nie gorsze od top_n-tej w wierszu, więc pamięć nie zależy od liczby gier.
+    Rankingi odpowiadają recommend_games_saw z dokładnością do zaokrągleń
+    zmiennoprzecinkowych w sumie ważonej.
+    """
+    if not profiles:
+        return []
+    batch = ProfileBatch(catalog, profiles)
+    n_games = len(catalog)
+    block = max(1, block_elements // max(1, len(batch)))
+    best = (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([]))
+    bound = np.full(len(batch), -np.inf)
+    for start in range(0, n_games, block):
+        stop = min(start + block, n_games)
+        scores, drop = score_block(catalog, batch, start, stop)
+        need = np.flatnonzero(bound == -np.inf)
+        if len(need) and stop - start > top_n:
+            needed = np.where(drop[need], -np.inf, scores[need])
+            bound[need] = np.partition(needed, stop - start - top_n, axis=1)[:, stop - start - top_n]
+        candidates = scores >= bound[:, None]
+        candidates &= ~drop
+        profile_idx, local = np.nonzero(candidates)
+        best = merge_top(catalog, top_n, best, profile_idx, local + start, scores[profile_idx, local])
+        counts = np.bincount(best[0], minlength=len(batch))
+        last = np.cumsum(counts) - 1
+        bound = np.where(counts == top_n, best[2][np.maximum(last, 0)] if len(best[2]) else -np.inf, -np.inf)
+        if progress is not None:
+            progress(stop, n_games)
+    results = [[] for _ in range(len(batch))]
+    for i, r, value in zip(*best):
+        rec = catalog.result_row(r, round(float(value), 3))
+        rec["required_age"] = catalog.details(rec["id"]).get("required_age", 0)
+        results[i].append(rec)
+    return results
+
+def read_profiles(path):
+    """
+    Wiersz JSONL to {"profile_id": ..., "preferences": {...}, "played_game_ids": [...]}
+    albo sam słownik preferencji.
+    """
+    profiles = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if "preferences" not in record:
+                record = {"preferences": record}
+            record.setdefault("profile_id", line_no)
+            profiles.append(record)
+    return profiles
+
+def main():
+    parser = argparse.ArgumentParser(description="Wsadowe rekomendacje SAW dla wielu profili (JSONL -> JSONL).")
+    parser.add_argument("profiles", help="plik JSONL z profilami")
+    parser.add_argument("output", help="plik JSONL z wynikami")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--profiles-per-pass", type=int, default=1024,
+                        help="ile profili jest ocenianych w jednym przebiegu po katalogu")
+    parser.add_argument("--block-elements", type=int, default=BLOCK_ELEMENTS,
+                        help="maksymalny rozmiar bloku macierzy ocen (liczba elementów)")
+    args = parser.parse_args()
+    catalog = open_catalog(args.data_dir)
+    if catalog is None:
+        return
+    profiles = read_profiles(args.profiles)
+    start = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8") as out:
+        for first in range(0, len(profiles), args.profiles_per_pass):
+            chunk = profiles[first:first + args.profiles_per_pass]
+            for profile, recs in zip(chunk, recommend_batch_saw(catalog, chunk, args.top, args.block_elements)):
+                out.write(json.dumps({"profile_id": profile["profile_id"], "results": recs}, ensure_ascii=False) + "\n")
+            print(f"Profile: {first + len(chunk)}/{len(profiles)}")
+    elapsed = time.perf_counter() - start
+    print(f"Zapisano wyniki {len(profiles)} profili do {args.output} w {elapsed:.2f} s "
+          f"({len(profiles) / max(elapsed, 1e-9):.1f} profili/s)")
+
+if __name__ == "__main__":
+    main()
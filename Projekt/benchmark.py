@@ -0,0 +1,378 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import numpy as np
+from catalog import GameCatalog, TermColumn, PLATFORMS, load_games
+from recommender import BENEFIT, COST_BENEFIT, RECOMMENDERS, relative_weights
+from profiling import Profiler
+from mcdm_kernels import ColumnStats, topsis_closeness, wpm_scores, vikor_scores, top_k
+
+BENCH_PREFERENCES = {
+    "max_price": 100.0,
+    "min_total_reviews": 0,
+    "min_positive_ratio": 0.0,
+    "mandatory_sub_lang": "",
+    "required_platforms": ["windows"],
+    "weight_positive_ratio": 0.5,
+    "weight_price": -0.5,
+    "weight_audio_lang": 0.2,
+    "weight_owners": 0.3,
+    "weight_med_time": 0.1,
+    "weight_tags": 0.5,
+    "preferred_audio_lang": "English",
+    "preferred_tags": ["Action", "Indie", "RPG"]
+}
+
+BENCH_PROFILES = {
+    "szeroki": dict(BENCH_PREFERENCES, max_price=None, min_total_reviews=0, required_platforms=[]),
+    "typowy": BENCH_PREFERENCES,
+    "waski": dict(BENCH_PREFERENCES, max_price=30.0, min_total_reviews=1000, min_positive_ratio=0.8,
+                  mandatory_sub_lang="Polish", required_platforms=["windows", "mac"],
+                  preferred_tags=["Action", "Indie", "RPG", "Strategy", "Singleplayer", "2D"]),
+}
+BENCH_SIZES = [10000, 100000, 1000000]
+REGRESSION_MIN_MS = 2.0
+STAGES = ("filtrowanie", "kryteria", "normalizacja", "ocena", "ranking")
+POPULAR_LANGUAGES = ["English", "German", "French", "Spanish - Spain", "Russian", "Simplified Chinese",
+                     "Japanese", "Italian", "Portuguese - Brazil", "Korean", "Polish", "Traditional Chinese"]
+POPULAR_TAGS = ["Indie", "Singleplayer", "Action", "Casual", "Adventure", "2D", "Simulation", "Strategy",
+                "RPG", "Puzzle", "Atmospheric", "Pixel Graphics", "Colorful", "Exploration", "Story Rich"]
+
+def popularity_weights(vocab, popular, rng, exponent=1.1):
+    """
+    Rozkład Zipfa nad słownikiem: najpierw znane popularne terminy,
+    potem pozostałe w losowej kolejności.
+    """
+    head = [t for t in popular if t in vocab]
+    tail = [t for t in vocab if t not in set(head)]
+    rng.shuffle(tail)
+    order = head + tail
+    ranks = np.empty(len(vocab))
+    position = {t: i for i, t in enumerate(vocab)}
+    ranks[[position[t] for t in order]] = np.arange(len(order))
+    weights = 1.0 / (ranks + 1.0) ** exponent
+    return weights / weights.sum()
+
+def synthesize_terms(num_games, vocab, weights, mean_count, rng, min_count=0):
+    """
+    Kolumna terminów: liczba terminów gry z rozkładu Poissona, terminy
+    losowane z wagami popularności (powtórzenia w obrębie gry są usuwane).
+    """
+    counts = np.maximum(rng.poisson(mean_count, num_games), min_count)
+    rows = np.repeat(np.arange(num_games, dtype=np.int64), counts)
+    terms = rng.choice(len(vocab), size=len(rows), p=weights)
+    pairs = np.unique(rows * len(vocab) + terms)
+    rows, terms = pairs // len(vocab), pairs % len(vocab)
+    indptr = np.zeros(num_games + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=num_games))
+    return TermColumn(vocab, indptr, terms.astype(np.int32))
+
+def synthesize_catalog(num_games, resources, seed=0):
+    """
+    Katalog budowany wprost z kolumn NumPy (bez słownika gier), więc nadaje się
+    do rozmiarów rzędu miliona. Rozkłady: ceny z typowych progów, recenzje
+    i czas gry logarytmicznie normalne, właściciele z przedziałów SteamSpy,
+    tagi i języki według popularności (Zipf) nad słownikami z resources.json.
+    """
+    rng = np.random.default_rng(seed)
+    n = num_games
+    prices = np.array([0.99, 1.99, 4.99, 9.99, 14.99, 19.99, 29.99, 39.99, 59.99])
+    price = rng.choice(prices, size=n, p=[0.1, 0.1, 0.2, 0.2, 0.15, 0.1, 0.07, 0.05, 0.03])
+    total = np.floor(rng.lognormal(3.5, 2.0, n)).astype(np.int64)
+    positive = rng.binomial(total, rng.beta(6, 2, n)).astype(np.int64)
+    owner_buckets = np.array([0, 20000, 50000, 100000, 200000, 500000, 1000000, 2000000, 5000000])
+    low = rng.choice(owner_buckets, size=n, p=[0.55, 0.2, 0.1, 0.06, 0.04, 0.02, 0.015, 0.01, 0.005])
+    owners = np.where(low > 0, (low + 2 * low) // 2, 10000)
+    median_playtime = np.where(rng.random(n) < 0.6, 0, rng.lognormal(4.5, 1.2, n)).astype(np.int64)
+    columns = {
+        "id_rank": np.arange(n, dtype=np.int64),
+        "price": price,
+        "filter_price": price.copy(),
+        "positive": positive,
+        "negative": total - positive,
+        "owners": owners.astype(np.int64),
+        "median_playtime": median_playtime,
+        "windows": rng.random(n) < 0.99,
+        "mac": rng.random(n) < 0.25,
+        "linux": rng.random(n) < 0.18,
+    }
+    languages = sorted(set(resources["languages"]) | set(POPULAR_LANGUAGES))
+    audio = sorted(set(resources["audio_languages"]) | set(POPULAR_LANGUAGES))
+    tags = sorted(set(resources["tags"]) | set(POPULAR_TAGS))
+    terms = {
+        "supported_languages": synthesize_terms(n, languages, popularity_weights(languages, POPULAR_LANGUAGES, rng),
+                                                3.0, rng, min_count=1),
+        "full_audio_languages": synthesize_terms(n, audio, popularity_weights(audio, POPULAR_LANGUAGES, rng),
+                                                 0.8, rng),
+        "tags": synthesize_terms(n, tags, popularity_weights(tags, POPULAR_TAGS, rng), 9.0, rng),
+    }
+    ids = [str(10 * (i + 1)) for i in range(n)]
+    names = [f"Game {i}" for i in range(n)]
+    required_age = rng.choice([0, 0, 0, 12, 16, 18], size=n)
+    details = lambda r: {"name": names[r], "required_age": int(required_age[r])}
+    return GameCatalog(ids, names, columns, terms, details)
+
+def synthesize_games(num_games, resources, seed=0):
+    rnd = random.Random(seed)
+    tags = resources["tags"]
+    languages = resources["languages"]
+    audio_languages = resources["audio_languages"]
+    owner_buckets = [0, 20000, 50000, 100000, 200000, 500000, 1000000, 2000000]
+    games = {}
+    for i in range(num_games):
+        low = rnd.choice(owner_buckets)
+        games[str(10 * (i + 1))] = {
+            "name": f"Game {i}",
+            "price": rnd.choice([0.99, 4.99, 9.99, 14.99, 19.99, 29.99, 59.99]),
+            "positive": int(rnd.expovariate(1 / 2000)),
+            "negative": int(rnd.expovariate(1 / 400)),
+            "estimated_owners": f"{low} - {low * 2 if low else 20000}",
+            "median_playtime_forever": rnd.choice([0, 0, 0, 30, 120, 600, 7000]),
+            "windows": True,
+            "mac": rnd.random() < 0.3,
+            "linux": rnd.random() < 0.2,
+            "supported_languages": rnd.sample(languages, rnd.randint(1, 6)),
+            "full_audio_languages": rnd.sample(audio_languages, rnd.randint(0, 3)),
+            "tags": {t: rnd.randint(1, 500) for t in rnd.sample(tags, rnd.randint(0, 15))},
+        }
+    return games
+
+def reference_topsis(data_matrix, w_array):
+    rows, cols = len(data_matrix), len(data_matrix[0])
+    data_matrix = [row[:] for row in data_matrix]
+    col_sumsq = [0.0] * cols
+    for r in range(rows):
+        for c in range(cols):
+            col_sumsq[c] += data_matrix[r][c]**2
+    for r in range(rows):
+        for c in range(cols):
+            if col_sumsq[c] > 1e-12:
+                data_matrix[r][c] = data_matrix[r][c] / math.sqrt(col_sumsq[c]) * w_array[c]
+            else:
+                data_matrix[r][c] = 0.0
+    ideal = [0.0] * cols
+    anti_ideal = [0.0] * cols
+    for c in range(cols):
+        col_vals = [data_matrix[r][c] for r in range(rows)]
+        ideal[c] = min(col_vals) if COST_BENEFIT[c] else max(col_vals)
+        anti_ideal[c] = max(col_vals) if COST_BENEFIT[c] else min(col_vals)
+    scores = []
+    for r in range(rows):
+        dist_plus = math.sqrt(sum((data_matrix[r][c] - ideal[c])**2 for c in range(cols)))
+        dist_minus = math.sqrt(sum((data_matrix[r][c] - anti_ideal[c])**2 for c in range(cols)))
+        total = dist_plus + dist_minus
+        scores.append(dist_minus / total if total > 1e-12 else 0.0)
+    return scores
+
+def reference_wpm(data_matrix, w_rel):
+    rows, cols = len(data_matrix), len(data_matrix[0])
+    col_min = [min(data_matrix[r][c] for r in range(rows)) for c in range(cols)]
+    col_max = [max(0.0, max(data_matrix[r][c] for r in range(rows))) for c in range(cols)]
+    scores = []
+    for r in range(rows):
+        sum_log = 0.0
+        for c in range(cols):
+            val = data_matrix[r][c]
+            if not COST_BENEFIT[c]:
+                valn = val / (col_max[c] if col_max[c] > 1e-12 else 1e-12)
+            else:
+                valn = col_min[c] / val if val > 1e-12 else 0.0
+            if valn < 1e-12:
+                sum_log = None
+                break
+            sum_log += w_rel[c] * math.log(valn)
+        scores.append(math.exp(sum_log) if sum_log is not None else 0.0)
+    return scores
+
+def reference_vikor(data_matrix, w_rel, v=0.5):
+    rows, cols = len(data_matrix), len(data_matrix[0])
+    f_star, f_minus = [], []
+    for c in range(cols):
+        col_vals = [data_matrix[r][c] for r in range(rows)]
+        f_star.append(min(col_vals) if COST_BENEFIT[c] else max(col_vals))
+        f_minus.append(max(col_vals) if COST_BENEFIT[c] else min(col_vals))
+    S_list, R_list = [], []
+    for r in range(rows):
+        S_val = R_val = 0.0
+        for c in range(cols):
+            diff_den = abs(f_star[c] - f_minus[c]) if abs(f_star[c] - f_minus[c]) > 1e-12 else 1.0
+            local_val = w_rel[c] * (abs(f_star[c] - data_matrix[r][c]) / diff_den)
+            S_val += local_val
+            R_val = max(R_val, local_val)
+        S_list.append(S_val)
+        R_list.append(R_val)
+    S_star, S_minus = min(S_list), max(S_list)
+    R_star, R_minus = min(R_list), max(R_list)
+    Q_list = []
+    for si, ri in zip(S_list, R_list):
+        FS = (si - S_star) / (S_minus - S_star) if (S_minus - S_star) > 1e-12 else 0.0
+        FR = (ri - R_star) / (R_minus - R_star) if (R_minus - R_star) > 1e-12 else 0.0
+        Q_list.append(v * FS + (1.0 - v) * FR)
+    return Q_list
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def reference_top(scores, n, largest):
+    order = sorted(range(len(scores)), key=lambda i: scores[i], reverse=largest)
+    return order[:n]
+
+def run(catalog, preferences, top):
+    rows = catalog.candidate_rows(preferences)
+    features = catalog.feature_matrix(rows, preferences)
+    weights = relative_weights(preferences)
+    data_matrix = features.tolist()
+    kernels = [
+        ("TOPSIS", reference_topsis, lambda: topsis_closeness(features, weights, BENEFIT), True),
+        ("WPM", reference_wpm, lambda: wpm_scores(features, weights, BENEFIT), True),
+        ("VIKOR", reference_vikor, lambda: vikor_scores(features, weights, BENEFIT)[0], False),
+    ]
+    print(f"Kandydaci: {len(rows)}")
+    identical = True
+    for name, reference, vectorized, largest in kernels:
+        ref_scores, ref_time = timed(reference, data_matrix, weights)
+        vec_scores, vec_time = timed(vectorized)
+        ref_best = reference_top(ref_scores, top, largest)
+        vec_best = top_k(vec_scores, top, largest=largest).tolist()
+        same = ref_best == vec_best
+        identical = identical and same
+        print(f"{name:7s} pętle: {ref_time:8.3f} s  NumPy: {vec_time:8.4f} s  "
+              f"przyspieszenie: {ref_time / max(vec_time, 1e-9):7.1f}x  ranking identyczny: {same}")
+    _, separate_time = timed(lambda: [vectorized() for _, _, vectorized, _ in kernels])
+    def shared():
+        stats = ColumnStats.from_matrix(features)
+        topsis_closeness(features, weights, BENEFIT, stats)
+        wpm_scores(features, weights, BENEFIT, stats)
+        vikor_scores(features, weights, BENEFIT, stats=stats)
+    _, shared_time = timed(shared)
+    print(f"Trzy metody: osobne statystyki {separate_time:.4f} s, wspólne ColumnStats {shared_time:.4f} s")
+    return identical
+
+def stage_breakdown(catalog, method, preferences, top):
+    """
+    Czasy etapów z profilera funkcji rekomendującej, liczone na zimno
+    (bez pamięci podręcznej katalogu).
+    """
+    catalog.clear_caches()
+    profiler = Profiler()
+    RECOMMENDERS[method](catalog, preferences, top, profiler=profiler)
+    return {stage: profiler.totals.get(stage, 0.0) for stage in STAGES}, profiler.counters["kandydaci"]
+
+def measure(catalog, method, preferences, top, repeat):
+    recommender = RECOMMENDERS[method]
+    wall = []
+    for _ in range(repeat):
+        catalog.clear_caches()
+        start = time.perf_counter()
+        recommender(catalog, preferences, top)
+        wall.append(time.perf_counter() - start)
+    catalog.clear_caches()
+    tracemalloc.start()
+    recommender(catalog, preferences, top)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    breakdowns = [stage_breakdown(catalog, method, preferences, top) for _ in range(repeat)]
+    stages = {stage: min(b[0][stage] for b in breakdowns) for stage in STAGES}
+    return {"wall_s": min(wall), "peak_mb": peak / 2**20, "candidates": breakdowns[0][1], "stages_s": stages}
+
+def run_suite(sizes, top, repeat, seed, resources):
+    results = []
+    for size in sizes:
+        start = time.perf_counter()
+        catalog = synthesize_catalog(size, resources, seed)
+        print(f"Katalog {size} gier zbudowany w {time.perf_counter() - start:.1f} s")
+        for profile, preferences in BENCH_PROFILES.items():
+            for method in RECOMMENDERS:
+                record = {"size": size, "profile": profile, "method": method}
+                record.update(measure(catalog, method, preferences, top, repeat))
+                results.append(record)
+                stages = "  ".join(f"{k}: {v * 1000:.1f}" for k, v in record["stages_s"].items())
+                print(f"{size:8d} {profile:8s} {method:7s} {record['wall_s'] * 1000:9.1f} ms  "
+                      f"{record['peak_mb']:7.1f} MB  kandydaci: {record['candidates']:8d}  [ms] {stages}")
+    return {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "top": top,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+def compare(previous, current, threshold, min_delta_ms=REGRESSION_MIN_MS):
+    """
+    Porównuje czasy z dwóch plików wyników; zwraca liczbę regresji,
+    czyli przypadków wolniejszych niż threshold razy. Różnice czasu poniżej
+    min_delta_ms są traktowane jako szum pomiaru.
+    """
+    key = lambda r: (r["size"], r["profile"], r["method"])
+    old = {key(r): r for r in previous["results"]}
+    regressions = 0
+    for record in current["results"]:
+        before = old.get(key(record))
+        if before is None:
+            continue
+        ratio = record["wall_s"] / max(before["wall_s"], 1e-9)
+        memory_ratio = record["peak_mb"] / max(before["peak_mb"], 1e-9)
+        flag = ""
+        slower = ratio > threshold and (record["wall_s"] - before["wall_s"]) * 1000 > min_delta_ms
+        if slower or memory_ratio > threshold:
+            regressions += 1
+            flag = "  REGRESJA"
+        size, profile, method = key(record)
+        print(f"{size:8d} {profile:8s} {method:7s} czas: {before['wall_s'] * 1000:9.1f} -> "
+              f"{record['wall_s'] * 1000:9.1f} ms ({ratio:5.2f}x)  pamięć: {before['peak_mb']:7.1f} -> "
+              f"{record['peak_mb']:7.1f} MB ({memory_ratio:5.2f}x){flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie jąder TOPSIS/WPM/VIKOR: pętle vs NumPy "
+                                                 "oraz zestaw pomiarów metod dla różnych rozmiarów katalogu.")
+    parser.add_argument("--games", help="plik games_fixed.json do sprawdzenia rankingów na prawdziwych danych")
+    parser.add_argument("--size", type=int, default=50000, help="liczba syntetycznych gier")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--suite", action="store_true", help="pomiar SAW/TOPSIS/WPM/VIKOR dla rozmiarów --sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCH_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json", help="plik JSON z wynikami zestawu")
+    parser.add_argument("--compare", help="wcześniejszy plik wyników do porównania")
+    parser.add_argument("--threshold", type=float, default=1.2, help="próg regresji (krotność czasu/pamięci)")
+    args = parser.parse_args()
+    if args.suite:
+        with open("data/resources.json", "r", encoding="utf-8") as f:
+            resources = json.load(f)
+        report = run_suite(args.sizes, args.top, args.repeat, args.seed, resources)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Zapisano wyniki do {args.output}")
+        if args.compare:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+            regressions = compare(previous, report, args.threshold)
+            if regressions:
+                raise SystemExit(f"Wykryto regresje: {regressions}")
+        return
+    if args.games:
+        games_data = load_games(args.games)
+    else:
+        with open("data/resources.json", "r", encoding="utf-8") as f:
+            resources = json.load(f)
+        games_data = synthesize_games(args.size, resources, args.seed)
+    catalog = GameCatalog.from_games(games_data)
+    identical = run(catalog, BENCH_PREFERENCES, args.top)
+    if not identical:
+        raise SystemExit("Rankingi różnią się od implementacji referencyjnej!")
+
+if __name__ == "__main__":
+    main()
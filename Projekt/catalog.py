@@ -0,0 +1,586 @@
+import bisect
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+from name_index import NameIndex
+from profiling import NULL_PROFILER
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import ColumnStats
+
+PLATFORMS = ("windows", "mac", "linux")
+MAX_MEDIAN_PLAYTIME = 6000.0
+CRITERIA = ("ratio", "price", "audio_val", "owners_log", "med_norm", "frac_tags")
+TERM_FIELDS = ("supported_languages", "full_audio_languages", "tags")
+FEATURE_CACHE_SIZE = 16
+ROW_BLOCK = 1 << 14
+
+def load_games(games_path):
+    with open(games_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def id_sort_key(gid):
+    return (0, int(gid), "") if gid.isdigit() else (1, 0, gid)
+
+def parse_owners(owners_value):
+    if isinstance(owners_value, int):
+        return owners_value
+    if isinstance(owners_value, float):
+        return int(owners_value)
+    if not isinstance(owners_value, str):
+        return 0
+    val = owners_value.strip()
+    if "-" in val:
+        parts = val.split("-")
+        if len(parts) == 2:
+            try:
+                low = int(parts[0].replace(",", ""))
+                high = int(parts[1].replace(",", ""))
+                return (low + high) // 2
+            except:
+                return 0
+    else:
+        try:
+            return int(val.replace(",", ""))
+        except:
+            return 0
+    return 0
+
+def parse_price(price_value):
+    if isinstance(price_value, (int, float)):
+        return float(price_value)
+    if isinstance(price_value, str):
+        try:
+            return float(price_value)
+        except:
+            return 0.0
+    return 0.0
+
+class TermColumn:
+    """
+    Listy terminów (tagi, języki) w formacie CSR: wiersz r ma terminy
+    vocab[indices[indptr[r]:indptr[r + 1]]], bez powtórzeń w obrębie wiersza.
+    Indeks odwrócony (post_indptr, post_rows) daje dla terminu t posortowaną
+    listę wierszy post_rows[post_indptr[t]:post_indptr[t + 1]].
+    """
+
+    def __init__(self, vocab, indptr, indices, post_indptr=None, post_rows=None):
+        self.vocab = list(vocab)
+        self.term_id = {t: i for i, t in enumerate(self.vocab)}
+        self.indptr = indptr
+        self.indices = indices
+        if post_indptr is None:
+            post_indptr, post_rows = self._build_postings()
+        self.post_indptr = post_indptr
+        self.post_rows = post_rows
+
+    def copy(self):
+        """
+        Kopia, którą można uzupełniać przez append bez zmiany oryginału
+        (tablice są przy dopisywaniu i tak tworzone od nowa).
+        """
+        return TermColumn(self.vocab, self.indptr, self.indices, self.post_indptr, self.post_rows)
+
+    @classmethod
+    def from_lists(cls, term_lists):
+        vocab = sorted(set().union(*term_lists)) if term_lists else []
+        term_id = {t: i for i, t in enumerate(vocab)}
+        indptr = np.zeros(len(term_lists) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(terms) for terms in term_lists])
+        indices = np.fromiter((term_id[t] for terms in term_lists for t in terms),
+                              dtype=np.int32, count=int(indptr[-1]))
+        return cls(vocab, indptr, indices)
+
+    def _build_postings(self):
+        entry_rows = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        post_indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        post_indptr[1:] = np.cumsum(np.bincount(self.indices, minlength=len(self.vocab)))
+        return post_indptr, entry_rows[order]
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def row_terms(self, r):
+        return [self.vocab[i] for i in self.indices[self.indptr[r]:self.indptr[r + 1]]]
+
+    def rows_with(self, term):
+        t = self.term_id.get(term)
+        if t is None:
+            return np.array([], dtype=np.int64)
+        return self.post_rows[self.post_indptr[t]:self.post_indptr[t + 1]]
+
+    def match_counts(self, terms, rows):
+        """
+        Dla każdego wiersza z rows: ile terminów z listy terms (z powtórzeniami) ma gra.
+        Iloczyn rzadkiej macierzy gra x termin z wektorem preferencji po listach wierszy.
+        """
+        counts = np.zeros(len(self))
+        for t in terms:
+            counts[self.rows_with(t)] += 1.0
+        return counts[rows]
+
+    def contains(self, term, rows):
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.rows_with(term)] = True
+        return mask[rows]
+
+    def append(self, other):
+        """
+        Dopisuje wiersze innej kolumny na końcu; terminy spoza słownika trafiają
+        na jego koniec. Nowe wiersze mają największe numery, więc w indeksie
+        odwróconym wystarczy je wstawić na końce list terminów.
+        """
+        for t in other.vocab:
+            if t not in self.term_id:
+                self.term_id[t] = len(self.vocab)
+                self.vocab.append(t)
+        mapping = np.array([self.term_id[t] for t in other.vocab], dtype=np.int64)
+        terms = mapping[other.indices]
+        rows = len(self) + np.repeat(np.arange(len(other), dtype=np.int64), np.diff(other.indptr))
+        order = np.argsort(terms, kind="stable")
+        terms, rows = terms[order], rows[order]
+        post_indptr = np.concatenate((self.post_indptr,
+                                      np.full(len(self.vocab) + 1 - len(self.post_indptr), self.post_indptr[-1])))
+        self.post_rows = np.insert(self.post_rows, post_indptr[terms + 1], rows)
+        post_indptr[1:] += np.cumsum(np.bincount(terms, minlength=len(self.vocab)))
+        self.post_indptr = post_indptr
+        self.indptr = np.concatenate((self.indptr, self.indptr[-1] + other.indptr[1:]))
+        self.indices = np.concatenate((self.indices, mapping[other.indices].astype(self.indices.dtype)))
+
+    def term_vector(self, terms):
+        """
+        Wektor długości słownika z liczbą wystąpień każdego terminu w terms.
+        """
+        vector = np.zeros(len(self.vocab))
+        for t in terms:
+            i = self.term_id.get(t)
+            if i is not None:
+                vector[i] += 1.0
+        return vector
+
+    def dense_block(self, start, stop, term_ids):
+        """
+        Gęsta macierz 0/1 (stop - start) x len(term_ids): czy wiersz start + i
+        ma termin term_ids[j].
+        """
+        column_of = np.full(len(self.vocab), -1, dtype=np.int64)
+        column_of[term_ids] = np.arange(len(term_ids))
+        lo, hi = self.indptr[start], self.indptr[stop]
+        local_rows = np.repeat(np.arange(stop - start), np.diff(self.indptr[start:stop + 1]))
+        columns = column_of[self.indices[lo:hi]]
+        selected = columns >= 0
+        block = np.zeros((stop - start, len(term_ids)))
+        block[local_rows[selected], columns[selected]] = 1.0
+        return block
+
+
+class LRUCache:
+    """
+    Słownik o ograniczonym rozmiarze - przy przepełnieniu usuwa
+    najdawniej używany wpis. Bezpieczny przy dostępie z wątku roboczego.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def items(self):
+        """
+        Kopia wpisów od najdawniej używanego.
+        """
+        with self.lock:
+            return list(self.entries.items())
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def merged_id_rank(id_rank, ids, start):
+    """
+    Wstawia nowe wiersze ids (od start) w istniejący porządek identyfikatorów.
+    """
+    order = np.empty(start, dtype=np.int64)
+    order[id_rank] = np.arange(start)
+    sort_key = lambda r: id_sort_key(ids[r])
+    new_rows = sorted(range(start, len(ids)), key=sort_key)
+    positions = [bisect.bisect_left(order, sort_key(r), key=sort_key) for r in new_rows]
+    order = np.insert(order, positions, new_rows)
+    merged = np.empty(len(ids), dtype=np.int64)
+    merged[order] = np.arange(len(ids))
+    return merged
+
+class GameCatalog:
+    """
+    Kolumnowy katalog gier budowany raz po wczytaniu danych.
+    Każde kryterium liczbowe jest przechowywane jako kolumna NumPy,
+    wiersz o indeksie r odpowiada grze self.ids[r]. Tagi i języki są
+    trzymane jako TermColumn, a pełne dane gry są pobierane dopiero
+    przez details().
+    """
+
+    def __init__(self, ids, names, columns, terms, details_loader):
+        self.ids = ids
+        self.names = names
+        self._row_of = None
+        self._name_index = None
+        self._base_features = None
+        self.version = 0
+        self.lock = threading.Lock()
+        self.alive = np.ones(len(ids), dtype=bool)
+        self.removed_count = 0
+        self.preference_columns_cache = LRUCache(FEATURE_CACHE_SIZE)
+        self.candidates_cache = LRUCache(FEATURE_CACHE_SIZE)
+        self.details_loader = details_loader
+        self.id_rank = columns["id_rank"]
+        self.price = columns["price"]
+        self.filter_price = columns["filter_price"]
+        self.positive = columns["positive"]
+        self.negative = columns["negative"]
+        self.owners = columns["owners"]
+        self.median_playtime = columns["median_playtime"]
+        self.platforms = {p: columns[p] for p in PLATFORMS}
+        self.terms = terms
+        n = len(ids)
+        self.total_reviews = self.positive + self.negative
+        self.ratio = np.divide(self.positive, self.total_reviews, out=np.zeros(n),
+                               where=self.total_reviews > 0)
+        owners_raw = self.owners * 0.2
+        self.owners_log = np.zeros(n)
+        np.log10(owners_raw + 1, out=self.owners_log, where=owners_raw > 0)
+        self.med_norm = np.where(self.median_playtime < MAX_MEDIAN_PLAYTIME,
+                                 self.median_playtime / MAX_MEDIAN_PLAYTIME, 1.0)
+
+    @classmethod
+    def from_games(cls, games_data):
+        ids = list(games_data.keys())
+        n = len(ids)
+        names = []
+        term_lists = {field: [] for field in TERM_FIELDS}
+        columns = {
+            "price": np.zeros(n),
+            "filter_price": np.zeros(n),
+            "positive": np.zeros(n, dtype=np.int64),
+            "negative": np.zeros(n, dtype=np.int64),
+            "owners": np.zeros(n, dtype=np.int64),
+            "median_playtime": np.zeros(n, dtype=np.int64),
+        }
+        for p in PLATFORMS:
+            columns[p] = np.zeros(n, dtype=bool)
+        for r, gid in enumerate(ids):
+            info = games_data[gid]
+            names.append(info.get("name", ""))
+            for field in TERM_FIELDS:
+                term_lists[field].append(frozenset(info.get(field, [])))
+            columns["price"][r] = parse_price(info.get("price", 0))
+            columns["filter_price"][r] = parse_price(info.get("price", 999999))
+            columns["positive"][r] = info.get("positive", 0)
+            columns["negative"][r] = info.get("negative", 0)
+            columns["owners"][r] = parse_owners(info.get("estimated_owners", "0"))
+            columns["median_playtime"][r] = info.get("median_playtime_forever", 0)
+            for p in PLATFORMS:
+                columns[p][r] = bool(info.get(p, False))
+        columns["id_rank"] = np.empty(n, dtype=np.int64)
+        columns["id_rank"][sorted(range(n), key=lambda r: id_sort_key(ids[r]))] = np.arange(n)
+        terms = {field: TermColumn.from_lists(term_lists[field]) for field in TERM_FIELDS}
+        return cls(ids, names, columns, terms, lambda r: games_data[ids[r]])
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def row_of(self):
+        if self._row_of is None:
+            self._row_of = {gid: r for r, gid in enumerate(self.ids) if self.alive[r]}
+        return self._row_of
+
+    @property
+    def name_index(self):
+        if self._name_index is None:
+            self._name_index = NameIndex(self.names)
+            self._name_index.remove(np.flatnonzero(~self.alive))
+        return self._name_index
+
+    def search_names(self, query, limit=100):
+        with self.lock:
+            index, ids, names = self.name_index, self.ids, self.names
+        for r in index.search(query, limit):
+            yield ids[r], names[r]
+
+    def details(self, gid):
+        with self.lock:
+            r = self.row_of.get(gid)
+            loader = self.details_loader
+        if r is None:
+            return {}
+        return loader(r)
+
+    def platform_column(self, platform):
+        """
+        Kolumna jednej z PLATFORMS. Innych nazw nie ma w katalogu, a liczenie
+        ich z pełnych danych gier (i trzymanie w pamięci) byłoby kosztowne,
+        więc są odrzucane.
+        """
+        key = platform.lower()
+        if key not in self.platforms:
+            raise ValueError(f"Nieznana platforma: {platform}")
+        return self.platforms[key]
+
+    def candidate_rows(self, preferences, played_game_ids=(), progress=None):
+        """
+        Zwraca indeksy wierszy gier spełniających filtry twarde preferencji.
+        Obowiązkowy język napisów zawęża start do listy wierszy z indeksu
+        odwróconego, pozostałe filtry to maski na kolumnach tych wierszy,
+        liczone blokami po ROW_BLOCK wierszy. Po każdym bloku wywoływane jest
+        progress(ułamek) - wyjątek z niego przerywa filtrowanie.
+        """
+        mand_sub = preferences.get("mandatory_sub_lang", "")
+        if mand_sub:
+            rows = self.terms["supported_languages"].rows_with(mand_sub)
+        else:
+            rows = np.arange(len(self.ids))
+        max_price = preferences.get("max_price")
+        min_reviews = preferences.get("min_total_reviews", 0)
+        min_ratio = preferences.get("min_positive_ratio", 0.0)
+        platforms = [self.platform_column(rp) for rp in preferences.get("required_platforms", [])]
+        played_rows = [self.row_of[gid] for gid in played_game_ids if gid in self.row_of]
+        played = None
+        if played_rows:
+            played = np.zeros(len(self.ids), dtype=bool)
+            played[played_rows] = True
+        kept = []
+        for start in range(0, len(rows), ROW_BLOCK):
+            block = rows[start:start + ROW_BLOCK]
+            index = block if mand_sub else slice(start, start + len(block))
+            keep = self.total_reviews[index] >= min_reviews
+            if max_price is not None:
+                keep &= self.filter_price[index] <= max_price
+            keep &= self.ratio[index] >= min_ratio
+            for column in platforms:
+                keep &= column[index]
+            if self.removed_count:
+                keep &= self.alive[index]
+            if played is not None:
+                keep &= ~played[index]
+            kept.append(block[keep])
+            if progress is not None:
+                progress((start + len(block)) / len(rows))
+        return np.concatenate(kept) if kept else rows
+
+    @property
+    def base_features(self):
+        """
+        Kolumny kryteriów niezależne od preferencji (n x 6, kolejność CRITERIA);
+        miejsca na audio_val i frac_tags są wyzerowane.
+        """
+        if self._base_features is None:
+            base = np.zeros((len(self.ids), len(CRITERIA)))
+            base[:, 0] = self.ratio
+            base[:, 1] = self.price
+            base[:, 3] = self.owners_log
+            base[:, 4] = self.med_norm
+            base.flags.writeable = False
+            self._base_features = base
+        return self._base_features
+
+    def preference_columns(self, preferences):
+        """
+        Kolumny audio_val i frac_tags dla całego katalogu, pamiętane
+        w LRU według klucza (preferred_audio_lang, tuple(preferred_tags)).
+        """
+        pref_audio = preferences.get("preferred_audio_lang", "")
+        pref_tags = tuple(preferences.get("preferred_tags", []))
+        key = (pref_audio, pref_tags)
+        columns = self.preference_columns_cache.get(key)
+        if columns is None:
+            all_rows = slice(None)
+            if pref_audio:
+                audio_val = self.terms["full_audio_languages"].contains(pref_audio, all_rows).astype(float)
+            else:
+                audio_val = np.zeros(len(self.ids))
+            if pref_tags:
+                frac_tags = self.terms["tags"].match_counts(pref_tags, all_rows) / len(pref_tags)
+            else:
+                frac_tags = np.zeros(len(self.ids))
+            columns = (audio_val, frac_tags)
+            self.preference_columns_cache.put(key, columns)
+        return columns
+
+    def feature_matrix(self, rows, preferences, progress=None):
+        """
+        Macierz kryteriów (len(rows) x 6) w kolejności CRITERIA, składana
+        blokami po ROW_BLOCK wierszy; po każdym bloku progress(ułamek).
+        """
+        audio_val, frac_tags = self.preference_columns(preferences)
+        base = self.base_features
+        matrix = np.empty((len(rows), len(CRITERIA)))
+        for start in range(0, len(rows), ROW_BLOCK):
+            block = rows[start:start + ROW_BLOCK]
+            part = matrix[start:start + len(block)]
+            part[:] = base[block]
+            part[:, 2] = audio_val[block]
+            part[:, 5] = frac_tags[block]
+            if progress is not None:
+                progress((start + len(block)) / len(rows))
+        return matrix
+
+    def candidate_features(self, preferences, played_game_ids=(), profiler=NULL_PROFILER, progress=None):
+        """
+        Wiersze kandydatów, ich macierz kryteriów i statystyki kolumn (ColumnStats).
+        Wynik zależy tylko od filtrów twardych i kolumn preferencji, a nie od wag,
+        więc zmiana metody lub wag korzysta z zapamiętanej trójki
+        (rows, features, stats) - normy i skrajne wartości nie są liczone ponownie.
+        Profiler dostaje czasy etapów filtrowanie/kryteria/normalizacja (tylko
+        przy chybieniu pamięci podręcznej) i liczbę kandydatów po filtrach.
+        progress(etap, ułamek) jest wywoływany po każdym bloku wierszy; filtry
+        zajmują ułamki 0-0.25, a macierz kryteriów 0.25-0.5. Wyjątek z progress
+        przerywa obliczenia bez zapisu do pamięci podręcznej.
+        """
+        key = (
+            preferences.get("max_price"),
+            preferences.get("min_total_reviews", 0),
+            preferences.get("min_positive_ratio", 0.0),
+            preferences.get("mandatory_sub_lang", ""),
+            tuple(preferences.get("required_platforms", [])),
+            preferences.get("preferred_audio_lang", ""),
+            tuple(preferences.get("preferred_tags", [])),
+            frozenset(played_game_ids),
+        )
+        cached = self.candidates_cache.get(key)
+        if cached is None:
+            profiler.count("cache_chybienia")
+            filter_progress = feature_progress = None
+            if progress is not None:
+                filter_progress = lambda fraction: progress("filtrowanie", 0.25 * fraction)
+                feature_progress = lambda fraction: progress("kryteria", 0.25 + 0.25 * fraction)
+            with profiler.stage("filtrowanie"):
+                rows = self.candidate_rows(preferences, played_game_ids, filter_progress)
+            with profiler.stage("kryteria"):
+                features = self.feature_matrix(rows, preferences, feature_progress)
+                features.flags.writeable = False
+            with profiler.stage("normalizacja"):
+                stats = ColumnStats.from_matrix(features)
+            cached = (rows, features, stats)
+            self.candidates_cache.put(key, cached)
+        else:
+            profiler.count("cache_trafienia")
+        profiler.count("kandydaci", len(cached[0]))
+        return cached
+
+    def apply_delta(self, upserts, removed=()):
+        """
+        Nanosi zmiany bez przeładowania katalogu. upserts to słownik
+        {id: dane gry} z nowymi lub zmienionymi grami, removed - identyfikatory
+        gier do usunięcia. Stare wiersze zmienionych i usuniętych gier są
+        oznaczane jako martwe, a nowe wersje dopisywane na końcu kolumn
+        (kolumny mapowane z dysku są przy tym kopiowane). Indeks nazw,
+        indeksy terminów i kolumny preferencji w pamięci podręcznej są
+        uzupełniane tylko o nowe wiersze; unieważniane są jedynie zbiory
+        kandydatów. Nowe kolumny, indeksy i obie pamięci podręczne powstają
+        obok bieżących i są podmieniane naraz pod self.lock, więc search_names
+        i details z innego wątku widzą katalog sprzed albo po zmianie, nigdy
+        w połowie, a nowe kolumny nie trafiają do par ze starymi wpisami.
+        Zwraca (dodane, zmienione, usunięte).
+        """
+        row_of = self.row_of
+        retired = [row_of[gid] for gid in set(removed) | set(upserts) if gid in row_of]
+        changed = sum(1 for gid in upserts if gid in row_of)
+        deleted = sum(1 for gid in set(removed) if gid in row_of and gid not in upserts)
+        state = {
+            "alive": self.alive.copy(),
+            "_row_of": dict(row_of),
+            "_name_index": self._name_index.copy() if self._name_index is not None else None,
+            "removed_count": self.removed_count + len(retired),
+            "version": self.version + 1,
+        }
+        state["alive"][retired] = False
+        for r in retired:
+            del state["_row_of"][self.ids[r]]
+        if state["_name_index"] is not None:
+            state["_name_index"].remove(retired)
+        part = GameCatalog.from_games(upserts) if upserts else None
+        state["preference_columns_cache"] = LRUCache(FEATURE_CACHE_SIZE)
+        state["candidates_cache"] = LRUCache(FEATURE_CACHE_SIZE)
+        if part is not None:
+            self._append(part, state)
+        for (pref_audio, pref_tags), columns in self.preference_columns_cache.items():
+            if part is not None:
+                extra = part.preference_columns({"preferred_audio_lang": pref_audio,
+                                                 "preferred_tags": list(pref_tags)})
+                columns = tuple(np.concatenate(pair) for pair in zip(columns, extra))
+            state["preference_columns_cache"].put((pref_audio, pref_tags), columns)
+        with self.lock:
+            self.__dict__.update(state)
+        return len(upserts) - changed, changed, deleted
+
+    def _append(self, part, state):
+        """
+        Uzupełnia state o kolumny z dopisanymi na końcu wierszami part;
+        bieżące kolumny i indeksy katalogu nie są zmieniane.
+        """
+        start = len(self)
+        ids = list(self.ids) + list(part.ids)
+        base_loader = self.details_loader
+        state["ids"] = ids
+        state["names"] = list(self.names) + list(part.names)
+        state["details_loader"] = lambda r: base_loader(r) if r < start else part.details_loader(r - start)
+        for name in ("price", "filter_price", "positive", "negative", "owners", "median_playtime",
+                     "total_reviews", "ratio", "owners_log", "med_norm"):
+            state[name] = np.concatenate((getattr(self, name), getattr(part, name)))
+        state["platforms"] = {key: np.concatenate((column, part.platform_column(key)))
+                              for key, column in self.platforms.items()}
+        state["terms"] = {}
+        for field in TERM_FIELDS:
+            column = self.terms[field].copy()
+            column.append(part.terms[field])
+            state["terms"][field] = column
+        state["alive"] = np.concatenate((state["alive"], np.ones(len(part), dtype=bool)))
+        state["id_rank"] = merged_id_rank(self.id_rank, ids, start)
+        for r in range(start, len(ids)):
+            state["_row_of"][ids[r]] = r
+        if state["_name_index"] is not None:
+            state["_name_index"].add(part.names)
+        if self._base_features is not None:
+            base = np.concatenate((self._base_features, part.base_features))
+            base.flags.writeable = False
+            state["_base_features"] = base
+
+    def clear_caches(self):
+        self._base_features = None
+        self.preference_columns_cache.clear()
+        self.candidates_cache.clear()
+
+    def result_row(self, r, score):
+        tot = int(self.total_reviews[r])
+        return {
+            "id": self.ids[r],
+            "name": self.names[r],
+            "score": score,
+            "price": float(self.price[r]),
+            "pos_percentage": round(float(self.ratio[r]), 2) if tot > 0 else 0.0,
+            "total_reviews": tot,
+            "estimated_owners": int(self.owners[r]),
+            "median_playtime_forever": int(self.median_playtime[r]),
+        }
@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import time
+from fix_games import iter_json_object, keep_game, format_entry, write_entry, close_object
+from generate_resources import add_game_terms, build_resources, term_ids, save_resources
+
+def load_delta(delta_path):
+    """
+    Plik zmian: {"added": {id: gra}, "changed": {id: gra}, "removed": [id, ...]}.
+    Gry, które po zmianie nie przechodzą filtra z fix_games, są traktowane
+    jak usunięte. Zwraca (upserts, removed).
+    """
+    with open(delta_path, "r", encoding="utf-8") as f:
+        delta = json.load(f)
+    upserts = {}
+    removed = set(delta.get("removed", []))
+    for section in ("added", "changed"):
+        for game_id, info in delta.get(section, {}).items():
+            if keep_game(info):
+                upserts[game_id] = info
+                removed.discard(game_id)
+            else:
+                removed.add(game_id)
+    return upserts, removed
+
+def update_resources(resources, upserts):
+    """
+    Dokłada do słowników resources.json terminy nowych i zmienionych gier.
+    Terminy, których żadna gra już nie używa, zostają - pełne przeliczenie
+    robi generate_resources.py. Istniejące terminy zachowują numery z term_ids.
+    """
+    vocab = (set(resources["genres"]), set(resources["languages"]),
+             set(resources["audio_languages"]), set(resources["tags"]))
+    for info in upserts.values():
+        add_game_terms(info, *vocab)
+    return build_resources(*vocab, previous_ids=term_ids(resources))
+
+def apply_to_games_file(input_path, output_path, upserts, removed, chunk_size=1 << 20):
+    """
+    Strumieniowo przepisuje games_fixed.json: zmienione rekordy są podmieniane
+    w miejscu, usunięte pomijane, a nowe dopisywane na końcu.
+    """
+    pending = dict(upserts)
+    count = 0
+    with open(input_path, "r", encoding="utf-8") as src, open(output_path, "w", encoding="utf-8") as out:
+        out.write("{")
+        for game_id, info in iter_json_object(src, chunk_size):
+            if game_id in removed:
+                continue
+            write_entry(out, count == 0, format_entry(game_id, pending.pop(game_id, info)))
+            count += 1
+        for game_id, info in pending.items():
+            write_entry(out, count == 0, format_entry(game_id, info))
+            count += 1
+        close_object(out, count)
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Nanoszenie pliku zmian na games_fixed.json i resources.json.")
+    parser.add_argument("delta", help="plik JSON ze zmianami (added/changed/removed)")
+    parser.add_argument("--games", default="data/games_fixed.json")
+    parser.add_argument("--resources", default="data/resources.json")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    upserts, removed = load_delta(args.delta)
+    tmp_path = args.games + ".tmp"
+    count = apply_to_games_file(args.games, tmp_path, upserts, removed)
+    os.replace(tmp_path, args.games)
+    with open(args.resources, "r", encoding="utf-8") as f:
+        resources = json.load(f)
+    save_resources(update_resources(resources, upserts), args.resources)
+    print(f"Zapisano {count} gier do {args.games} ({len(upserts)} dodanych/zmienionych, "
+          f"{len(removed)} usuniętych) w {time.perf_counter() - start:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
+import argparse
 import json
+import re
+import time
+
+FORBIDDEN_PHRASES = ["hentai", "porn", "sex", "harem"]
+_WHITESPACE = " \t\n\r"
+# tekst do najbliższego nawiasu poza napisami; grupa to ten nawias, '"' dla
+# urwanego napisu albo pusty napis na końcu bufora
+_TO_BRACKET = re.compile(r'[^"\[\]{}]*+(?:"[^"\\]*+(?:\\.[^"\\]*+)*+"[^"\[\]{}]*+)*+([\[\]{}"]|\Z)')
 
 def load_games(filepath):
     with open(filepath, "r", encoding="utf-8") as f:
@@ -8,27 +17,165 @@ def save_games(games_data, filepath):
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(games_data, f, ensure_ascii=False, indent=2)
 
+def keep_game(info):
+    price = info.get("price", 0.0)
+    if price == 0:
+        return False
+    name_lower = info.get("name", "").lower()
+    if any(phrase in name_lower for phrase in FORBIDDEN_PHRASES):
+        return False
+    return True
+
 def fix_games(input_path, output_path):
     games_data = load_games(input_path)
-    
-    forbidden_phrases = ["hentai", "porn", "sex", "harem"]
-    
+
     filtered_games = {}
 
     for game_id, info in games_data.items():
-        price = info.get("price", 0.0)
-        if price == 0:
-            continue
-
-        name_lower = info.get("name", "").lower()
-        if any(phrase in name_lower for phrase in forbidden_phrases):
-            continue
-
-        filtered_games[game_id] = info
+        if keep_game(info):
+            filtered_games[game_id] = info
 
     save_games(filtered_games, output_path)
     print(f"Przefiltrowano gry. Zapisano {len(filtered_games)} rekordów do {output_path}")
     print(f"Liczba gier zapisanych do pliku: {len(filtered_games)}")
 
+def container_end(buf, pos):
+    """
+    Koniec obiektu lub tablicy JSON zaczynającej się na pozycji pos, bez
+    dekodowania - liczone są tylko nawiasy poza napisami; None, gdy bufor
+    urywa się wcześniej. Składnię sprawdza dopiero json.loads.
+    """
+    depth = 0
+    while True:
+        match = _TO_BRACKET.match(buf, pos)
+        bracket = match.group(1)
+        if bracket in ('"', ""):
+            return None
+        pos = match.end()
+        depth += 1 if bracket in "{[" else -1
+        if depth == 0:
+            return pos
+
+def iter_json_object(f, chunk_size=1 << 20, raw=False):
+    """
+    Zwraca kolejne pary (klucz, wartość) z obiektu JSON najwyższego poziomu,
+    czytając plik porcjami - w pamięci jest tylko bieżący rekord i bufor.
+    Przy raw=True obiekty i tablice są zwracane jako tekst JSON do
+    zdekodowania później (np. w procesach roboczych).
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    def expect(char):
+        nonlocal pos
+        skip_whitespace()
+        if pos >= len(buf) or buf[pos] != char:
+            raise ValueError(f"Oczekiwano '{char}' w strumieniu JSON")
+        pos += 1
+
+    def raw_value():
+        nonlocal pos
+        skip_whitespace()
+        if pos >= len(buf) or buf[pos] not in "{[":
+            return json.dumps(decode_value(), ensure_ascii=False)
+        while True:
+            end = container_end(buf, pos)
+            if end is not None:
+                text = buf[pos:end]
+                pos = end
+                return text
+            if eof:
+                raise ValueError("Niedokończona wartość w strumieniu JSON")
+            fill()
+
+    def decode_value():
+        nonlocal pos
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                if end < len(buf) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+
+    expect("{")
+    skip_whitespace()
+    if pos < len(buf) and buf[pos] == "}":
+        return
+    while True:
+        key = decode_value()
+        expect(":")
+        yield key, raw_value() if raw else decode_value()
+        skip_whitespace()
+        if pos < len(buf) and buf[pos] == ",":
+            pos += 1
+            continue
+        expect("}")
+        return
+
+def format_entry(key, value):
+    """
+    Pojedynczy rekord w formacie identycznym z json.dump(..., indent=2) całego słownika.
+    """
+    body = json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+    return f"  {json.dumps(key, ensure_ascii=False)}: {body}"
+
+def write_entry(out, first, entry_text):
+    out.write(("\n" if first else ",\n") + entry_text)
+
+def close_object(out, entry_count):
+    out.write("\n}" if entry_count else "}")
+
+def fix_games_streaming(input_path, output_path, chunk_size=1 << 20, report_every=10000):
+    read_count = 0
+    kept_count = 0
+    start = time.perf_counter()
+    with open(input_path, "r", encoding="utf-8") as src, open(output_path, "w", encoding="utf-8") as out:
+        out.write("{")
+        for game_id, info in iter_json_object(src, chunk_size):
+            read_count += 1
+            if keep_game(info):
+                write_entry(out, kept_count == 0, format_entry(game_id, info))
+                kept_count += 1
+            if report_every and read_count % report_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"Przetworzono {read_count} rekordów ({read_count / elapsed:.0f} rek./s)")
+        close_object(out, kept_count)
+    elapsed = time.perf_counter() - start
+    print(f"Przefiltrowano gry strumieniowo. Zapisano {kept_count} z {read_count} rekordów do {output_path}")
+    print(f"Przepustowość: {read_count / max(elapsed, 1e-9):.0f} rekordów/s ({elapsed:.2f} s)")
+    return read_count, kept_count
+
 if __name__ == "__main__":
-    fix_games("data/games.json", "data/games_fixed.json")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Filtrowanie games.json (cena, niedozwolone frazy).")
+    parser.add_argument("input", nargs="?", default="data/games.json")
+    parser.add_argument("output", nargs="?", default="data/games_fixed.json")
+    parser.add_argument("--stream", action="store_true", help="tryb strumieniowy o ograniczonym zużyciu pamięci")
+    args = parser.parse_args()
+    if args.stream:
+        fix_games_streaming(args.input, args.output)
+    else:
+        fix_games(args.input, args.output)
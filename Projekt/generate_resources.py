@@ -5,6 +5,19 @@ def load_games(json_path):
         data = json.load(f)
     return data
 
+def add_game_terms(info, unique_genres, unique_languages, unique_audio_languages, unique_tags):
+    for g in info.get("genres", []):
+        unique_genres.add(g)
+
+    for t in info.get("tags", []):
+        unique_tags.add(t)
+
+    for audio_lang in info.get("full_audio_languages", []):
+        unique_audio_languages.add(audio_lang)
+
+    for lang in info.get("supported_languages", []):
+        unique_languages.add(lang)
+
 def gather_unique_data(games_data):
     """
     Zwraca krotkę (set_genres, set_languages) z unikalnymi gatunkami i językami.
@@ -15,40 +28,58 @@ def gather_unique_data(games_data):
     unique_tags = set()
 
     for game_id, info in games_data.items():
-        for g in info.get("genres", []):
-            unique_genres.add(g)
-            
-        for t in info.get("tags", []):
-            unique_tags.add(t)
-            
-        for audio_lang in info.get("full_audio_languages", []):
-            unique_audio_languages.add(audio_lang)
-
-        for lang in info.get("supported_languages", []):
-            unique_languages.add(lang)
+        add_game_terms(info, unique_genres, unique_languages, unique_audio_languages, unique_tags)
 
     return unique_genres, unique_languages, unique_audio_languages, unique_tags
 
-def main():
-    games_data = load_games("data/games_fixed.json")
-
-    genres_set, languages_set, audio_languages_set, tags_set = gather_unique_data(games_data)
-
-    genres_list = sorted(genres_set)
-    languages_list = sorted(languages_set)
-    audio_languages = sorted(audio_languages_set)
-    tags_list = sorted(tags_set)
+TERM_LISTS = ("genres", "languages", "audio_languages", "tags")
 
+def build_resources(genres_set, languages_set, audio_languages_set, tags_set, previous_ids=None):
+    """
+    Posortowane słowniki terminów oraz term_ids - jawne numery terminów
+    w każdym słowniku. Terminy z previous_ids zachowują swoje numery, a nowe
+    dostają kolejne wolne, więc numery nie przesuwają się po dopisaniu terminu.
+    """
     resources = {
-        "genres": genres_list,
-        "languages": languages_list,
-        "audio_languages":  audio_languages,
-        "tags": tags_list
+        "genres": sorted(genres_set),
+        "languages": sorted(languages_set),
+        "audio_languages": sorted(audio_languages_set),
+        "tags": sorted(tags_set)
     }
+    previous_ids = previous_ids or {}
+    ids = {}
+    for field in TERM_LISTS:
+        known = previous_ids.get(field, {})
+        field_ids = {term: known[term] for term in resources[field] if term in known}
+        next_id = max(known.values(), default=-1) + 1
+        for term in resources[field]:
+            if term not in field_ids:
+                field_ids[term] = next_id
+                next_id += 1
+        ids[field] = field_ids
+    resources["term_ids"] = ids
+    return resources
 
-    with open("data/resources.json", "w", encoding="utf-8") as f:
+def term_ids(resources):
+    """
+    Numery terminów z resources; starsze pliki bez term_ids numerują
+    terminy pozycją na liście.
+    """
+    if "term_ids" in resources:
+        return resources["term_ids"]
+    return {field: {term: i for i, term in enumerate(resources[field])} for field in TERM_LISTS}
+
+def save_resources(resources, path):
+    with open(path, "w", encoding="utf-8") as f:
         json.dump(resources, f, ensure_ascii=False, indent=2)
 
+def main():
+    games_data = load_games("data/games_fixed.json")
+
+    genres_set, languages_set, audio_languages_set, tags_set = gather_unique_data(games_data)
+
+    save_resources(build_resources(genres_set, languages_set, audio_languages_set, tags_set), "data/resources.json")
+
     print("Zapisano plik resources.json")
 
 if __name__ == "__main__":
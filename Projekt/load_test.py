@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from benchmark import BENCH_PREFERENCES
+from service import percentile
+
+METHODS = ["SAW", "TOPSIS", "WPM", "VIKOR"]
+
+async def post_json(reader, writer, host, path, payload):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write((f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  "Content-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+async def get_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    return json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+def random_preferences(rnd):
+    preferences = dict(BENCH_PREFERENCES)
+    for key in ("weight_positive_ratio", "weight_audio_lang", "weight_owners", "weight_med_time", "weight_tags"):
+        preferences[key] = rnd.randint(0, 10) / 10.0
+    preferences["weight_price"] = -rnd.randint(0, 10) / 10.0
+    return preferences
+
+async def client(host, port, queue, latencies, failures, seed):
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                method = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            payload = {"method": method, "preferences": random_preferences(rnd), "top_n": 10}
+            start = time.perf_counter()
+            status, _ = await post_json(reader, writer, host, "/recommend", payload)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+async def run_load(host, port, requests, concurrency, methods, seed):
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(methods[i % len(methods)])
+    latencies = []
+    failures = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, queue, latencies, failures, seed + c) for c in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    ordered = sorted(latencies)
+    print(f"Żądania: {len(latencies)}  błędy: {len(failures)}  współbieżność: {concurrency}")
+    print(f"Przepustowość: {len(latencies) / max(elapsed, 1e-9):.1f} żądań/s ({elapsed:.2f} s)")
+    print(f"Opóźnienie [ms]  p50: {percentile(ordered, 50):.2f}  p95: {percentile(ordered, 95):.2f}"
+          f"  p99: {percentile(ordered, 99):.2f}  max: {ordered[-1] if ordered else 0.0:.2f}")
+    print("Metryki serwera:")
+    print(json.dumps(await get_json(host, port, "/metrics"), indent=2, ensure_ascii=False))
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokalny test obciążeniowy serwisu rekomendacji.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--method", choices=METHODS, help="tylko jedna metoda (domyślnie wszystkie na zmianę)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    methods = [args.method] if args.method else METHODS
+    asyncio.run(run_load(args.host, args.port, args.requests, args.concurrency, methods, args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from collections import defaultdict
+import numpy as np
+
+class NameIndex:
+    """
+    Indeks nazw gier do wyszukiwania podciągów. Wyniki są zwracane
+    strumieniowo w kolejności trafności:
+    0 - nazwa zaczyna się od zapytania (dokładne trafienie jest najkrótsze),
+    1 - od zapytania zaczyna się kolejne słowo nazwy,
+    2 - zapytanie występuje w środku słowa.
+    W obrębie klasy krótsze nazwy są wyżej, remisy rozstrzyga numer wiersza.
+    Wiersze można dopisywać (add) i oznaczać jako usunięte (remove).
+    Klasy 0 i 1 pochodzą z list prefiksów (do 3 znaków) posortowanych już
+    według trafności, klasa 2 z przecięcia list bi- i trigramów.
+    """
+
+    def __init__(self, names):
+        self.lower = [name.lower() for name in names]
+        self.lengths = np.array([len(s) for s in self.lower], dtype=np.int64)
+        self.removed = set()
+        self.by_length = self._by_relevance(np.arange(len(self.lower), dtype=np.int64))
+        name_prefixes, word_prefixes, grams = self._collect_keys(range(len(self.lower)))
+        self.name_prefixes = {k: self._by_relevance(np.array(v, dtype=np.int64)) for k, v in name_prefixes.items()}
+        self.word_prefixes = {k: self._by_relevance(np.array(v, dtype=np.int64)) for k, v in word_prefixes.items()}
+        self.grams = {k: np.array(v, dtype=np.int64) for k, v in grams.items()}
+
+    def _collect_keys(self, rows):
+        name_prefixes = defaultdict(list)
+        word_prefixes = defaultdict(list)
+        grams = defaultdict(list)
+        for r in rows:
+            s = self.lower[r]
+            words = s.split(" ")
+            for k in range(1, min(3, len(s)) + 1):
+                name_prefixes[s[:k]].append(r)
+            for p in {w[:k] for w in words[1:] for k in range(1, min(3, len(w)) + 1)}:
+                word_prefixes[p].append(r)
+            for g in {s[i:i + n] for n in (2, 3) for i in range(len(s) - n + 1)}:
+                grams[g].append(r)
+        return name_prefixes, word_prefixes, grams
+
+    def _relevance_key(self, rows):
+        return self.lengths[rows] * (1 << 32) + rows
+
+    def _by_relevance(self, rows):
+        return rows[np.argsort(self._relevance_key(rows))]
+
+    def _insert_sorted(self, existing, rows):
+        rows = self._by_relevance(np.array(rows, dtype=np.int64))
+        if existing is None:
+            return rows
+        return np.insert(existing, np.searchsorted(self._relevance_key(existing), self._relevance_key(rows)), rows)
+
+    def copy(self):
+        """
+        Kopia, którą można zmieniać przez add i remove bez zmiany oryginału;
+        tablice wierszy nie są kopiowane, bo add zawsze tworzy nowe.
+        """
+        clone = NameIndex.__new__(NameIndex)
+        clone.lower = list(self.lower)
+        clone.lengths = self.lengths
+        clone.removed = set(self.removed)
+        clone.by_length = self.by_length
+        clone.name_prefixes = dict(self.name_prefixes)
+        clone.word_prefixes = dict(self.word_prefixes)
+        clone.grams = dict(self.grams)
+        return clone
+
+    def add(self, names):
+        """
+        Dopisuje nazwy jako kolejne wiersze; listy prefiksów zachowują
+        kolejność trafności, a listy n-gramów rosnące numery wierszy.
+        """
+        start = len(self.lower)
+        self.lower.extend(name.lower() for name in names)
+        self.lengths = np.concatenate((self.lengths, [len(s) for s in self.lower[start:]])).astype(np.int64)
+        new_rows = range(start, len(self.lower))
+        self.by_length = self._insert_sorted(self.by_length, new_rows)
+        name_prefixes, word_prefixes, grams = self._collect_keys(new_rows)
+        for k, v in name_prefixes.items():
+            self.name_prefixes[k] = self._insert_sorted(self.name_prefixes.get(k), v)
+        for k, v in word_prefixes.items():
+            self.word_prefixes[k] = self._insert_sorted(self.word_prefixes.get(k), v)
+        for k, v in grams.items():
+            self.grams[k] = np.concatenate((self.grams.get(k, np.array([], dtype=np.int64)), v)).astype(np.int64)
+
+    def remove(self, rows):
+        """
+        Oznacza wiersze jako usunięte - wyszukiwanie je pomija.
+        """
+        self.removed.update(int(r) for r in rows)
+
+    def _substring_candidates(self, q):
+        if len(q) == 1:
+            return self.by_length
+        if len(q) == 2:
+            return self._by_relevance(self.grams.get(q, np.array([], dtype=np.int64)))
+        postings = sorted((self.grams.get(q[i:i + 3]) for i in range(len(q) - 2)),
+                          key=lambda p: -1 if p is None else len(p))
+        if postings[0] is None:
+            return np.array([], dtype=np.int64)
+        rows = postings[0]
+        for p in postings[1:]:
+            rows = np.intersect1d(rows, p, assume_unique=True)
+            if len(rows) == 0:
+                break
+        return self._by_relevance(rows)
+
+    def search(self, query, limit=None):
+        """
+        Generator numerów wierszy gier, których nazwa zawiera zapytanie.
+        """
+        q = query.strip().lower()
+        if not q:
+            return
+        key = q[:3]
+        seen = set()
+        for r in self.name_prefixes.get(key, ()):
+            if r not in self.removed and self.lower[r].startswith(q):
+                seen.add(r)
+                yield int(r)
+                if limit is not None and len(seen) >= limit:
+                    return
+        for r in self.word_prefixes.get(key, ()):
+            if r not in seen and r not in self.removed and (" " + q) in self.lower[r]:
+                seen.add(r)
+                yield int(r)
+                if limit is not None and len(seen) >= limit:
+                    return
+        for r in self._substring_candidates(q):
+            if r not in seen and r not in self.removed and q in self.lower[r]:
+                seen.add(r)
+                yield int(r)
+                if limit is not None and len(seen) >= limit:
+                    return
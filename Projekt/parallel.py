@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from catalog import GameCatalog
+from recommender import BENEFIT, RECOMMENDERS, relative_weights, compute_scores_saw
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import ColumnStats, topsis_closeness, wpm_scores, vikor_sr, vikor_q, top_k
+
+SCORE_DECIMALS = {"SAW": 3, "TOPSIS": 3, "WPM": 3, "VIKOR": 4}
+
+class SharedArray:
+    """
+    Tablica NumPy w pamięci współdzielonej. Do procesów roboczych trafia
+    tylko opis (nazwa, kształt, typ), a nie dane.
+    """
+
+    def __init__(self, shape, dtype, name=None):
+        dtype = np.dtype(dtype)
+        if name is None:
+            size = max(1, int(np.prod(shape)) * dtype.itemsize)
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.spec = (self.shm.name, tuple(shape), dtype.str)
+
+    @classmethod
+    def copy_of(cls, array):
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, spec):
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+def shard_stats(task):
+    """
+    Faza 1: statystyki kolumn jednej porcji kandydatów.
+    """
+    features_spec, start, stop = task
+    features = SharedArray.attach(features_spec)
+    try:
+        return ColumnStats.from_chunk(features.array[start:stop])
+    finally:
+        features.close()
+
+def shard_top(task):
+    """
+    Faza 2 dla SAW/TOPSIS/WPM: ocena porcji przy globalnych statystykach
+    i lokalne top_n (indeksy względem całej macierzy kandydatów).
+    """
+    method, features_spec, ties_spec, start, stop, preferences, stats, top_n = task
+    features = SharedArray.attach(features_spec)
+    ties = SharedArray.attach(ties_spec)
+    try:
+        shard = features.array[start:stop]
+        if method == "SAW":
+            scores = compute_scores_saw(shard, preferences)
+        elif method == "TOPSIS":
+            scores = topsis_closeness(shard, relative_weights(preferences), BENEFIT, stats)
+        else:
+            scores = wpm_scores(shard, relative_weights(preferences), BENEFIT, stats)
+        best = top_k(scores, top_n, largest=True, tie_keys=ties.array[start:stop])
+        return best + start, scores[best]
+    finally:
+        features.close()
+        ties.close()
+
+def shard_vikor_sr(task):
+    """
+    Faza 2 dla VIKOR: S i R porcji zapisane do pamięci współdzielonej;
+    zwracane są tylko ich lokalne minima i maksima.
+    """
+    features_spec, sr_spec, start, stop, preferences, stats = task
+    features = SharedArray.attach(features_spec)
+    sr = SharedArray.attach(sr_spec)
+    try:
+        S, R = vikor_sr(features.array[start:stop], relative_weights(preferences), BENEFIT, stats)
+        sr.array[0, start:stop] = S
+        sr.array[1, start:stop] = R
+        return S.min(), S.max(), R.min(), R.max()
+    finally:
+        features.close()
+        sr.close()
+
+def shard_vikor_top(task):
+    """
+    Faza 3 dla VIKOR: Q porcji przy globalnych zakresach S i R, lokalne top_n.
+    """
+    sr_spec, ties_spec, start, stop, s_range, r_range, top_n = task
+    sr = SharedArray.attach(sr_spec)
+    ties = SharedArray.attach(ties_spec)
+    try:
+        Q = vikor_q(sr.array[0, start:stop], sr.array[1, start:stop], 0.5, s_range, r_range)
+        best = top_k(Q, top_n, largest=False, tie_keys=ties.array[start:stop])
+        return best + start, Q[best]
+    finally:
+        sr.close()
+        ties.close()
+
+class ShardedScorer:
+    """
+    Ocena kandydatów w puli procesów. Macierz kryteriów i klucze remisów są
+    kopiowane raz do pamięci współdzielonej i dzielone na porcje (shardy).
+    Normalizacja wymaga danych globalnych, więc obliczenia idą fazami:
+    1) ColumnStats każdej porcji, scalane w procesie głównym,
+    2) oceny porcji przy globalnych statystykach i lokalne top_n
+       (VIKOR: S i R oraz ich zakresy),
+    3) tylko VIKOR: Q przy globalnych zakresach S i R, lokalne top_n.
+    Lokalne listy top_n są na końcu scalane jednym top_k.
+    """
+
+    def __init__(self, workers=None, shards_per_worker=1):
+        self.workers = workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.pool = Pool(self.workers) if self.workers > 1 else None
+
+    def close(self):
+        if self.pool:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def map(self, func, tasks):
+        return self.pool.map(func, tasks) if self.pool else list(map(func, tasks))
+
+    def shard_bounds(self, n):
+        count = max(1, min(n, self.workers * self.shards_per_worker))
+        edges = np.linspace(0, n, count + 1).astype(int)
+        return list(zip(edges[:-1], edges[1:]))
+
+    def recommend(self, catalog, method, preferences, top_n=10, played_game_ids=frozenset()):
+        rows = catalog.candidate_rows(preferences, played_game_ids)
+        if len(rows) == 0:
+            return []
+        features = SharedArray.copy_of(catalog.feature_matrix(rows, preferences))
+        ties = SharedArray.copy_of(np.asarray(catalog.id_rank[rows]))
+        sr = None
+        try:
+            bounds = self.shard_bounds(len(rows))
+            stats = ColumnStats.empty(features.array.shape[1])
+            if method != "SAW":
+                for part in self.map(shard_stats, [(features.spec, a, b) for a, b in bounds]):
+                    stats = stats.merge(part)
+            if method == "VIKOR":
+                sr = SharedArray((2, len(rows)), np.float64)
+                ranges = self.map(shard_vikor_sr, [(features.spec, sr.spec, a, b, preferences, stats)
+                                                   for a, b in bounds])
+                s_range = (min(r[0] for r in ranges), max(r[1] for r in ranges))
+                r_range = (min(r[2] for r in ranges), max(r[3] for r in ranges))
+                parts = self.map(shard_vikor_top, [(sr.spec, ties.spec, a, b, s_range, r_range, top_n)
+                                                   for a, b in bounds])
+                largest = False
+            else:
+                parts = self.map(shard_top, [(method, features.spec, ties.spec, a, b, preferences, stats, top_n)
+                                             for a, b in bounds])
+                largest = True
+            index = np.concatenate([p[0] for p in parts])
+            scores = np.concatenate([p[1] for p in parts])
+            best = top_k(scores, top_n, largest=largest, tie_keys=ties.array[index])
+            results = []
+            for i in best:
+                rec = catalog.result_row(rows[index[i]], round(float(scores[i]), SCORE_DECIMALS[method]))
+                if method == "SAW":
+                    rec["required_age"] = catalog.details(rec["id"]).get("required_age", 0)
+                results.append(rec)
+            return results
+        finally:
+            features.unlink()
+            ties.unlink()
+            if sr is not None:
+                sr.unlink()
+
+def main():
+    from benchmark import BENCH_PREFERENCES, synthesize_games
+    parser = argparse.ArgumentParser(description="Skalowanie oceny na wiele rdzeni (shardy w pamięci współdzielonej).")
+    parser.add_argument("--size", type=int, default=200000, help="liczba syntetycznych gier")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    with open("data/resources.json", "r", encoding="utf-8") as f:
+        resources = json.load(f)
+    catalog = GameCatalog.from_games(synthesize_games(args.size, resources, args.seed))
+    preferences = dict(BENCH_PREFERENCES, max_price=None, required_platforms=[])
+    print(f"Gry: {len(catalog)}, rdzenie w systemie: {os.cpu_count()}")
+    reference = {method: [r["id"] for r in RECOMMENDERS[method](catalog, preferences, args.top)]
+                 for method in RECOMMENDERS}
+    baseline = {}
+    for workers in args.workers:
+        with ShardedScorer(workers) as scorer:
+            for method in RECOMMENDERS:
+                times = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    result = scorer.recommend(catalog, method, preferences, args.top)
+                    times.append(time.perf_counter() - start)
+                elapsed = min(times)
+                baseline.setdefault(method, elapsed)
+                same = [r["id"] for r in result] == reference[method]
+                print(f"{method:7s} procesy: {workers:2d}  czas: {elapsed:8.4f} s  "
+                      f"przyspieszenie: {baseline[method] / elapsed:5.2f}x  ranking jak w recommender: {same}")
+
+if __name__ == "__main__":
+    main()
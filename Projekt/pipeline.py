@@ -0,0 +1,100 @@
+import argparse
+import json
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from fix_games import iter_json_object, keep_game, format_entry, write_entry, close_object
+from generate_resources import add_game_terms, build_resources, term_ids, save_resources
+
+def process_batch(batch):
+    """
+    Filtruje porcję rekordów i zbiera ich słowniki; zwraca gotowe fragmenty
+    wyjściowego JSON-a, żeby proces główny tylko je dopisywał.
+    """
+    entries = []
+    vocab = (set(), set(), set(), set())
+    for game_id, info in batch:
+        if keep_game(info):
+            entries.append(format_entry(game_id, info))
+            add_game_terms(info, *vocab)
+    return len(batch), entries, vocab
+
+def process_raw_batch(batch):
+    """
+    process_batch dla rekordów w postaci tekstu JSON - dekodowanie odbywa się
+    w procesie roboczym, a nie w głównym.
+    """
+    return process_batch([(game_id, json.loads(text)) for game_id, text in batch])
+
+def iter_batches(records, batch_size):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def bounded_imap(pool, func, items, window):
+    """
+    Jak pool.imap, ale w toku jest najwyżej window zadań - kolejna porcja
+    jest czytana dopiero po odebraniu najstarszego wyniku, więc szybszy
+    odczyt nie gromadzi całego pliku w kolejce puli.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(func, (item,)))
+    while pending:
+        yield pending.popleft().get()
+
+def run_pipeline(input_path, games_output, resources_output, workers=0, batch_size=500, chunk_size=1 << 20):
+    """
+    Jeden odczyt surowego games.json: filtr cen i fraz, zapis games_fixed
+    oraz resources.json z posortowanymi słownikami gatunków, języków i tagów
+    i ich numerami (term_ids). Z pulą procesów w toku jest najwyżej
+    2 * workers porcji, a rekordy dekodują procesy robocze.
+    """
+    start = time.perf_counter()
+    read_count = 0
+    kept_count = 0
+    vocab = (set(), set(), set(), set())
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        with open(input_path, "r", encoding="utf-8") as src, open(games_output, "w", encoding="utf-8") as out:
+            out.write("{")
+            batches = iter_batches(iter_json_object(src, chunk_size, raw=pool is not None), batch_size)
+            if pool:
+                results = bounded_imap(pool, process_raw_batch, batches, 2 * workers)
+            else:
+                results = map(process_batch, batches)
+            for batch_len, entries, batch_vocab in results:
+                read_count += batch_len
+                for entry_text in entries:
+                    write_entry(out, kept_count == 0, entry_text)
+                    kept_count += 1
+                for target, found in zip(vocab, batch_vocab):
+                    target.update(found)
+            close_object(out, kept_count)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    resources = build_resources(*vocab)
+    save_resources(resources, resources_output)
+    elapsed = time.perf_counter() - start
+    print(f"Zapisano {kept_count} z {read_count} rekordów do {games_output}")
+    print("Słowniki: " + ", ".join(f"{field}: {len(ids)}" for field, ids in term_ids(resources).items()))
+    print(f"Przepustowość: {read_count / max(elapsed, 1e-9):.0f} rekordów/s ({elapsed:.2f} s)")
+    return resources
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Filtrowanie gier i generowanie resources.json w jednym przebiegu.")
+    parser.add_argument("input", nargs="?", default="data/games.json")
+    parser.add_argument("--games-output", default="data/games_fixed.json")
+    parser.add_argument("--resources-output", default="data/resources.json")
+    parser.add_argument("--workers", type=int, default=0, help="liczba procesów (0 lub 1 - bez puli)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    run_pipeline(args.input, args.games_output, args.resources_output, args.workers, args.batch_size)
@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+
+class StageTimer:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+class Profiler:
+    """
+    Czasy etapów i liczniki jednego lub kilku obliczeń rankingu.
+    Etapy mierzy się blokiem `with profiler.stage("ocena"):`, liczniki
+    (np. liczba kandydatów po filtrach) metodą count.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.totals = {}
+        self.calls = {}
+        self.counters = {}
+
+    def stage(self, name):
+        return StageTimer(self, name)
+
+    def record(self, name, start, elapsed):
+        self.events.append((name, start - self.origin, elapsed, threading.get_ident()))
+        self.totals[name] = self.totals.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        return {
+            "stages": {name: {"total_ms": round(total * 1000, 3), "calls": self.calls[name]}
+                       for name, total in self.totals.items()},
+            "counters": dict(self.counters),
+        }
+
+    def trace(self):
+        """
+        Zdarzenia w formacie Trace Event (chrome://tracing, Perfetto) plus podsumowanie.
+        """
+        events = [{"name": name, "ph": "X", "ts": round(start * 1e6, 1), "dur": round(elapsed * 1e6, 1),
+                   "pid": 0, "tid": tid} for name, start, elapsed, tid in self.events]
+        return {"traceEvents": events, "summary": self.summary()}
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, ensure_ascii=False, indent=2)
+
+    def format(self):
+        lines = [f"{name:14s} {total * 1000:10.3f} ms  x{self.calls[name]}"
+                 for name, total in self.totals.items()]
+        lines += [f"{name:14s} {value:10d}" for name, value in self.counters.items()]
+        return "\n".join(lines)
+
+class NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class NullProfiler:
+    """
+    Profiler wyłączony: stage zwraca ten sam pusty kontekst, count nic nie robi.
+    """
+
+    enabled = False
+
+    def __init__(self):
+        self.null_stage = NullStage()
+
+    def stage(self, name):
+        return self.null_stage
+
+    def count(self, name, value=1):
+        pass
+
+NULL_PROFILER = NullProfiler()
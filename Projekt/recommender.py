@@ -0,0 +1,125 @@
+import os
+import sys
+import numpy as np
+from profiling import NULL_PROFILER
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from mcdm_kernels import topsis_closeness, wpm_scores, vikor_scores, top_k
+
+COST_BENEFIT = [False, True, False, False, False, False]
+BENEFIT = np.logical_not(COST_BENEFIT)
+
+class RecommendationCancelled(Exception):
+    """
+    Zgłaszany przez callback postępu, gdy wynik obliczeń nie jest już potrzebny.
+    """
+
+def relative_weights(preferences):
+    w_pos = preferences.get("weight_positive_ratio", 0.0)
+    w_price = abs(preferences.get("weight_price", 0.0))
+    w_audio = preferences.get("weight_audio_lang", 0.0)
+    w_owners = preferences.get("weight_owners", 0.0)
+    w_med = preferences.get("weight_med_time", 0.0)
+    w_tags = preferences.get("weight_tags", 0.0)
+    sum_w = w_pos + w_price + w_audio + w_owners + w_med + w_tags
+    if sum_w < 1e-9:
+        sum_w = 1.0
+    return [
+        w_pos / sum_w,
+        w_price / sum_w,
+        w_audio / sum_w,
+        w_owners / sum_w,
+        w_med / sum_w,
+        w_tags / sum_w
+    ]
+
+def compute_scores_saw(features, preferences):
+    w_pos = preferences.get("weight_positive_ratio", 0.0)
+    w_price = preferences.get("weight_price", 0.0)
+    w_audio = preferences.get("weight_audio_lang", 0.0)
+    w_owners = preferences.get("weight_owners", 0.0)
+    w_med = preferences.get("weight_med_time", 0.0)
+    w_tags = preferences.get("weight_tags", 0.0)
+    w_price_adj = 0.2 * w_price
+    score = w_pos * features[:, 0]
+    score += w_price_adj * features[:, 1]
+    score += w_audio * features[:, 2]
+    score += w_owners * features[:, 3]
+    score += w_med * features[:, 4]
+    score += w_tags * features[:, 5]
+    return score
+
+def report_progress(progress, stage, fraction):
+    if progress is not None:
+        progress(stage, fraction)
+
+def recommend_games_saw(catalog, preferences, top_n=10, played_game_ids=frozenset(), progress=None,
+                        profiler=NULL_PROFILER):
+    rows, features, stats = catalog.candidate_features(preferences, played_game_ids, profiler, progress)
+    report_progress(progress, "kryteria", 0.5)
+    if len(rows) == 0:
+        return []
+    with profiler.stage("ocena"):
+        scores = compute_scores_saw(features, preferences)
+    report_progress(progress, "ocena", 0.75)
+    with profiler.stage("ranking"):
+        best = top_k(scores, top_n, largest=True, tie_keys=catalog.id_rank[rows])
+        results = []
+        for i in best:
+            rec = catalog.result_row(rows[i], round(float(scores[i]), 3))
+            rec["required_age"] = catalog.details(rec["id"]).get("required_age", 0)
+            results.append(rec)
+    report_progress(progress, "ranking", 1.0)
+    return results
+
+def recommend_games_topsis(catalog, preferences, top_n=10, played_game_ids=frozenset(), progress=None,
+                           profiler=NULL_PROFILER):
+    rows, features, stats = catalog.candidate_features(preferences, played_game_ids, profiler, progress)
+    report_progress(progress, "kryteria", 0.5)
+    if len(rows) == 0:
+        return []
+    with profiler.stage("ocena"):
+        closeness = topsis_closeness(features, relative_weights(preferences), BENEFIT, stats)
+    report_progress(progress, "ocena", 0.75)
+    with profiler.stage("ranking"):
+        best = top_k(closeness, top_n, largest=True, tie_keys=catalog.id_rank[rows])
+        results = [catalog.result_row(rows[i], round(float(closeness[i]), 3)) for i in best]
+    report_progress(progress, "ranking", 1.0)
+    return results
+
+def recommend_games_wpm(catalog, preferences, top_n=10, played_game_ids=frozenset(), progress=None,
+                        profiler=NULL_PROFILER):
+    rows, features, stats = catalog.candidate_features(preferences, played_game_ids, profiler, progress)
+    report_progress(progress, "kryteria", 0.5)
+    if len(rows) == 0:
+        return []
+    with profiler.stage("ocena"):
+        scores = wpm_scores(features, relative_weights(preferences), BENEFIT, stats)
+    report_progress(progress, "ocena", 0.75)
+    with profiler.stage("ranking"):
+        best = top_k(scores, top_n, largest=True, tie_keys=catalog.id_rank[rows])
+        results = [catalog.result_row(rows[i], round(float(scores[i]), 3)) for i in best]
+    report_progress(progress, "ranking", 1.0)
+    return results
+
+def recommend_games_vikor(catalog, preferences, top_n=10, played_game_ids=frozenset(), progress=None,
+                          profiler=NULL_PROFILER):
+    rows, features, stats = catalog.candidate_features(preferences, played_game_ids, profiler, progress)
+    report_progress(progress, "kryteria", 0.5)
+    if len(rows) == 0:
+        return []
+    with profiler.stage("ocena"):
+        Q, _, _ = vikor_scores(features, relative_weights(preferences), BENEFIT, stats=stats)
+    report_progress(progress, "ocena", 0.75)
+    with profiler.stage("ranking"):
+        best = top_k(Q, top_n, largest=False, tie_keys=catalog.id_rank[rows])
+        results = [catalog.result_row(rows[i], round(float(Q[i]), 4)) for i in best]
+    report_progress(progress, "ranking", 1.0)
+    return results
+
+RECOMMENDERS = {
+    "SAW": recommend_games_saw,
+    "TOPSIS": recommend_games_topsis,
+    "WPM": recommend_games_wpm,
+    "VIKOR": recommend_games_vikor,
+}
@@ -0,0 +1,247 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from snapshot import open_catalog
+from catalog import PLATFORMS
+from recommender import RECOMMENDERS
+
+MAX_BODY_SIZE = 1 << 20
+LATENCY_WINDOW = 10000
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+NUMBER_FIELDS = ("min_total_reviews", "min_positive_ratio", "weight_positive_ratio", "weight_price",
+                 "weight_audio_lang", "weight_owners", "weight_med_time", "weight_tags")
+TEXT_FIELDS = ("mandatory_sub_lang", "preferred_audio_lang")
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class LatencyMetrics:
+    """
+    Liczniki i czasy odpowiedzi per metoda; percentyle liczone z okna
+    ostatnich LATENCY_WINDOW żądań.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self.started = time.time()
+        self.counts = {}
+        self.errors = {}
+        self.samples = {}
+
+    def record(self, key, elapsed_ms, ok=True):
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if not ok:
+            self.errors[key] = self.errors.get(key, 0) + 1
+        self.samples.setdefault(key, deque(maxlen=self.window)).append(elapsed_ms)
+
+    def snapshot(self):
+        result = {"uptime_s": round(time.time() - self.started, 1), "endpoints": {}}
+        for key, samples in self.samples.items():
+            ordered = sorted(samples)
+            result["endpoints"][key] = {
+                "count": self.counts[key],
+                "errors": self.errors.get(key, 0),
+                "mean_ms": round(sum(ordered) / len(ordered), 3),
+                "p50_ms": round(percentile(ordered, 50), 3),
+                "p95_ms": round(percentile(ordered, 95), 3),
+                "p99_ms": round(percentile(ordered, 99), 3),
+                "max_ms": round(ordered[-1], 3),
+            }
+        return result
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+def check_preferences(preferences):
+    """
+    Sprawdza typy pól preferencji przed obliczeniami; błąd klienta to
+    HttpError(400), a nie wyjątek w trakcie liczenia rankingu.
+    """
+    if not isinstance(preferences, dict):
+        raise HttpError(400, "Pole preferences musi być obiektem")
+    for field in NUMBER_FIELDS:
+        if field in preferences and not is_number(preferences[field]):
+            raise HttpError(400, f"Pole {field} musi być liczbą")
+    max_price = preferences.get("max_price")
+    if max_price is not None and not is_number(max_price):
+        raise HttpError(400, "Pole max_price musi być liczbą albo null")
+    for field in TEXT_FIELDS:
+        if not isinstance(preferences.get(field, ""), str):
+            raise HttpError(400, f"Pole {field} musi być tekstem")
+    tags = preferences.get("preferred_tags", [])
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise HttpError(400, "Pole preferred_tags musi być listą tekstów")
+    platforms = preferences.get("required_platforms", [])
+    if not isinstance(platforms, list) or not all(
+            isinstance(platform, str) and platform.lower() in PLATFORMS for platform in platforms):
+        raise HttpError(400, f"Pole required_platforms musi być listą spośród: {', '.join(PLATFORMS)}")
+
+def percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise HttpError(400, "Niepoprawna linia żądania")
+    method, path, version = parts
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HttpError(400, "Niepoprawny nagłówek Content-Length")
+    if length < 0:
+        raise HttpError(400, "Niepoprawny nagłówek Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, "Zbyt duże żądanie")
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, path.split("?", 1)[0], body, keep_alive
+
+def write_response(writer, status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+
+class RecommendationService:
+    """
+    Serwer HTTP/JSON na asyncio. Katalog jest wczytany raz, a obliczenia
+    rankingów idą do puli wątków, żeby pętla zdarzeń obsługiwała kolejne
+    połączenia. Wątki (a nie procesy) współdzielą katalog i jego pamięć
+    podręczną bez kopiowania.
+
+    POST /recommend  {"method": "TOPSIS", "preferences": {...}, "top_n": 10, "played_game_ids": []}
+    GET  /metrics    liczniki i percentyle czasu odpowiedzi
+    GET  /health
+    """
+
+    def __init__(self, catalog, workers=4):
+        self.catalog = catalog
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.metrics = LatencyMetrics()
+
+    def recommend(self, payload):
+        method = payload.get("method", "SAW")
+        recommender = RECOMMENDERS.get(method)
+        if recommender is None:
+            raise HttpError(400, f"Nieznana metoda: {method}")
+        preferences = payload.get("preferences", {})
+        check_preferences(preferences)
+        try:
+            top_n = int(payload.get("top_n", 10))
+        except (TypeError, ValueError):
+            raise HttpError(400, "Pole top_n musi być liczbą całkowitą")
+        if top_n <= 0:
+            raise HttpError(400, "Pole top_n musi być dodatnie")
+        played_game_ids = payload.get("played_game_ids", [])
+        if not isinstance(played_game_ids, list) or not all(
+                isinstance(game_id, str) or (isinstance(game_id, int) and not isinstance(game_id, bool))
+                for game_id in played_game_ids):
+            raise HttpError(400, "Pole played_game_ids musi być listą identyfikatorów")
+        # identyfikatory w katalogu są tekstami (klucze games_fixed.json)
+        played = frozenset(str(game_id) for game_id in played_game_ids)
+        return recommender(self.catalog, preferences, top_n=top_n, played_game_ids=played)
+
+    async def dispatch(self, method, path, body):
+        if path == "/health":
+            return {"status": "ok", "games": len(self.catalog)}, "health"
+        if path == "/metrics":
+            return self.metrics.snapshot(), "metrics"
+        if path != "/recommend":
+            raise HttpError(404, f"Nieznana ścieżka: {path}")
+        if method != "POST":
+            raise HttpError(405, "Dozwolona jest tylko metoda POST")
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "Niepoprawny JSON")
+        if not isinstance(payload, dict):
+            raise HttpError(400, "Oczekiwano obiektu JSON")
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        results = await loop.run_in_executor(self.executor, self.recommend, payload)
+        compute_ms = (time.perf_counter() - start) * 1000
+        method_name = payload.get("method", "SAW")
+        return {"method": method_name, "compute_ms": round(compute_ms, 3), "results": results}, f"recommend/{method_name}"
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as e:
+                    write_response(writer, e.status, {"error": str(e)}, False)
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                start = time.perf_counter()
+                # nieznane ścieżki pod jednym kluczem, żeby metryki nie rosły bez końca
+                key = "other"
+                try:
+                    payload, key = await self.dispatch(method, path, body)
+                    status = 200
+                except HttpError as e:
+                    payload, status = {"error": str(e)}, e.status
+                except Exception as e:
+                    payload, status = {"error": f"{type(e).__name__}: {e}"}, 500
+                self.metrics.record(key, (time.perf_counter() - start) * 1000, ok=status == 200)
+                write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serwis rekomendacji: http://{host}:{port} ({len(self.catalog)} gier)")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serwis HTTP/JSON z rekomendacjami gier.")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    catalog = open_catalog(args.data_dir)
+    if catalog is None:
+        return
+    service = RecommendationService(catalog, args.workers)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import json
+import os
+import sys
+import time
+import zipfile
+import numpy as np
+from catalog import GameCatalog, TermColumn, PLATFORMS, TERM_FIELDS, load_games
+
+SNAPSHOT_FORMAT = 2
+NUMERIC_COLUMNS = ("id_rank", "price", "filter_price", "positive", "negative", "owners", "median_playtime") + PLATFORMS
+
+class StringTable:
+    """
+    Tablica napisów UTF-8 sklejonych w jeden bufor z tablicą przesunięć;
+    napis r jest dekodowany dopiero przy odczycie.
+    """
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @staticmethod
+    def encode(strings):
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        return b"".join(encoded), offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, r):
+        return bytes(self.blob[self.offsets[r]:self.offsets[r + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        for r in range(len(self)):
+            yield self[r]
+
+def _write_strings(snapshot_dir, name, strings):
+    blob, offsets = StringTable.encode(strings)
+    with open(os.path.join(snapshot_dir, f"{name}.bin"), "wb") as f:
+        f.write(blob)
+    np.save(os.path.join(snapshot_dir, f"{name}_offsets.npy"), offsets)
+
+def _read_strings(snapshot_dir, name):
+    blob_path = os.path.join(snapshot_dir, f"{name}.bin")
+    blob = np.memmap(blob_path, dtype=np.uint8, mode="r") if os.path.getsize(blob_path) else b""
+    offsets = np.load(os.path.join(snapshot_dir, f"{name}_offsets.npy"), mmap_mode="r")
+    return StringTable(blob, offsets)
+
+def compile_snapshot(games_data, snapshot_dir):
+    """
+    Jednorazowa kompilacja games_fixed.json do katalogu z kolumnami .npy,
+    tablicami napisów i szczegółami gier w postaci zwartych rekordów JSON.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    catalog = GameCatalog.from_games(games_data)
+    for name in NUMERIC_COLUMNS:
+        column = catalog.platforms[name] if name in PLATFORMS else getattr(catalog, name)
+        np.save(os.path.join(snapshot_dir, f"{name}.npy"), column)
+    vocab = {}
+    for field in TERM_FIELDS:
+        term_column = catalog.terms[field]
+        vocab[field] = term_column.vocab
+        np.save(os.path.join(snapshot_dir, f"{field}_indptr.npy"), term_column.indptr)
+        np.save(os.path.join(snapshot_dir, f"{field}_indices.npy"), term_column.indices)
+        np.save(os.path.join(snapshot_dir, f"{field}_post_indptr.npy"), term_column.post_indptr)
+        np.save(os.path.join(snapshot_dir, f"{field}_post_rows.npy"), term_column.post_rows)
+    _write_strings(snapshot_dir, "ids", catalog.ids)
+    _write_strings(snapshot_dir, "names", catalog.names)
+    _write_strings(snapshot_dir, "details",
+                   (json.dumps(games_data[gid], ensure_ascii=False, separators=(",", ":")) for gid in catalog.ids))
+    meta = {"format": SNAPSHOT_FORMAT, "games": len(catalog), "vocab": vocab}
+    with open(os.path.join(snapshot_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return catalog
+
+def load_snapshot(snapshot_dir):
+    """
+    Otwiera snapshot bez parsowania JSON-a: kolumny są mapowane z dysku,
+    a słownik szczegółów gry powstaje dopiero przy wywołaniu details().
+    """
+    with open(os.path.join(snapshot_dir, "meta.json"), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Nieobsługiwany format snapshotu: {meta.get('format')}")
+    columns = {name: np.load(os.path.join(snapshot_dir, f"{name}.npy"), mmap_mode="r")
+               for name in NUMERIC_COLUMNS}
+    terms = {}
+    for field in TERM_FIELDS:
+        indptr = np.load(os.path.join(snapshot_dir, f"{field}_indptr.npy"), mmap_mode="r")
+        indices = np.load(os.path.join(snapshot_dir, f"{field}_indices.npy"), mmap_mode="r")
+        post_indptr = np.load(os.path.join(snapshot_dir, f"{field}_post_indptr.npy"), mmap_mode="r")
+        post_rows = np.load(os.path.join(snapshot_dir, f"{field}_post_rows.npy"), mmap_mode="r")
+        terms[field] = TermColumn(meta["vocab"][field], indptr, indices, post_indptr, post_rows)
+    details = _read_strings(snapshot_dir, "details")
+    return GameCatalog(_read_strings(snapshot_dir, "ids"), _read_strings(snapshot_dir, "names"),
+                       columns, terms, lambda r: json.loads(details[r]))
+
+def snapshot_is_fresh(snapshot_dir, games_path):
+    meta_path = os.path.join(snapshot_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, "r", encoding="utf-8") as f:
+        if json.load(f).get("format") != SNAPSHOT_FORMAT:
+            return False
+    if not os.path.exists(games_path):
+        return True
+    return os.path.getmtime(meta_path) >= os.path.getmtime(games_path)
+
+def extract_zip(zip_path, extract_to):
+    print(f"Rozpoczynam wypakowywanie pliku {zip_path}...")
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(extract_to)
+    print(f"Wypakowywanie zakończone. Pliki zostały wypakowane do folderu {extract_to}.")
+
+def open_catalog(data_dir="data"):
+    """
+    Otwiera katalog gier ze snapshotu, w razie potrzeby wypakowując
+    games_fixed.zip i kompilując snapshot. Zwraca None, gdy brak danych.
+    """
+    zip_path = os.path.join(data_dir, "games_fixed.zip")
+    json_path = os.path.join(data_dir, "games_fixed.json")
+    snapshot_dir = os.path.join(data_dir, "games_snapshot")
+    if snapshot_is_fresh(snapshot_dir, json_path):
+        return load_snapshot(snapshot_dir)
+    if not os.path.exists(json_path):
+        if os.path.exists(zip_path):
+            extract_zip(zip_path, data_dir)
+        else:
+            print(f"Plik {zip_path} nie istnieje. Sprawdź, czy znajduje się w folderze '{data_dir}'.")
+            return None
+    print(f"Kompiluję snapshot {snapshot_dir} (jednorazowo)...")
+    compile_snapshot(load_games(json_path), snapshot_dir)
+    return load_snapshot(snapshot_dir)
+
+def main():
+    games_path = sys.argv[1] if len(sys.argv) > 1 else "data/games_fixed.json"
+    snapshot_dir = sys.argv[2] if len(sys.argv) > 2 else "data/games_snapshot"
+    start = time.perf_counter()
+    catalog = compile_snapshot(load_games(games_path), snapshot_dir)
+    print(f"Zapisano snapshot {len(catalog)} gier do {snapshot_dir} w {time.perf_counter() - start:.1f} s")
+    start = time.perf_counter()
+    load_snapshot(snapshot_dir)
+    print(f"Czas otwarcia snapshotu: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
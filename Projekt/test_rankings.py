@@ -0,0 +1,44 @@
+import json
+import os
+import numpy as np
+import pytest
+from catalog import GameCatalog
+from recommender import BENEFIT, relative_weights
+from mcdm_kernels import topsis_closeness, wpm_scores, vikor_scores, top_k
+from benchmark import (BENCH_PROFILES, synthesize_games, reference_topsis, reference_wpm, reference_vikor,
+                       reference_top)
+
+RESOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "resources.json")
+TOP_N = 10
+
+KERNELS = {
+    "TOPSIS": (reference_topsis, lambda features, weights: topsis_closeness(features, weights, BENEFIT), True),
+    "WPM": (reference_wpm, lambda features, weights: wpm_scores(features, weights, BENEFIT), True),
+    "VIKOR": (reference_vikor, lambda features, weights: vikor_scores(features, weights, BENEFIT)[0], False),
+}
+
+@pytest.fixture(scope="module")
+def catalog():
+    with open(RESOURCES_PATH, "r", encoding="utf-8") as f:
+        resources = json.load(f)
+    return GameCatalog.from_games(synthesize_games(3000, resources, seed=1234))
+
+@pytest.mark.parametrize("profile", sorted(BENCH_PROFILES))
+@pytest.mark.parametrize("method", sorted(KERNELS))
+def test_vectorized_ranking_matches_loops(catalog, method, profile):
+    """
+    Jądra NumPy dają te same wyniki i ten sam ranking (identyfikatory
+    i kolejność) co pierwotne pętle Pythona.
+    """
+    preferences = BENCH_PROFILES[profile]
+    reference, vectorized, largest = KERNELS[method]
+    rows = catalog.candidate_rows(preferences)
+    assert len(rows) > TOP_N
+    features = catalog.feature_matrix(rows, preferences)
+    weights = relative_weights(preferences)
+    ref_scores = reference(features.tolist(), weights)
+    vec_scores = vectorized(features, weights)
+    np.testing.assert_allclose(vec_scores, ref_scores, rtol=1e-9, atol=1e-12)
+    ref_ids = [catalog.ids[rows[i]] for i in reference_top(ref_scores, TOP_N, largest)]
+    vec_ids = [catalog.ids[rows[i]] for i in top_k(vec_scores, TOP_N, largest=largest)]
+    assert vec_ids == ref_ids
@@ -0,0 +1,210 @@
+import numpy as np
+
+STATS_CHUNK_ROWS = 1 << 16
+
+
+class ColumnStats:
+    """
+    Statystyki kolumn macierzy decyzyjnej: liczność, minimum, maksimum,
+    suma i suma kwadratów. Statystyki rozłącznych porcji wierszy można
+    łączyć (merge), więc liczy się je porcjami - także równolegle - i używa
+    jednocześnie w TOPSIS (suma kwadratów), WPM i VIKOR (minimum, maksimum).
+    """
+
+    def __init__(self, count, minimum, maximum, total, sumsq):
+        self.count = count
+        self.minimum = minimum
+        self.maximum = maximum
+        self.total = total
+        self.sumsq = sumsq
+
+    @classmethod
+    def empty(cls, num_criteria):
+        return cls(0, np.full(num_criteria, np.inf), np.full(num_criteria, -np.inf),
+                   np.zeros(num_criteria), np.zeros(num_criteria))
+
+    @classmethod
+    def from_chunk(cls, chunk):
+        chunk = np.asarray(chunk, dtype=float)
+        if len(chunk) == 0:
+            return cls.empty(chunk.shape[1])
+        # redukcje po wierszach transpozycji są kilka razy szybsze niż po osi 0
+        # wąskiej macierzy w układzie C
+        columns = np.ascontiguousarray(chunk.T)
+        return cls(len(chunk), columns.min(axis=1), columns.max(axis=1), columns.sum(axis=1),
+                   np.einsum("ij,ij->i", columns, columns))
+
+    @classmethod
+    def from_matrix(cls, decision_matrix, chunk_rows=STATS_CHUNK_ROWS):
+        """
+        Jeden przebieg po macierzy porcjami mieszczącymi się w pamięci podręcznej
+        procesora - każda porcja jest czytana raz dla wszystkich pięciu statystyk.
+        """
+        decision_matrix = np.asarray(decision_matrix, dtype=float)
+        stats = cls.empty(decision_matrix.shape[1])
+        for start in range(0, len(decision_matrix), chunk_rows):
+            stats = stats.merge(cls.from_chunk(decision_matrix[start:start + chunk_rows]))
+        return stats
+
+    def merge(self, other):
+        if self.count == 0:
+            return other
+        if other.count == 0:
+            return self
+        return ColumnStats(self.count + other.count,
+                           np.minimum(self.minimum, other.minimum),
+                           np.maximum(self.maximum, other.maximum),
+                           self.total + other.total,
+                           self.sumsq + other.sumsq)
+
+    @property
+    def mean(self):
+        return self.total / max(self.count, 1)
+
+    @property
+    def norm(self):
+        return np.sqrt(self.sumsq)
+
+
+def topsis_distances(decision_matrix, weights, benefit, stats=None):
+    """
+    Odległości TOPSIS (d+, d-) od rozwiązania idealnego i antyidealnego.
+    benefit[c] == True oznacza kryterium maksymalizowane, False - minimalizowane.
+    Kolumny o zerowej normie są zerowane zamiast dzielenia przez zero.
+    stats (ColumnStats) pozwala pominąć przebiegi liczące normy i skrajne wartości.
+    """
+    decision_matrix = np.asarray(decision_matrix, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    weights = np.broadcast_to(np.asarray(weights, dtype=float), benefit.shape)
+    if stats is None:
+        stats = ColumnStats.from_matrix(decision_matrix)
+    col_sumsq = stats.sumsq
+    valid = col_sumsq > 1e-12
+    col_norm = np.sqrt(col_sumsq)
+    norm_matrix = np.zeros_like(decision_matrix)
+    np.divide(decision_matrix, col_norm, out=norm_matrix, where=valid)
+
+    weighted_matrix = norm_matrix * weights
+
+    # dzielenie przez dodatnią normę i mnożenie przez wagę są monotoniczne,
+    # więc skrajne wartości kolumn ważonych wynikają ze skrajnych wartości surowych
+    scaled_min = np.zeros_like(col_norm)
+    scaled_max = np.zeros_like(col_norm)
+    np.divide(stats.minimum, col_norm, out=scaled_min, where=valid)
+    np.divide(stats.maximum, col_norm, out=scaled_max, where=valid)
+    scaled_min *= weights
+    scaled_max *= weights
+    col_max = np.maximum(scaled_min, scaled_max)
+    col_min = np.minimum(scaled_min, scaled_max)
+    ideal_solution = np.where(benefit, col_max, col_min)
+    anti_ideal_solution = np.where(benefit, col_min, col_max)
+
+    distances_to_ideal = np.sqrt(np.sum((weighted_matrix - ideal_solution)**2, axis=1))
+    distances_to_anti_ideal = np.sqrt(np.sum((weighted_matrix - anti_ideal_solution)**2, axis=1))
+    return distances_to_ideal, distances_to_anti_ideal
+
+
+def topsis_closeness(decision_matrix, weights, benefit, stats=None):
+    """
+    Współczynnik bliskości d- / (d+ + d-); im większy, tym lepszy wariant.
+    """
+    d_plus, d_minus = topsis_distances(decision_matrix, weights, benefit, stats)
+    total = d_plus + d_minus
+    closeness = np.zeros_like(total)
+    np.divide(d_minus, total, out=closeness, where=total > 1e-12)
+    return closeness
+
+
+def wpm_scores(decision_matrix, weights, benefit, stats=None):
+    """
+    WPM: kryteria maksymalizowane dzielone przez maksimum kolumny,
+    minimalizowane - minimum kolumny dzielone przez wartość.
+    Wariant z choć jedną znormalizowaną wartością bliską zeru dostaje wynik 0.
+    """
+    decision_matrix = np.asarray(decision_matrix, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    if stats is None:
+        stats = ColumnStats.from_matrix(decision_matrix)
+    col_max = np.maximum(stats.maximum, 0.0)
+    col_min = stats.minimum
+
+    benefit_norm = decision_matrix / np.where(col_max > 1e-12, col_max, 1e-12)
+    cost_norm = np.zeros_like(decision_matrix)
+    np.divide(col_min, decision_matrix, out=cost_norm, where=decision_matrix > 1e-12)
+    norm_matrix = np.where(benefit, benefit_norm, cost_norm)
+
+    valid = np.all(norm_matrix >= 1e-12, axis=1)
+    log_matrix = np.log(np.where(norm_matrix >= 1e-12, norm_matrix, 1.0))
+    sum_log = np.sum(log_matrix * weights, axis=1)
+    return np.where(valid, np.exp(sum_log), 0.0)
+
+
+def vikor_sr(decision_matrix, weights, benefit, stats=None):
+    """
+    Miary VIKOR S (suma) i R (maksimum) ważonych odległości od f*.
+    Zależą od macierzy tylko przez minimum i maksimum kolumn, więc przy
+    wspólnych stats można je liczyć niezależnie na porcjach wierszy.
+    """
+    decision_matrix = np.asarray(decision_matrix, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    if stats is None:
+        stats = ColumnStats.from_matrix(decision_matrix)
+    col_max = stats.maximum
+    col_min = stats.minimum
+    f_star = np.where(benefit, col_max, col_min)
+    f_minus = np.where(benefit, col_min, col_max)
+
+    span = np.abs(f_star - f_minus)
+    span = np.where(span > 1e-12, span, 1.0)
+    local_matrix = weights * (np.abs(f_star - decision_matrix) / span)
+
+    S = np.sum(local_matrix, axis=1)
+    R = np.maximum(np.max(local_matrix, axis=1), 0.0)
+    return S, R
+
+
+def vikor_q(S, R, v=0.5, s_range=None, r_range=None):
+    """
+    Indeks Q z S i R; s_range/r_range to globalne (min, max), gdy S i R
+    pochodzą tylko z części wariantów.
+    """
+    S_star, S_minus = s_range if s_range is not None else (S.min(), S.max())
+    R_star, R_minus = r_range if r_range is not None else (R.min(), R.max())
+    FS = (S - S_star) / (S_minus - S_star) if (S_minus - S_star) > 1e-12 else np.zeros_like(S)
+    FR = (R - R_star) / (R_minus - R_star) if (R_minus - R_star) > 1e-12 else np.zeros_like(R)
+    return v * FS + (1.0 - v) * FR
+
+
+def vikor_scores(decision_matrix, weights, benefit, v=0.5, stats=None):
+    """
+    VIKOR: zwraca (Q, S, R); im mniejsze Q, tym lepszy wariant.
+    """
+    S, R = vikor_sr(decision_matrix, weights, benefit, stats)
+    return vikor_q(S, R, v), S, R
+
+
+def top_k(scores, k, largest=True, tie_keys=None):
+    """
+    Indeksy k najlepszych wyników w kolejności rankingu w czasie O(n + k log k):
+    argpartition wyznacza próg, a sortowane jest tylko k wybranych elementów.
+    Remisy rozstrzyga mniejsza wartość tie_keys (domyślnie indeks wiersza).
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    keys = -scores if largest else scores
+    tie_keys = np.arange(n) if tie_keys is None else np.asarray(tie_keys)
+    if k < n:
+        kth = np.partition(keys, k - 1)[k - 1]
+        better = np.flatnonzero(keys < kth)
+        tied = np.flatnonzero(keys == kth)
+        need = k - len(better)
+        if need < len(tied):
+            tied = tied[np.argpartition(tie_keys[tied], need - 1)[:need]]
+        selected = np.concatenate((better, tied))
+    else:
+        selected = np.arange(n)
+    order = np.lexsort((tie_keys[selected], keys[selected]))
+    return selected[order]
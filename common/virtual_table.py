@@ -0,0 +1,163 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+import numpy as np
+
+WHEEL_ROWS = 3
+SORT_LIMIT = 10000000
+
+class VirtualTable(ttk.Frame):
+    """
+    Tabela na ttk.Treeview, która tworzy tylko tyle wierszy, ile mieści się
+    w oknie. Dane są trzymane jako kolumny NumPy; przewijanie i sortowanie
+    (kliknięcie nagłówka) zmieniają jedynie wartości widocznych wierszy,
+    więc koszt odświeżenia nie zależy od liczby danych. Dopóki widok nie jest
+    posortowany, pozycja jest wprost indeksem wiersza (order to None), więc
+    np. memmap z pliku nie wymaga żadnej tablicy pomocniczej.
+    """
+
+    def __init__(self, master, columns, width=100, height=10, formatter=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.columns = list(columns)
+        self.formatter = formatter
+        self.tree = ttk.Treeview(self, columns=self.columns, show="headings", height=height)
+        for index, col in enumerate(self.columns):
+            self.tree.heading(col, text=col, command=lambda index=index: self.sort_by(index))
+            self.tree.column(col, width=width)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.data = []
+        self.count = 0
+        self.order = None
+        self.offset = 0
+        self.visible = height
+        self.sort_column = None
+        self.descending = False
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-WHEEL_ROWS if e.delta > 0 else WHEEL_ROWS))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(WHEEL_ROWS))
+
+    def __len__(self):
+        return self.count
+
+    def set_data(self, rows):
+        """
+        Dane jako macierz NumPy (wiersze x kolumny) albo lista krotek.
+        """
+        if isinstance(rows, np.ndarray) and rows.ndim == 2:
+            self.set_columns(list(rows.T))
+        else:
+            self.set_columns([np.asarray(col) for col in zip(*rows)])
+
+    def set_columns(self, columns):
+        """
+        Dane jako lista kolumn (np. kolumny DataFrame), każda z własnym typem.
+        Poprzednie sortowanie nagłówkiem jest kasowane.
+        """
+        self.data = [np.asarray(col) for col in columns]
+        self.count = len(self.data[0]) if self.data else 0
+        self.order = None
+        self.offset = 0
+        self.sort_column = None
+        self.update_headings()
+        self.refresh()
+        self.after_idle(self.on_resize)
+
+    def sort_by(self, index, descending=None):
+        """
+        Sortuje widok po kolumnie; ponowne kliknięcie odwraca kierunek.
+        Dane źródłowe zostają w niezmienionej kolejności. Permutacja (8 bajtów
+        na wiersz) i argsort całej kolumny są drogie, więc powyżej SORT_LIMIT
+        wierszy sortowanie jest odrzucane z ostrzeżeniem i zwracane jest False.
+        """
+        if index >= len(self.data):
+            return False
+        if self.count > SORT_LIMIT:
+            messagebox.showwarning("Ostrzeżenie", f"Tabela ma {self.count} wierszy; sortowanie widoku "
+                                   f"jest dostępne do {SORT_LIMIT} wierszy.")
+            return False
+        if descending is None:
+            descending = index == self.sort_column and not self.descending
+        self.order = np.argsort(self.data[index], kind="stable")
+        if descending:
+            self.order = self.order[::-1]
+        self.sort_column = index
+        self.descending = descending
+        self.update_headings()
+        self.refresh()
+        return True
+
+    def update_headings(self):
+        for index, col in enumerate(self.columns):
+            arrow = ""
+            if index == self.sort_column:
+                arrow = " ▼" if self.descending else " ▲"
+            self.tree.heading(col, text=col + arrow)
+
+    def source_index(self, position):
+        """
+        Indeks wiersza danych wyświetlanego na pozycji position (po sortowaniu).
+        """
+        if self.order is None:
+            return int(position)
+        return int(self.order[position])
+
+    def see(self, position):
+        if position < self.offset:
+            self.offset = position
+        elif position >= self.offset + self.visible:
+            self.offset = position - self.visible + 1
+        self.refresh()
+
+    def scroll(self, rows):
+        self.offset += rows
+        self.tree.selection_remove(self.tree.selection())
+        self.refresh()
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self.count)
+            self.tree.selection_remove(self.tree.selection())
+            self.refresh()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.scroll(step * self.visible if args[2] == "pages" else step)
+
+    def on_resize(self, event=None):
+        """
+        Liczbę widocznych wierszy wyznacza wysokość pierwszego wiersza (bbox),
+        więc tabela dopasowuje się do stylu i rozmiaru okna.
+        """
+        items = self.tree.get_children()
+        box = self.tree.bbox(items[0]) if items else ""
+        if not box:
+            return
+        _, top, _, row_height = box
+        visible = max(1, (self.tree.winfo_height() - top) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+
+    def refresh(self):
+        count = self.count
+        self.offset = max(0, min(self.offset, count - self.visible))
+        stop = min(count, self.offset + self.visible)
+        items = self.tree.get_children()
+        needed = stop - self.offset
+        if len(items) > needed:
+            self.tree.delete(*items[needed:])
+        for _ in range(len(items), needed):
+            self.tree.insert("", "end")
+        rows = slice(self.offset, stop) if self.order is None else self.order[self.offset:stop]
+        cells = [col[rows].tolist() for col in self.data]
+        if self.formatter is not None:
+            cells = [[self.formatter(value) for value in col] for col in cells]
+        for item, values in zip(self.tree.get_children(), zip(*cells)):
+            self.tree.item(item, values=values)
+        if count:
+            self.scrollbar.set(self.offset / count, stop / count)
+        else:
+            self.scrollbar.set(0.0, 1.0)